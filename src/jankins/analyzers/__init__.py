@@ -1,9 +1,22 @@
-"""Pluggable log analyzers for different build tools."""
+"""Pluggable log analyzers for different build tools.
 
-from .base import AnalysisResult, LogAnalyzer
-from .gradle import GradleAnalyzer
-from .maven import MavenAnalyzer
-from .npm import NpmAnalyzer
+Analyzer modules precompile their full pattern sets at import, so the
+package defers importing them (PEP 562 ``__getattr__``) until something
+actually analyzes a log; processes that never touch a log — including
+test collection — skip the compilation cost entirely.
+"""
+
+import os
+import re
+from concurrent.futures import ProcessPoolExecutor
+from typing import TYPE_CHECKING
+
+from .base import DETECT_WINDOW, AnalysisResult, LogAnalyzer
+
+if TYPE_CHECKING:
+    from .gradle import GradleAnalyzer
+    from .maven import MavenAnalyzer
+    from .npm import NpmAnalyzer
 
 __all__ = [
     "LogAnalyzer",
@@ -11,9 +24,119 @@ __all__ = [
     "MavenAnalyzer",
     "GradleAnalyzer",
     "NpmAnalyzer",
+    "analyze_many",
+    "detect_build_tool",
     "get_analyzer",
 ]
 
+_ANALYZER_MODULES = {
+    "MavenAnalyzer": "maven",
+    "GradleAnalyzer": "gradle",
+    "NpmAnalyzer": "npm",
+}
+
+
+def __getattr__(name: str):
+    """Import analyzer classes on first access (PEP 562)."""
+    module_name = _ANALYZER_MODULES.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    import importlib
+
+    return getattr(importlib.import_module(f".{module_name}", __name__), name)
+
+
+# Built on first use: analyzers are stateless, so one shared instance
+# per tool serves every call, and deferring construction keeps the
+# pattern compilation off the import path
+_ANALYZERS: dict[str, LogAnalyzer] | None = None
+_DETECT_RE: re.Pattern | None = None
+
+
+def _load_analyzers() -> dict[str, LogAnalyzer]:
+    """Build the shared analyzer instances and combined detection regex."""
+    global _ANALYZERS, _DETECT_RE
+    if _ANALYZERS is None:
+        from .base import compile_pattern
+        from .gradle import GradleAnalyzer
+        from .maven import MavenAnalyzer
+        from .npm import NpmAnalyzer
+
+        npm = NpmAnalyzer()
+        analyzers: dict[str, LogAnalyzer] = {
+            "maven": MavenAnalyzer(),
+            "gradle": GradleAnalyzer(),
+            "npm": npm,
+            "yarn": npm,  # NPM analyzer works for yarn too
+        }
+
+        # Combine every analyzer's detection patterns into one
+        # alternation: each tool's patterns become one named group, so
+        # a single scan of the log tells us which tool produced it
+        # instead of running each analyzer's pattern list separately
+        parts = []
+        for tool in ("maven", "gradle", "npm"):
+            patterns = "|".join(f"(?:{p})" for p in analyzers[tool].detection_patterns)
+            parts.append(f"(?P<{tool}>{patterns})")
+        _DETECT_RE = compile_pattern("|".join(parts), re.IGNORECASE | re.MULTILINE)
+        _ANALYZERS = analyzers
+    return _ANALYZERS
+
+
+def detect_build_tool(log_content: str) -> str | None:
+    """Detect which build tool produced a log in a single pass.
+
+    Like ``LogAnalyzer.detect``, only the first ``DETECT_WINDOW`` bytes
+    are scanned — the tool identifies itself near the top of the log.
+
+    Args:
+        log_content: Build log content
+
+    Returns:
+        Tool name ("maven", "gradle", "npm") or None if nothing matched
+    """
+    _load_analyzers()
+    assert _DETECT_RE is not None
+    match = _DETECT_RE.search(log_content[:DETECT_WINDOW])
+    return match.lastgroup if match else None
+
+
+def _analyze_one(log_content: str) -> AnalysisResult:
+    """Detect the build tool in one log and run its analyzer.
+
+    Module-level so ProcessPoolExecutor can pickle it by reference.
+    """
+    tool = detect_build_tool(log_content)
+    if tool is None:
+        return AnalysisResult(
+            build_tool="unknown",
+            detected=False,
+            summary="No supported build tool detected in log",
+        )
+    return _load_analyzers()[tool].analyze(log_content)
+
+
+def analyze_many(logs: list[str]) -> list[AnalysisResult]:
+    """Analyze several build logs, across CPUs when there are several.
+
+    Regex scanning is CPU-bound and holds the GIL, so threads don't
+    help; worker processes give a near-linear speedup when triaging
+    many failed builds at once. A single log runs inline to skip the
+    pool startup cost.
+
+    Args:
+        logs: Build log contents, one per build
+
+    Returns:
+        One AnalysisResult per log, in input order
+    """
+    if len(logs) <= 1:
+        return [_analyze_one(log) for log in logs]
+
+    workers = min(len(logs), os.cpu_count() or 1)
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        return list(executor.map(_analyze_one, logs, chunksize=4))
+
 
 def get_analyzer(build_tool: str) -> LogAnalyzer:
     """Get analyzer for a specific build tool.
@@ -27,13 +150,7 @@ def get_analyzer(build_tool: str) -> LogAnalyzer:
     Raises:
         ValueError: If build tool not supported
     """
-    analyzers = {
-        "maven": MavenAnalyzer(),
-        "gradle": GradleAnalyzer(),
-        "npm": NpmAnalyzer(),
-        "yarn": NpmAnalyzer(),  # NPM analyzer works for yarn too
-    }
-
+    analyzers = _load_analyzers()
     analyzer = analyzers.get(build_tool.lower())
     if not analyzer:
         raise ValueError(
@@ -2,9 +2,58 @@
 
 import re
 from abc import ABC, abstractmethod
+from collections.abc import Iterable
 from dataclasses import dataclass, field
 from typing import Any
 
+# RE2 matches in guaranteed linear time, which protects the analyzers
+# against pathological backtracking on multi-MB logs; it's optional and
+# the stdlib engine is the fallback
+try:
+    import re2  # type: ignore[import-not-found]
+
+    _RE2_AVAILABLE = True
+except ImportError:
+    _RE2_AVAILABLE = False
+
+
+# Conventions for the per-tool pattern tables (maven/gradle/npm):
+# patterns are module constants compiled once at import through
+# compile_pattern, so repeated analyze() calls skip sre_compile
+# entirely. Line-tagged patterns are anchored with ^[ \t]* (allowing
+# indentation) so the regex engine only tries line starts instead of
+# backtracking from every position in the log; mid-line phrases stay
+# untethered. Error/warning patterns are paired with a lowercase
+# literal guard that extract_errors checks with `in` before running
+# the regex at all.
+
+# Tool banners and command lines land in the first few KB of a log;
+# 64 KB leaves generous slack (npm error markers can trail the banner)
+# while keeping detection O(1) on multi-MB logs
+DETECT_WINDOW = 65536
+
+
+def compile_pattern(pattern: str, flags: int = 0) -> "re.Pattern[str]":
+    """Compile a pattern with RE2 when available, else stdlib re.
+
+    Falls back per-pattern when RE2 rejects a construct it doesn't
+    support, so analyzer pattern tables never have to care which
+    engine is active.
+
+    Args:
+        pattern: Regex source
+        flags: Standard re flags
+
+    Returns:
+        Compiled pattern (RE2's object implements the re.Pattern API)
+    """
+    if _RE2_AVAILABLE:
+        try:
+            return re2.compile(pattern, flags)
+        except re2.error:
+            pass
+    return re.compile(pattern, flags)
+
 
 @dataclass
 class AnalysisResult:
@@ -13,6 +62,9 @@ class AnalysisResult:
     build_tool: str
     detected: bool
     errors: list[str] = field(default_factory=list)
+    # Newline-joined lowercase errors, computed once in analyze() so
+    # callers can substring-check without lowercasing per element
+    errors_lower: str = ""
     warnings: list[str] = field(default_factory=list)
     issues: list[dict[str, Any]] = field(default_factory=list)
 
@@ -31,6 +83,9 @@ class AnalysisResult:
 class LogAnalyzer(ABC):
     """Base class for build tool log analyzers."""
 
+    # Combined detection regex, compiled once per subclass on first use
+    _detect_re: "re.Pattern[str] | None" = None
+
     @property
     @abstractmethod
     def tool_name(self) -> str:
@@ -58,31 +113,44 @@ class LogAnalyzer(ABC):
     def detect(self, log_content: str) -> bool:
         """Check if this build tool was used in the build.
 
+        Only the first ``DETECT_WINDOW`` bytes are scanned: the tool
+        identifies itself near the top of the log, so there's no need
+        to walk the rest.
+
         Args:
             log_content: Build log content
 
         Returns:
             True if tool detected, False otherwise
         """
-        for pattern in self.detection_patterns:
-            if re.search(pattern, log_content, re.IGNORECASE | re.MULTILINE):
-                return True
-        return False
+        cls = type(self)
+        if cls._detect_re is None:
+            combined = "|".join(f"(?:{p})" for p in self.detection_patterns)
+            cls._detect_re = compile_pattern(combined, re.IGNORECASE | re.MULTILINE)
+        return cls._detect_re.search(log_content[:DETECT_WINDOW]) is not None
+
+    def extract_errors(
+        self, log_content: str, patterns: Iterable[tuple[str, re.Pattern]]
+    ) -> list[str]:
+        """Extract error messages using guarded patterns.
 
-    def extract_errors(self, log_content: str, patterns: list[str]) -> list[str]:
-        """Extract error messages using patterns.
+        Each pattern carries a lowercase literal guard; the regex only
+        runs when its guard appears in the log, so clean logs pay one
+        substring scan per pattern instead of a full regex pass.
 
         Args:
             log_content: Log content
-            patterns: List of regex patterns
+            patterns: (guard, pattern) pairs with precompiled patterns
 
         Returns:
             List of extracted error messages
         """
         errors = []
-        for pattern in patterns:
-            matches = re.finditer(pattern, log_content, re.MULTILINE | re.IGNORECASE)
-            for match in matches:
+        log_lower = log_content.lower()
+        for guard, pattern in patterns:
+            if guard not in log_lower:
+                continue
+            for match in pattern.finditer(log_content):
                 error = match.group(0).strip()
                 if error and len(error) < 500:  # Reasonable length
                     errors.append(error)
@@ -97,12 +165,14 @@ class LogAnalyzer(ABC):
 
         return unique_errors[:20]  # Top 20
 
-    def extract_warnings(self, log_content: str, patterns: list[str]) -> list[str]:
-        """Extract warning messages using patterns.
+    def extract_warnings(
+        self, log_content: str, patterns: Iterable[tuple[str, re.Pattern]]
+    ) -> list[str]:
+        """Extract warning messages using guarded patterns.
 
         Args:
             log_content: Log content
-            patterns: List of regex patterns
+            patterns: (guard, pattern) pairs with precompiled patterns
 
         Returns:
             List of extracted warning messages
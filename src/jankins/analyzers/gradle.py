@@ -2,7 +2,32 @@
 
 import re
 
-from .base import AnalysisResult, LogAnalyzer
+from .base import AnalysisResult, LogAnalyzer, compile_pattern
+
+# Pattern-table conventions (compile-once, anchoring, guards) are
+# documented next to compile_pattern in base.py
+_ERROR_FLAGS = re.IGNORECASE | re.MULTILINE
+_ERROR_PATTERNS = tuple(
+    (guard, compile_pattern(p, _ERROR_FLAGS))
+    for guard, p in (
+        ("failure:", r"^[ \t]*FAILURE: .*"),
+        ("what went wrong", r"^[ \t]*\* What went wrong:.*"),
+        ("execution failed for task", r"Execution failed for task .*"),
+        ("could not resolve", r"Could not resolve .*"),
+        ("compilation failed", r"^[ \t]*> Compilation failed.*"),
+    )
+)
+_WARNING_PATTERNS = tuple(
+    (guard, compile_pattern(p, _ERROR_FLAGS))
+    for guard, p in (
+        ("warning:", r"warning: .*"),
+        ("deprecated:", r"deprecated: .*"),
+    )
+)
+_COMPILATION_RE = compile_pattern(r"(\d+) error[s]?")
+_TEST_FAILURE_RE = compile_pattern(r"(\d+) tests? completed, (\d+) failed")
+_DEP_RE = compile_pattern(r"Could not resolve ([\w\.\-:]+)")
+_TASK_FAILURE_RE = compile_pattern(r"Execution failed for task '([\w:]+)'")
 
 
 class GradleAnalyzer(LogAnalyzer):
@@ -38,37 +63,24 @@ class GradleAnalyzer(LogAnalyzer):
             return result
 
         # Extract errors
-        error_patterns = [
-            r"FAILURE: .*",
-            r"\* What went wrong:.*",
-            r"Execution failed for task .*",
-            r"Could not resolve .*",
-            r"> Compilation failed.*",
-        ]
-        result.errors = self.extract_errors(log_content, error_patterns)
+        result.errors = self.extract_errors(log_content, _ERROR_PATTERNS)
+        result.errors_lower = "\n".join(result.errors).lower()
 
         # Extract warnings
-        warning_patterns = [
-            r"warning: .*",
-            r"deprecated: .*",
-        ]
-        result.warnings = self.extract_warnings(log_content, warning_patterns)
+        result.warnings = self.extract_warnings(log_content, _WARNING_PATTERNS)
 
         # Parse compilation errors
-        compilation_pattern = r"(\d+) error[s]?"
-        compilation_matches = re.findall(compilation_pattern, log_content)
+        compilation_matches = _COMPILATION_RE.findall(log_content)
         if compilation_matches:
             result.compilation_errors = sum(int(m) for m in compilation_matches)
 
         # Parse test failures
-        test_failure_pattern = r"(\d+) tests? completed, (\d+) failed"
-        test_matches = re.findall(test_failure_pattern, log_content)
+        test_matches = _TEST_FAILURE_RE.findall(log_content)
         if test_matches:
             result.test_failures = sum(int(failed) for _, failed in test_matches)
 
         # Extract failed dependencies
-        dep_pattern = r"Could not resolve ([\w\.\-:]+)"
-        result.dependencies_failed = list(set(re.findall(dep_pattern, log_content)))
+        result.dependencies_failed = list(set(_DEP_RE.findall(log_content)))
 
         # Parse specific issues
         result.issues = self._parse_gradle_issues(log_content)
@@ -123,7 +135,7 @@ class GradleAnalyzer(LogAnalyzer):
             )
 
         # Check for task execution failures
-        task_failure = re.search(r"Execution failed for task '([\w:]+)'", log_content)
+        task_failure = _TASK_FAILURE_RE.search(log_content)
         if task_failure:
             issues.append(
                 {
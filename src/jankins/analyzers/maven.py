@@ -2,7 +2,29 @@
 
 import re
 
-from .base import AnalysisResult, LogAnalyzer
+from .base import AnalysisResult, LogAnalyzer, compile_pattern
+
+# Pattern-table conventions (compile-once, anchoring, guards) are
+# documented next to compile_pattern in base.py
+_ERROR_FLAGS = re.IGNORECASE | re.MULTILINE
+_ERROR_PATTERNS = tuple(
+    (guard, compile_pattern(p, _ERROR_FLAGS))
+    for guard, p in (
+        ("[error]", r"^[ \t]*\[ERROR\] .*"),
+        ("build failure", r"BUILD FAILURE"),
+        ("failed to execute goal", r"Failed to execute goal .*"),
+        ("could not resolve dependencies", r"Could not resolve dependencies .*"),
+        ("compilation failure", r"Compilation failure"),
+    )
+)
+_WARNING_PATTERNS = (("[warning]", compile_pattern(r"^[ \t]*\[WARNING\] .*", _ERROR_FLAGS)),)
+_COMPILATION_RE = compile_pattern(r"(\d+) error[s]?")
+_TEST_FAILURE_RE = compile_pattern(r"Tests run: \d+, Failures: (\d+), Errors: (\d+)")
+_DEP_RE = compile_pattern(r"Could not resolve dependencies for project ([\w\.\-:]+)")
+_PLUGIN_FAILURE_RE = compile_pattern(r"Failed to execute goal ([\w\.\-:]+)")
+# Case-insensitive literal search beats lowering the whole log just to
+# run one `in` check
+_COMPILATION_FAILED_RE = compile_pattern(r"compilation failed", re.IGNORECASE)
 
 
 class MavenAnalyzer(LogAnalyzer):
@@ -37,38 +59,26 @@ class MavenAnalyzer(LogAnalyzer):
             return result
 
         # Extract errors
-        error_patterns = [
-            r"\[ERROR\] .*",
-            r"BUILD FAILURE",
-            r"Failed to execute goal .*",
-            r"Could not resolve dependencies .*",
-            r"Compilation failure",
-        ]
-        result.errors = self.extract_errors(log_content, error_patterns)
+        result.errors = self.extract_errors(log_content, _ERROR_PATTERNS)
+        result.errors_lower = "\n".join(result.errors).lower()
 
         # Extract warnings
-        warning_patterns = [
-            r"\[WARNING\] .*",
-        ]
-        result.warnings = self.extract_warnings(log_content, warning_patterns)
+        result.warnings = self.extract_warnings(log_content, _WARNING_PATTERNS)
 
         # Parse compilation errors
-        compilation_pattern = r"(\d+) error[s]?"
-        compilation_matches = re.findall(compilation_pattern, log_content)
+        compilation_matches = _COMPILATION_RE.findall(log_content)
         if compilation_matches:
             result.compilation_errors = sum(int(m) for m in compilation_matches)
 
         # Parse test failures
-        test_failure_pattern = r"Tests run: \d+, Failures: (\d+), Errors: (\d+)"
-        test_matches = re.findall(test_failure_pattern, log_content)
+        test_matches = _TEST_FAILURE_RE.findall(log_content)
         if test_matches:
             result.test_failures = sum(
                 int(failures) + int(errors) for failures, errors in test_matches
             )
 
         # Extract failed dependencies
-        dep_pattern = r"Could not resolve dependencies for project ([\w\.\-:]+)"
-        result.dependencies_failed = list(set(re.findall(dep_pattern, log_content)))
+        result.dependencies_failed = list(set(_DEP_RE.findall(log_content)))
 
         # Parse specific issues
         result.issues = self._parse_maven_issues(log_content)
@@ -103,7 +113,7 @@ class MavenAnalyzer(LogAnalyzer):
             )
 
         # Check for compilation failures
-        if "Compilation failure" in log_content or "compilation failed" in log_content.lower():
+        if "Compilation failure" in log_content or _COMPILATION_FAILED_RE.search(log_content):
             issues.append(
                 {"type": "compilation", "severity": "error", "message": "Java compilation failed"}
             )
@@ -119,7 +129,7 @@ class MavenAnalyzer(LogAnalyzer):
             )
 
         # Check for plugin execution failures
-        plugin_failure = re.search(r"Failed to execute goal ([\w\.\-:]+)", log_content)
+        plugin_failure = _PLUGIN_FAILURE_RE.search(log_content)
         if plugin_failure:
             issues.append(
                 {
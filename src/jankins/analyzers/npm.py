@@ -2,7 +2,49 @@
 
 import re
 
-from .base import AnalysisResult, LogAnalyzer
+from .base import AnalysisResult, LogAnalyzer, compile_pattern
+
+# Pattern-table conventions (compile-once, anchoring, guards) are
+# documented next to compile_pattern in base.py
+_ERROR_FLAGS = re.IGNORECASE | re.MULTILINE
+_ERROR_PATTERNS = tuple(
+    (guard, compile_pattern(p, _ERROR_FLAGS))
+    for guard, p in (
+        ("npm err!", r"^[ \t]*npm ERR! .*"),
+        ("error ", r"^[ \t]*error .*"),
+        ("error in ", r"^[ \t]*ERROR in .*"),
+        ("failed to compile", r"Failed to compile"),
+        ("module not found:", r"Module not found: .*"),
+    )
+)
+_WARNING_PATTERNS = tuple(
+    (guard, compile_pattern(p, _ERROR_FLAGS))
+    for guard, p in (
+        ("npm warn", r"^[ \t]*npm WARN .*"),
+        ("warning ", r"^[ \t]*warning .*"),
+        ("warning in ", r"^[ \t]*WARNING in .*"),
+        ("deprecated ", r"deprecated .*"),
+    )
+)
+_TEST_FAILURE_PATTERNS = tuple(
+    compile_pattern(p)
+    for p in (
+        r"(\d+) failing",
+        r"Tests:.*(\d+) failed",
+        r"FAIL .*\.test\.",
+    )
+)
+# Case-insensitive literal search beats lowering the whole log just to
+# run one `in` check
+_PERMISSION_DENIED_RE = compile_pattern(r"permission denied", re.IGNORECASE)
+_DEP_PATTERNS = tuple(
+    compile_pattern(p)
+    for p in (
+        r"Could not resolve dependency:\s+([\w\@\-\/]+)",
+        r"Module not found:.*['\"]([^'\"]+)['\"]",
+        r"Cannot find module ['\"]([^'\"]+)['\"]",
+    )
+)
 
 
 class NpmAnalyzer(LogAnalyzer):
@@ -38,33 +80,16 @@ class NpmAnalyzer(LogAnalyzer):
             return result
 
         # Extract errors
-        error_patterns = [
-            r"npm ERR! .*",
-            r"error .*",
-            r"ERROR in .*",
-            r"Failed to compile",
-            r"Module not found: .*",
-        ]
-        result.errors = self.extract_errors(log_content, error_patterns)
+        result.errors = self.extract_errors(log_content, _ERROR_PATTERNS)
+        result.errors_lower = "\n".join(result.errors).lower()
 
         # Extract warnings
-        warning_patterns = [
-            r"npm WARN .*",
-            r"warning .*",
-            r"WARNING in .*",
-            r"deprecated .*",
-        ]
-        result.warnings = self.extract_warnings(log_content, warning_patterns)
+        result.warnings = self.extract_warnings(log_content, _WARNING_PATTERNS)
 
         # Parse test failures
-        test_failure_patterns = [
-            r"(\d+) failing",
-            r"Tests:.*(\d+) failed",
-            r"FAIL .*\.test\.",
-        ]
         test_failures = 0
-        for pattern in test_failure_patterns:
-            matches = re.findall(pattern, log_content)
+        for pattern in _TEST_FAILURE_PATTERNS:
+            matches = pattern.findall(log_content)
             if matches:
                 for match in matches:
                     if isinstance(match, tuple):
@@ -76,14 +101,9 @@ class NpmAnalyzer(LogAnalyzer):
         result.test_failures = test_failures
 
         # Extract failed dependencies
-        dep_patterns = [
-            r"Could not resolve dependency:\s+([\w\@\-\/]+)",
-            r"Module not found:.*['\"]([^'\"]+)['\"]",
-            r"Cannot find module ['\"]([^'\"]+)['\"]",
-        ]
         failed_deps = []
-        for pattern in dep_patterns:
-            failed_deps.extend(re.findall(pattern, log_content))
+        for pattern in _DEP_PATTERNS:
+            failed_deps.extend(pattern.findall(log_content))
         result.dependencies_failed = list(set(failed_deps))
 
         # Parse specific issues
@@ -159,7 +179,7 @@ class NpmAnalyzer(LogAnalyzer):
             )
 
         # Check for permission errors
-        if "EACCES" in log_content or "permission denied" in log_content.lower():
+        if "EACCES" in log_content or _PERMISSION_DENIED_RE.search(log_content):
             issues.append(
                 {
                     "type": "permission_error",
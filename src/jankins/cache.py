@@ -5,29 +5,24 @@ frequently requested resources like job info and build data.
 """
 
 import hashlib
+import heapq
 import json
 import logging
 import time
+from collections import OrderedDict
 from collections.abc import Callable
-from dataclasses import dataclass
 from threading import Lock
 from typing import Any
 
 logger = logging.getLogger(__name__)
 
 
-@dataclass
-class CacheEntry:
-    """Cache entry with expiration."""
-
-    value: Any
-    expires_at: float
-
-
 class ResponseCache:
     """Simple TTL-based in-memory cache for API responses.
 
-    Thread-safe cache with automatic expiration and size limits.
+    Thread-safe LRU cache with automatic expiration and size limits.
+    Entries are (expires_at, value) tuples in an OrderedDict so hits,
+    inserts, and evictions are all O(1) dict operations in C.
     """
 
     def __init__(self, ttl: int = 300, max_entries: int = 1000):
@@ -39,7 +34,10 @@ class ResponseCache:
         """
         self.ttl = ttl
         self.max_entries = max_entries
-        self._cache: dict[str, CacheEntry] = {}
+        self._cache: OrderedDict[str, tuple[float, Any]] = OrderedDict()
+        # Min-heap of (expires_at, key) so expired entries are reaped
+        # lazily on insert instead of lingering until read
+        self._expiry_heap: list[tuple[float, str]] = []
         self._lock = Lock()
         self._hits = 0
         self._misses = 0
@@ -62,14 +60,17 @@ class ResponseCache:
                 self._misses += 1
                 return None
 
-            # Check expiration
-            if time.time() > entry.expires_at:
+            # Check expiration; monotonic can't jump under clock skew
+            expires_at, value = entry
+            if time.monotonic() > expires_at:
                 del self._cache[key]
                 self._misses += 1
                 return None
 
+            # Refresh recency so eviction targets the least recently used
+            self._cache.move_to_end(key)
             self._hits += 1
-            return entry.value
+            return value
 
     def set(self, key: str, value: Any) -> None:
         """Set cache value with TTL.
@@ -79,11 +80,31 @@ class ResponseCache:
             value: Value to cache
         """
         with self._lock:
-            # Enforce size limit
-            if len(self._cache) >= self.max_entries:
-                self._evict_oldest()
+            now = time.monotonic()
+            self._reap(now)
 
-            self._cache[key] = CacheEntry(value=value, expires_at=time.time() + self.ttl)
+            # Enforce size limit: drop the least recently used entry
+            if key not in self._cache and len(self._cache) >= self.max_entries:
+                self._cache.popitem(last=False)
+
+            expires_at = now + self.ttl
+            self._cache[key] = (expires_at, value)
+            self._cache.move_to_end(key)
+            heapq.heappush(self._expiry_heap, (expires_at, key))
+
+    def _reap(self, now: float) -> None:
+        """Drop expired entries, cheapest-expiry first.
+
+        Heap entries can be stale when a key was re-set with a later
+        expiry, so each is checked against the live mapping before the
+        key is deleted. Called with the lock held.
+        """
+        heap = self._expiry_heap
+        while heap and heap[0][0] < now:
+            expires_at, key = heapq.heappop(heap)
+            entry = self._cache.get(key)
+            if entry is not None and entry[0] == expires_at:
+                del self._cache[key]
 
     def delete(self, key: str) -> None:
         """Delete cached value.
@@ -98,17 +119,9 @@ class ResponseCache:
         """Clear all cached values."""
         with self._lock:
             self._cache.clear()
+            self._expiry_heap.clear()
             logger.info("Cache cleared")
 
-    def _evict_oldest(self) -> None:
-        """Evict oldest cache entry."""
-        if not self._cache:
-            return
-
-        # Find entry with earliest expiration
-        oldest_key = min(self._cache.keys(), key=lambda k: self._cache[k].expires_at)
-        del self._cache[oldest_key]
-
     def get_stats(self) -> dict[str, Any]:
         """Get cache statistics.
 
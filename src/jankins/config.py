@@ -4,6 +4,7 @@ Environment variables and CLI flags with proper precedence:
 CLI flags > Environment variables > Defaults
 """
 
+from functools import cached_property
 from typing import Literal
 
 from pydantic import Field
@@ -104,13 +105,26 @@ class JankinsConfig(BaseSettings):
     cache_ttl: int = Field(
         default=300, description="Cache TTL in seconds", validation_alias="CACHE_TTL"
     )
+    last_build_ttl_seconds: int = Field(
+        default=5,
+        description="TTL in seconds for cached 'last build number' lookups",
+        validation_alias="LAST_BUILD_TTL_SECONDS",
+    )
+
+    # mcp_bind is fixed at construction, so the address is parsed once
+    # (rpartition: single C-level pass) instead of on every access in
+    # the server loop
+    @cached_property
+    def _bind_parts(self) -> tuple[str, int]:
+        host, _, port = self.mcp_bind.rpartition(":")
+        return host, int(port)
 
     @property
     def bind_host(self) -> str:
         """Extract host from bind address."""
-        return self.mcp_bind.split(":")[0]
+        return self._bind_parts[0]
 
     @property
     def bind_port(self) -> int:
         """Extract port from bind address."""
-        return int(self.mcp_bind.split(":")[1])
+        return self._bind_parts[1]
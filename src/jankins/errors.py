@@ -4,9 +4,12 @@ Maps failures to MCP/JSON-RPC error codes with remediation hints.
 Follows best practices for error handling in MCP servers.
 """
 
-import uuid
 from enum import Enum
 
+from .logging_utils import correlation_id_var, new_correlation_id
+
+DOCS_URL = "https://github.com/your-org/jankins#troubleshooting"
+
 
 class ErrorCode(Enum):
     """MCP-compliant error codes mapped to JSON-RPC semantics."""
@@ -28,6 +31,20 @@ class ErrorCode(Enum):
     TIMEOUT = -32007
 
 
+# Built once at import: errors are raised on every validation failure,
+# and rebuilding this dict per construction was pure allocation churn
+_DEFAULT_HINTS = {
+    ErrorCode.UNAUTHORIZED: "Check that JENKINS_USER and JENKINS_API_TOKEN are correct",
+    ErrorCode.FORBIDDEN: "User lacks permissions for this operation",
+    ErrorCode.NOT_FOUND: "Resource does not exist or path is incorrect",
+    ErrorCode.CONFLICT: "Resource is locked or operation conflicts with current state",
+    ErrorCode.RATE_LIMITED: "Too many requests, wait before retrying",
+    ErrorCode.UPSTREAM_ERROR: "Jenkins server returned an error",
+    ErrorCode.TIMEOUT: "Request to Jenkins timed out",
+    ErrorCode.INVALID_PARAMS: "One or more parameters are invalid",
+}
+
+
 class JankinsError(Exception):
     """Base exception for all jankins errors.
 
@@ -48,22 +65,15 @@ class JankinsError(Exception):
         self.code = code
         self.hint = hint or self._default_hint()
         self.next_actions = next_actions or []
-        self.correlation_id = correlation_id or str(uuid.uuid4())
-        self.docs_url = docs_url or "https://github.com/your-org/jankins#troubleshooting"
+        # Prefer the active request's ID so the error correlates with
+        # its logs; a fresh pooled ID is the fallback, skipping the
+        # UUID object construction uuid4 pays per error
+        self.correlation_id = correlation_id or correlation_id_var.get() or new_correlation_id()
+        self.docs_url = docs_url or DOCS_URL
 
     def _default_hint(self) -> str:
         """Provide default hint based on error code."""
-        hints = {
-            ErrorCode.UNAUTHORIZED: "Check that JENKINS_USER and JENKINS_API_TOKEN are correct",
-            ErrorCode.FORBIDDEN: "User lacks permissions for this operation",
-            ErrorCode.NOT_FOUND: "Resource does not exist or path is incorrect",
-            ErrorCode.CONFLICT: "Resource is locked or operation conflicts with current state",
-            ErrorCode.RATE_LIMITED: "Too many requests, wait before retrying",
-            ErrorCode.UPSTREAM_ERROR: "Jenkins server returned an error",
-            ErrorCode.TIMEOUT: "Request to Jenkins timed out",
-            ErrorCode.INVALID_PARAMS: "One or more parameters are invalid",
-        }
-        return hints.get(self.code, "An unexpected error occurred")
+        return _DEFAULT_HINTS.get(self.code, "An unexpected error occurred")
 
     def to_dict(self) -> dict:
         """Convert error to MCP-compatible error response."""
@@ -85,6 +95,54 @@ class InvalidParamsError(JankinsError):
     def __init__(self, message: str, **kwargs):
         super().__init__(message, code=ErrorCode.INVALID_PARAMS, **kwargs)
 
+    @classmethod
+    def missing(
+        cls, missing: tuple[str, ...], tool_name: str, required: tuple[str, ...]
+    ) -> "InvalidParamsError":
+        """Build a missing-required-parameters error cheaply.
+
+        Validation failures are the most common error under load, so this
+        path carries just the parameter name tuples and defers message/hint
+        formatting until the error is actually rendered.
+        """
+        return _MissingParamsError(missing, tool_name, required)
+
+
+class _MissingParamsError(InvalidParamsError):
+    """Missing required parameters, with string formatting deferred.
+
+    The message and hint are computed lazily from the stored tuples so
+    raising costs no f-string work when the caller only serializes the code.
+    """
+
+    def __init__(self, missing: tuple[str, ...], tool_name: str, required: tuple[str, ...]):
+        # Deliberately bypasses JankinsError.__init__ to skip the
+        # message/hint formatting; every base-class field must be
+        # mirrored here or it will silently be missing on instances
+        Exception.__init__(self)
+        self.missing_params = missing
+        self.tool_name = tool_name
+        self.required_params = required
+        self.code = ErrorCode.INVALID_PARAMS
+        self.next_actions = []
+        self.correlation_id = correlation_id_var.get() or new_correlation_id()
+        self.docs_url = DOCS_URL
+
+    def __getattr__(self, name: str) -> str:
+        # message/hint stay plain attributes (matching the base class);
+        # they're formatted on first read and cached on the instance
+        if name == "message":
+            value = f"Missing required parameters: {', '.join(self.missing_params)}"
+        elif name == "hint":
+            value = f"Tool '{self.tool_name}' requires: {', '.join(self.required_params)}"
+        else:
+            raise AttributeError(name)
+        setattr(self, name, value)
+        return value
+
+    def __str__(self) -> str:
+        return self.message
+
 
 class UnauthorizedError(JankinsError):
     """Authentication failed."""
@@ -1,6 +1,6 @@
 """Token-aware formatters for MCP responses."""
 
-from .base import OutputFormat
+from .base import OutputFormat, parse_output_format
 from .token_aware import TokenAwareFormatter, estimate_tokens
 
-__all__ = ["OutputFormat", "TokenAwareFormatter", "estimate_tokens"]
+__all__ = ["OutputFormat", "TokenAwareFormatter", "estimate_tokens", "parse_output_format"]
@@ -3,6 +3,8 @@
 from enum import Enum
 from typing import Any
 
+from ..errors import InvalidParamsError
+
 
 class OutputFormat(str, Enum):
     """Output format options for tool responses."""
@@ -14,6 +16,26 @@ class OutputFormat(str, Enum):
     TABLE = "table"  # Compact table format
 
 
+_FORMATS = {member.value: member for member in OutputFormat}
+
+
+def parse_output_format(format_str: str) -> OutputFormat:
+    """Look up an OutputFormat by value.
+
+    Every handler validates its ``format`` argument; a dict lookup
+    skips the enum ``__call__`` machinery, and an unknown value
+    surfaces as InvalidParamsError with the valid choices instead of
+    a bare ValueError.
+    """
+    output_format = _FORMATS.get(format_str)
+    if output_format is None:
+        raise InvalidParamsError(
+            f"Unknown format '{format_str}'",
+            hint=f"Valid formats: {', '.join(_FORMATS)}",
+        )
+    return output_format
+
+
 def compact_dict(data: dict[str, Any], include_keys: list[str]) -> dict[str, Any]:
     """Extract only specified keys from dict."""
     return {k: data.get(k) for k in include_keys if k in data}
@@ -6,6 +6,7 @@ fallback for progressive logs and Blue Ocean API.
 
 import logging
 from typing import Any
+from urllib.parse import quote
 
 import httpx
 import jenkins
@@ -13,16 +14,29 @@ import jenkins
 from ..config import JankinsConfig
 from ..errors import (
     JankinsError,
+    TimeoutError as JankinsTimeoutError,
     UnauthorizedError,
     UpstreamError,
     map_http_error,
 )
-from ..errors import (
-    TimeoutError as JankinsTimeoutError,
-)
 
 logger = logging.getLogger(__name__)
 
+# HTTP/2 multiplexes concurrent REST calls over one connection,
+# amortizing the TLS handshake; it needs the optional h2 package, and
+# without it httpx falls back to HTTP/1.1 keep-alive
+try:
+    import h2  # noqa: F401
+
+    _HTTP2_AVAILABLE = True
+except ImportError:
+    _HTTP2_AVAILABLE = False
+
+
+def _job_url_path(name: str) -> str:
+    """Build the /job/... URL path for a (possibly foldered) job name."""
+    return "".join(f"/job/{quote(part, safe='')}" for part in name.split("/"))
+
 
 class JenkinsAdapter:
     """Adapter for Jenkins API with retry and error handling.
@@ -64,8 +78,16 @@ class JenkinsAdapter:
             self._http_client = httpx.Client(
                 base_url=self.config.jenkins_url,
                 auth=(self.config.jenkins_user, self.config.jenkins_api_token),
-                timeout=self.config.jenkins_timeout,
+                # Connects that don't complete quickly never will;
+                # failing fast keeps a dead Jenkins from tying up
+                # worker threads for the full request timeout
+                timeout=httpx.Timeout(self.config.jenkins_timeout, connect=2.0),
                 follow_redirects=True,
+                http2=_HTTP2_AVAILABLE,
+                # Handlers offload REST calls to worker threads, so the
+                # shared client needs enough kept-alive connections for
+                # that concurrency instead of re-handshaking per call
+                limits=httpx.Limits(max_connections=64, max_keepalive_connections=32),
             )
         return self._http_client
 
@@ -84,8 +106,57 @@ class JenkinsAdapter:
         except jenkins.JenkinsException as e:
             raise self._map_jenkins_exception(e, "list jobs")
 
-    def get_job_info(self, name: str) -> dict[str, Any]:
-        """Get job information."""
+    def get_all_jobs_with_state(
+        self, tree: str = "name,color,url", folder_depth: int = 10
+    ) -> list[dict[str, Any]]:
+        """List all jobs in one request with caller-chosen fields.
+
+        Nests a ``jobs[...]`` expression ``folder_depth`` levels deep so
+        folders are recursed server-side, then flattens the response
+        depth-first with ``fullname`` filled in the way
+        :meth:`get_all_jobs` does. Unlike get_all_jobs the per-job
+        field list is the caller's, so handlers fetch exactly what
+        their formatter reads.
+
+        Args:
+            tree: Fields to serialize for each job
+            folder_depth: Folder nesting levels to recurse
+        """
+        jobs_query = "jobs"
+        for _ in range(folder_depth):
+            jobs_query = f"jobs[{tree},{jobs_query}]"
+        data = self.rest_get("/api/json", params={"tree": jobs_query}).json()
+
+        jobs_list: list[dict[str, Any]] = []
+        stack: list[tuple[list[str], list[dict[str, Any]]]] = [([], data.get("jobs", []))]
+        while stack:
+            path, level = stack.pop()
+            for job in level:
+                if "name" not in job:
+                    # Deeper than the query asked for; Jenkins returns
+                    # empty objects past the requested nesting
+                    continue
+                job_path = path + [job["name"]]
+                job.setdefault("fullname", "/".join(job_path))
+                jobs_list.append(job)
+                children = job.get("jobs")
+                if isinstance(children, list):
+                    stack.append((job_path, children))
+        return jobs_list
+
+    def get_job_info(self, name: str, tree: str | None = None) -> dict[str, Any]:
+        """Get job information.
+
+        Args:
+            name: Job name
+            tree: Optional Jenkins ``tree`` expression restricting which
+                fields the server serializes (e.g. "lastBuild[number]").
+                On busy instances this shrinks the response by orders of
+                magnitude compared to the full job blob.
+        """
+        if tree is not None:
+            return self.rest_get(f"{_job_url_path(name)}/api/json", params={"tree": tree}).json()
+
         try:
             return self.server.get_job_info(name)
         except jenkins.NotFoundException:
@@ -134,8 +205,20 @@ class JenkinsAdapter:
 
     # Build operations
 
-    def get_build_info(self, name: str, number: int) -> dict[str, Any]:
-        """Get build information."""
+    def get_build_info(self, name: str, number: int, tree: str | None = None) -> dict[str, Any]:
+        """Get build information.
+
+        Args:
+            name: Job name
+            number: Build number
+            tree: Optional Jenkins ``tree`` expression restricting which
+                fields the server serializes (e.g. "number,result,duration").
+        """
+        if tree is not None:
+            return self.rest_get(
+                f"{_job_url_path(name)}/{number}/api/json", params={"tree": tree}
+            ).json()
+
         try:
             return self.server.get_build_info(name, number)
         except jenkins.NotFoundException:
@@ -147,6 +230,27 @@ class JenkinsAdapter:
         except jenkins.JenkinsException as e:
             raise self._map_jenkins_exception(e, f"get build #{number} for '{name}'")
 
+    def get_last_build_info(self, name: str, tree: str) -> dict[str, Any] | None:
+        """Get the job's last build in a single request.
+
+        Wraps ``tree`` in ``lastBuild[...]`` so the job endpoint
+        serializes only the requested build fields; callers that
+        previously resolved the last build number and then fetched the
+        build pay one round trip instead of two.
+
+        Args:
+            name: Job name
+            tree: Jenkins ``tree`` expression for the build fields
+                (e.g. "number,result,duration")
+
+        Returns:
+            The lastBuild dict, or None if the job has never built
+        """
+        job_info = self.rest_get(
+            f"{_job_url_path(name)}/api/json", params={"tree": f"lastBuild[{tree}]"}
+        ).json()
+        return job_info.get("lastBuild")
+
     def get_build_console_output(self, name: str, number: int) -> str:
         """Get full build console output.
 
@@ -163,15 +267,118 @@ class JenkinsAdapter:
         except jenkins.JenkinsException as e:
             raise self._map_jenkins_exception(e, f"get console for '{name}' #{number}")
 
+    def get_build_console_tail(
+        self, name: str, number: int, nbytes: int = 50_000
+    ) -> tuple[str, int]:
+        """Get the last nbytes of a build's console output.
+
+        Sends an HTTP Range request against consoleText so only the
+        tail travels over the wire, unlike get_build_console_output
+        which materializes the whole log. If the server ignores the
+        Range header, the tail is sliced locally from the response
+        bytes.
+
+        Args:
+            name: Job name
+            number: Build number
+            nbytes: Maximum bytes from the end of the log
+
+        Returns:
+            Tuple of (tail text, total log size in bytes)
+        """
+        response = self.rest_get(
+            f"{_job_url_path(name)}/{number}/consoleText",
+            headers={"Range": f"bytes=-{nbytes}"},
+        )
+        content = response.content
+        total_size = len(content)
+
+        if response.status_code == 206:
+            # Partial content: the total size comes from Content-Range
+            # ("bytes start-end/total")
+            content_range = response.headers.get("Content-Range", "")
+            if "/" in content_range:
+                try:
+                    total_size = int(content_range.rsplit("/", 1)[1])
+                except ValueError:
+                    pass
+        elif len(content) > nbytes:
+            content = content[-nbytes:]
+
+        return content.decode("utf-8", errors="ignore"), total_size
+
+    def get_build_console_range(
+        self, name: str, number: int, start: int, nbytes: int
+    ) -> tuple[bytes, int]:
+        """Get nbytes of console output starting at byte offset start.
+
+        Sends an HTTP Range request against consoleText; if the server
+        ignores the Range header, the window is sliced locally. Returns
+        raw bytes so callers fetching adjacent windows can join them
+        before decoding, keeping multi-byte characters that straddle a
+        window boundary intact.
+
+        Args:
+            name: Job name
+            number: Build number
+            start: Starting byte offset
+            nbytes: Maximum bytes to retrieve
+
+        Returns:
+            Tuple of (raw bytes, total log size in bytes)
+        """
+        response = self.rest_get(
+            f"{_job_url_path(name)}/{number}/consoleText",
+            headers={"Range": f"bytes={start}-{start + nbytes - 1}"},
+        )
+        content = response.content
+        total_size = len(content)
+
+        if response.status_code == 206:
+            content_range = response.headers.get("Content-Range", "")
+            if "/" in content_range:
+                try:
+                    total_size = int(content_range.rsplit("/", 1)[1])
+                except ValueError:
+                    pass
+        else:
+            content = content[start : start + nbytes]
+
+        return content, total_size
+
     # Queue operations
 
-    def get_queue_info(self) -> list[dict[str, Any]]:
-        """Get build queue information."""
+    def get_queue_info(self, tree: str | None = None) -> list[dict[str, Any]]:
+        """Get build queue information.
+
+        Args:
+            tree: Optional Jenkins tree expression scoping the fields
+                returned per item (e.g. "items[id,why]"); Jenkins ships
+                dozens of fields per queue item by default
+        """
+        if tree is not None:
+            response = self.rest_get("/queue/api/json", params={"tree": tree})
+            return response.json().get("items", [])
         try:
             return self.server.get_queue_info()
         except jenkins.JenkinsException as e:
             raise self._map_jenkins_exception(e, "get queue info")
 
+    def get_queue_item(self, queue_id: int) -> dict[str, Any]:
+        """Get a single queue item by ID.
+
+        Once the queued build starts, the item's ``executable`` field
+        holds the assigned build number.
+        """
+        try:
+            return self.server.get_queue_item(queue_id)
+        except jenkins.NotFoundException:
+            from ..errors import NotFoundError
+
+            raise NotFoundError(f"Queue item #{queue_id} not found", resource_type="Queue Item")
+        except jenkins.JenkinsException as e:
+            raise self._map_jenkins_exception(e, f"get queue item #{queue_id}")
+
     # User and system info
 
     def get_whoami(self) -> dict[str, Any]:
@@ -190,12 +397,18 @@ class JenkinsAdapter:
 
     # Direct REST calls for advanced features
 
-    def rest_get(self, path: str, params: dict[str, Any] | None = None) -> httpx.Response:
+    def rest_get(
+        self,
+        path: str,
+        params: dict[str, Any] | None = None,
+        headers: dict[str, str] | None = None,
+    ) -> httpx.Response:
         """Make a GET request to Jenkins REST API.
 
         Args:
             path: API path (e.g., "/job/myjob/123/logText/progressiveText")
             params: Query parameters
+            headers: Extra request headers (e.g., Range)
 
         Returns:
             httpx.Response
@@ -204,7 +417,7 @@ class JenkinsAdapter:
             if self.config.debug_http:
                 logger.debug(f"REST GET {path}", extra={"params": params})
 
-            response = self.http_client.get(path, params=params)
+            response = self.http_client.get(path, params=params, headers=headers)
 
             if self.config.debug_http:
                 logger.debug(
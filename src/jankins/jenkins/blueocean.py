@@ -117,8 +117,10 @@ class BlueOceanClient:
         Returns:
             Pipeline graph structure
         """
-        nodes = self.get_pipeline_nodes(job_name, build_number)
+        return self._build_graph(self.get_pipeline_nodes(job_name, build_number))
 
+    def _build_graph(self, nodes: list[dict[str, Any]]) -> dict[str, Any]:
+        """Build the pipeline graph structure from a fetched node list."""
         if not nodes:
             return {"stages": [], "parallel_stages": [], "total_duration_ms": 0}
 
@@ -128,28 +130,27 @@ class BlueOceanClient:
         total_duration = 0
 
         for node in nodes:
+            # Bind the duration once: it feeds both the stage dict and
+            # the running total without a second dict lookup
+            duration_ms = node.get("durationInMillis", 0)
             stage_info = {
                 "id": node.get("id", ""),
                 "name": node.get("displayName", "Unknown"),
                 "result": node.get("result", "UNKNOWN"),
                 "state": node.get("state", "UNKNOWN"),
-                "duration_ms": node.get("durationInMillis", 0),
+                "duration_ms": duration_ms,
                 "start_time": node.get("startTime", ""),
                 "type": node.get("type", "STAGE"),
             }
 
-            # Track parallel stages
-            edges = node.get("edges", [])
-            if len(edges) > 1:
-                # This is a parallel group
-                parallel_id = node.get("id")
-                if parallel_id not in parallel_groups:
-                    parallel_groups[parallel_id] = []
-                parallel_groups[parallel_id].append(stage_info)
+            # Track parallel stages (multiple outgoing edges)
+            edges = node.get("edges")
+            if edges and len(edges) > 1:
+                parallel_groups.setdefault(node.get("id"), []).append(stage_info)
             else:
                 stages.append(stage_info)
 
-            total_duration += stage_info["duration_ms"]
+            total_duration += duration_ms
 
         return {
             "stages": stages,
@@ -169,6 +170,12 @@ class BlueOceanClient:
             List of failing stages with error details
         """
         nodes = self.get_pipeline_nodes(job_name, build_number)
+        return self._failing_stages(job_name, build_number, nodes)
+
+    def _failing_stages(
+        self, job_name: str, build_number: int, nodes: list[dict[str, Any]]
+    ) -> list[dict[str, Any]]:
+        """Derive failing-stage details from a fetched node list."""
         failing = []
 
         for node in nodes:
@@ -198,6 +205,25 @@ class BlueOceanClient:
 
         return failing
 
+    def get_pipeline_graph_with_failing(
+        self, job_name: str, build_number: int
+    ) -> tuple[dict[str, Any], list[dict[str, Any]]]:
+        """Get the pipeline graph and failing stages from one node fetch.
+
+        Callers that need both previously paid two identical ``/nodes``
+        round-trips; this fetches the node list once and derives both
+        views locally.
+
+        Args:
+            job_name: Full job name
+            build_number: Build number
+
+        Returns:
+            Tuple of (pipeline graph, failing stages)
+        """
+        nodes = self.get_pipeline_nodes(job_name, build_number)
+        return self._build_graph(nodes), self._failing_stages(job_name, build_number, nodes)
+
     def compare_pipeline_runs(
         self, job_name: str, base_build: int, head_build: int
     ) -> dict[str, Any]:
@@ -4,15 +4,30 @@ Uses Jenkins progressiveText API for efficient log streaming and retrieval
 with byte offsets, avoiding full log downloads.
 """
 
+import asyncio
 import logging
 import re
 from dataclasses import dataclass
+from functools import lru_cache
+
+from cachetools import TTLCache
 
 from .adapter import JenkinsAdapter
 
 logger = logging.getLogger(__name__)
 
 
+@lru_cache(maxsize=256)
+def _compile(pattern: str) -> re.Pattern:
+    """Memoize compiled user-supplied patterns.
+
+    CI-style queries repeat the same few patterns; caching the
+    compiled object skips recompilation and, in filter_log, the
+    per-line trip through re's module-level cache.
+    """
+    return re.compile(pattern)
+
+
 @dataclass
 class LogChunk:
     """A chunk of log data with metadata."""
@@ -34,6 +49,9 @@ class LogSummary:
     last_error_lines: list[str]
     failing_stages: list[str]
     is_complete: bool
+    # Raw log tail, populated on request so callers that need content
+    # for deeper analysis reuse the bytes this summary already fetched
+    tail: str = ""
 
 
 class ProgressiveLogClient:
@@ -48,6 +66,11 @@ class ProgressiveLogClient:
 
     def __init__(self, adapter: JenkinsAdapter):
         self.adapter = adapter
+        # Tail bytes fetched for a finished build are immutable, so
+        # they satisfy later reads that fall inside them — typically a
+        # summary request followed by a FULL fetch of the same build.
+        # The short TTL just bounds memory.
+        self._tail_cache: TTLCache = TTLCache(maxsize=64, ttl=30)
 
     def get_progressive_text(
         self,
@@ -98,6 +121,21 @@ class ProgressiveLogClient:
         Returns:
             LogChunk with text and metadata
         """
+        cached = self._tail_cache.get((job_name, build_number))
+        if cached is not None and start >= cached.start:
+            # The cached tail already holds the requested range
+            data = cached.text.encode("utf-8")[start - cached.start :]
+            has_more = False
+            if max_bytes and len(data) > max_bytes:
+                data = data[:max_bytes]
+                has_more = True
+            return LogChunk(
+                text=data.decode("utf-8", errors="ignore"),
+                start=start,
+                end=cached.end,
+                has_more=has_more,
+            )
+
         text, next_start, has_more = self.get_progressive_text(job_name, build_number, start=start)
 
         # Truncate if exceeds max_bytes
@@ -109,6 +147,66 @@ class ProgressiveLogClient:
 
         return LogChunk(text=text, start=start, end=next_start, has_more=has_more)
 
+    # Window size for parallel range reads; large enough that the
+    # per-request overhead stays small, small enough to overlap well
+    PARALLEL_PAGE_BYTES = 262_144
+
+    async def get_log_chunk_parallel(
+        self,
+        job_name: str,
+        build_number: int,
+        start: int = 0,
+        max_bytes: int = 1_048_576,
+    ) -> LogChunk:
+        """Get a large log window as concurrent page-sized range reads.
+
+        One big consoleText request pays the server's full
+        time-to-first-byte before anything arrives; page-sized Range
+        reads issued together overlap that latency. The first page is
+        fetched alone to learn the total size, then the remaining
+        pages that actually exist are gathered concurrently.
+
+        Args:
+            job_name: Job name
+            build_number: Build number
+            start: Starting byte offset
+            max_bytes: Maximum bytes to retrieve
+
+        Returns:
+            LogChunk with text and metadata
+        """
+        page = self.PARALLEL_PAGE_BYTES
+        first, total_size = await asyncio.to_thread(
+            self.adapter.get_build_console_range,
+            job_name,
+            build_number,
+            start,
+            min(page, max_bytes),
+        )
+
+        span_end = min(start + max_bytes, total_size)
+        offsets = range(start + page, span_end, page)
+        rest = await asyncio.gather(
+            *(
+                asyncio.to_thread(
+                    self.adapter.get_build_console_range,
+                    job_name,
+                    build_number,
+                    offset,
+                    min(page, span_end - offset),
+                )
+                for offset in offsets
+            )
+        )
+
+        data = b"".join([first, *(content for content, _ in rest)])
+        return LogChunk(
+            text=data.decode("utf-8", errors="ignore"),
+            start=start,
+            end=total_size,
+            has_more=start + len(data) < total_size,
+        )
+
     def get_tail(
         self,
         job_name: str,
@@ -125,13 +223,32 @@ class ProgressiveLogClient:
         Returns:
             LogChunk with tail content
         """
-        # First, get the total size by fetching from offset 0
-        _, total_size, _ = self.get_progressive_text(job_name, build_number, start=0)
-
-        # Calculate start offset for tail
-        start = max(0, total_size - max_bytes)
-
-        return self.get_log_chunk(job_name, build_number, start=start, max_bytes=max_bytes)
+        cached = self._tail_cache.get((job_name, build_number))
+        if cached is not None and cached.start <= max(0, cached.end - max_bytes):
+            data = cached.text.encode("utf-8")[-max_bytes:]
+            return LogChunk(
+                text=data.decode("utf-8", errors="ignore"),
+                start=max(0, cached.end - len(data)),
+                end=cached.end,
+                has_more=False,
+            )
+
+        # A byte-range consoleText request transfers only the tail;
+        # previously the total size was learned by downloading the
+        # entire log from offset zero and then fetching the tail again
+        text, total_size = self.adapter.get_build_console_tail(job_name, build_number, max_bytes)
+
+        # An empty progressiveText read at the end offset reports
+        # whether the build is still writing output
+        _, _, has_more = self.get_progressive_text(job_name, build_number, start=total_size)
+
+        start = max(0, total_size - len(text.encode("utf-8")))
+        chunk = LogChunk(text=text, start=start, end=total_size, has_more=has_more)
+        if not has_more:
+            # Only finished builds are cached; a running build keeps
+            # appending and must always be re-read
+            self._tail_cache[(job_name, build_number)] = chunk
+        return chunk
 
     def filter_log(
         self,
@@ -153,6 +270,7 @@ class ProgressiveLogClient:
         """
         lines = text.split("\n")
         filtered_lines = []
+        pattern_re = _compile(pattern) if pattern else None
 
         for line in lines:
             # Apply level filter
@@ -161,8 +279,8 @@ class ProgressiveLogClient:
                     continue
 
             # Apply regex pattern
-            if pattern:
-                if not re.search(pattern, line):
+            if pattern_re:
+                if not pattern_re.search(line):
                     continue
 
             # Apply redaction
@@ -179,6 +297,8 @@ class ProgressiveLogClient:
         job_name: str,
         build_number: int,
         max_bytes: int,
+        want_tail: bool = False,
+        tail_bytes: int = 50_000,
     ) -> LogSummary:
         """Generate a token-efficient summary of log content.
 
@@ -186,6 +306,9 @@ class ProgressiveLogClient:
             job_name: Job name
             build_number: Build number
             max_bytes: Maximum bytes to analyze
+            want_tail: Also return the raw log tail in the summary, so
+                callers needing content for analysis skip a second fetch
+            tail_bytes: How much of the tail to return when requested
 
         Returns:
             LogSummary with key metrics
@@ -218,6 +341,7 @@ class ProgressiveLogClient:
             last_error_lines=last_error_lines,
             failing_stages=list(set(failing_stages)),  # Deduplicate
             is_complete=not chunk.has_more,
+            tail=chunk.text[-tail_bytes:] if want_tail else "",
         )
 
     def search_log(
@@ -245,7 +369,7 @@ class ProgressiveLogClient:
         lines = chunk.text.split("\n")
 
         matches = []
-        pattern_re = re.compile(pattern)
+        pattern_re = _compile(pattern)
 
         for i, line in enumerate(lines):
             if pattern_re.search(line):
@@ -3,14 +3,17 @@
 Parses test reports from Jenkins builds to provide detailed test analysis.
 """
 
+import asyncio
 import logging
 from dataclasses import dataclass
 from typing import Any, cast
 
+from cachetools import TTLCache
+
 logger = logging.getLogger(__name__)
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class TestCase:
     """Represents a single test case result."""
 
@@ -23,7 +26,7 @@ class TestCase:
     error_stacktrace: str | None = None
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class TestSuite:
     """Represents a test suite (collection of test cases)."""
 
@@ -36,7 +39,7 @@ class TestSuite:
     test_cases: list[TestCase]
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class TestReport:
     """Represents complete test report from a build."""
 
@@ -59,6 +62,10 @@ class TestReport:
 class TestResultParser:
     """Parser for various test result formats."""
 
+    # Cap on concurrent per-build report fetches so a large build
+    # range doesn't flood Jenkins
+    FETCH_CONCURRENCY = 8
+
     def __init__(self, jenkins_adapter):
         """Initialize test result parser.
 
@@ -66,6 +73,11 @@ class TestResultParser:
             jenkins_adapter: JenkinsAdapter instance for API calls
         """
         self.adapter = jenkins_adapter
+        # Parsed reports keyed by (kind, job, build): the failed-test,
+        # comparison, and flaky tools repeatedly re-request the same
+        # builds within a session, and a finished build's report never
+        # changes. Reports for still-running builds are not cached.
+        self._report_cache: TTLCache = TTLCache(maxsize=256, ttl=300)
 
     def get_test_report(self, job_name: str, build_number: int) -> TestReport | None:
         """Get test report from Jenkins test results API.
@@ -77,6 +89,11 @@ class TestResultParser:
         Returns:
             TestReport or None if no test results available
         """
+        cache_key = ("summary", job_name, build_number)
+        cached = self._report_cache.get(cache_key)
+        if cached is not None:
+            return cached
+
         try:
             # Get test report via Jenkins API
             build_info = self.adapter.get_build_info(job_name, build_number)
@@ -102,7 +119,7 @@ class TestResultParser:
             failed = test_action.get("failCount", 0)
             skipped = test_action.get("skipCount", 0)
 
-            return TestReport(
+            report = TestReport(
                 total_tests=total,
                 passed=total - failed - skipped,
                 failed=failed,
@@ -111,6 +128,9 @@ class TestResultParser:
                 duration=0.0,  # Not available in summary
                 suites=[],  # Summary mode doesn't include detailed suites
             )
+            if not build_info.get("building"):
+                self._report_cache[cache_key] = report
+            return report
 
         except Exception as e:
             logger.warning(f"Failed to get test report: {e}")
@@ -126,6 +146,11 @@ class TestResultParser:
         Returns:
             Detailed TestReport with test suites and cases
         """
+        cache_key = ("detailed", job_name, build_number)
+        cached = self._report_cache.get(cache_key)
+        if cached is not None:
+            return cached
+
         try:
             # Get detailed test results via testReport API
             path = f"/job/{job_name}/{build_number}/testReport/api/json"
@@ -197,7 +222,7 @@ class TestResultParser:
 
             total_passed = total_tests - total_failed - total_errors - total_skipped
 
-            return TestReport(
+            report = TestReport(
                 total_tests=total_tests,
                 passed=total_passed,
                 failed=total_failed,
@@ -206,6 +231,12 @@ class TestResultParser:
                 duration=total_duration,
                 suites=suites,
             )
+            # One tiny building-flag probe guards the cache; cheap
+            # next to parsing a large report twice
+            build_info = self.adapter.get_build_info(job_name, build_number, tree="building")
+            if not build_info.get("building"):
+                self._report_cache[cache_key] = report
+            return report
 
         except Exception as e:
             logger.warning(f"Failed to get detailed test report: {e}")
@@ -236,6 +267,43 @@ class TestResultParser:
 
         return failed_tests
 
+    def get_failed_tests_projected(
+        self, job_name: str, build_number: int, limit: int = 10, full: bool = False
+    ) -> list[dict[str, Any]]:
+        """Get failed tests as response-ready dicts.
+
+        Projects each failed case in the same pass that finds it, so
+        the handler doesn't walk the list a second time to rebuild
+        dicts from TestCase attributes.
+
+        Args:
+            job_name: Full job name
+            build_number: Build number
+            limit: Maximum number of failed tests to return
+            full: Include full error message and stacktrace; otherwise
+                a truncated error line
+
+        Returns:
+            List of failed-test dicts
+        """
+        projected = []
+        for test in self.get_failed_tests(job_name, build_number, limit):
+            test_info = {
+                "name": test.name,
+                "class": test.class_name,
+                "duration": round(test.duration, 2),
+                "status": test.status,
+            }
+            if full:
+                if test.error_message:
+                    test_info["error_message"] = test.error_message
+                if test.error_stacktrace and len(test.error_stacktrace) < 2000:
+                    test_info["stacktrace"] = test.error_stacktrace
+            elif test.error_message:
+                test_info["error"] = test.error_message[:200]
+            projected.append(test_info)
+        return projected
+
     def compare_test_results(
         self, job_name: str, base_build: int, head_build: int
     ) -> dict[str, Any]:
@@ -251,7 +319,29 @@ class TestResultParser:
         """
         base_report = self.get_test_report(job_name, base_build)
         head_report = self.get_test_report(job_name, head_build)
+        return self._build_comparison(base_build, head_build, base_report, head_report)
+
+    async def compare_test_results_async(
+        self, job_name: str, base_build: int, head_build: int
+    ) -> dict[str, Any]:
+        """Concurrent variant of compare_test_results.
 
+        The two report fetches are independent, so they overlap
+        instead of paying both round trips back to back.
+        """
+        base_report, head_report = await asyncio.gather(
+            asyncio.to_thread(self.get_test_report, job_name, base_build),
+            asyncio.to_thread(self.get_test_report, job_name, head_build),
+        )
+        return self._build_comparison(base_build, head_build, base_report, head_report)
+
+    @staticmethod
+    def _build_comparison(
+        base_build: int,
+        head_build: int,
+        base_report: TestReport | None,
+        head_report: TestReport | None,
+    ) -> dict[str, Any]:
         if not base_report or not head_report:
             return {"available": False, "error": "Test results not available for comparison"}
 
@@ -287,7 +377,9 @@ class TestResultParser:
             "improvement": failed_delta < 0,
         }
 
-    def get_flaky_tests(self, job_name: str, build_numbers: list[int]) -> list[dict[str, Any]]:
+    def get_flaky_tests(
+        self, job_name: str, build_numbers: list[int], include_statuses: bool = False
+    ) -> list[dict[str, Any]]:
         """Identify flaky tests across multiple builds.
 
         A test is considered flaky if it has inconsistent results
@@ -296,42 +388,68 @@ class TestResultParser:
         Args:
             job_name: Full job name
             build_numbers: List of build numbers to analyze
+            include_statuses: Include the per-build status list in each
+                entry (full-format responses only)
 
         Returns:
             List of flaky tests with failure rate
         """
+        reports = [self.get_detailed_test_report(job_name, num) for num in build_numbers]
+        return self._find_flaky(reports, include_statuses)
+
+    async def get_flaky_tests_async(
+        self, job_name: str, build_numbers: list[int], include_statuses: bool = False
+    ) -> list[dict[str, Any]]:
+        """Concurrent variant of get_flaky_tests.
+
+        The per-build report fetches dominate the wall time when
+        analyzing many builds; issuing them together, bounded by
+        FETCH_CONCURRENCY, collapses N round trips into a few waves.
+        """
+        semaphore = asyncio.Semaphore(self.FETCH_CONCURRENCY)
+
+        async def fetch(build_num: int) -> TestReport | None:
+            async with semaphore:
+                return await asyncio.to_thread(self.get_detailed_test_report, job_name, build_num)
+
+        reports = await asyncio.gather(*(fetch(num) for num in build_numbers))
+        return self._find_flaky(reports, include_statuses)
+
+    @staticmethod
+    def _find_flaky(
+        reports: list[TestReport | None], include_statuses: bool = False
+    ) -> list[dict[str, Any]]:
         # Track test results across builds
         test_results: dict[str, list[str]] = {}
 
-        for build_num in build_numbers:
-            report = self.get_detailed_test_report(job_name, build_num)
+        for report in reports:
             if not report:
                 continue
 
             for suite in report.suites:
                 for test_case in suite.test_cases:
                     test_key = f"{test_case.class_name}.{test_case.name}"
-                    if test_key not in test_results:
-                        test_results[test_key] = []
-                    test_results[test_key].append(test_case.status)
+                    test_results.setdefault(test_key, []).append(test_case.status)
 
-        # Identify flaky tests (have both PASSED and FAILED statuses)
+        # Identify flaky tests (have both PASSED and FAILED statuses);
+        # one C-level count and one membership test per test replaces
+        # the set construction plus two extra scans per row
         flaky = []
         for test_name, statuses in test_results.items():
-            if len(set(statuses)) > 1 and "FAILED" in statuses and "PASSED" in statuses:
-                failure_count = statuses.count("FAILED")
+            failure_count = statuses.count("FAILED")
+            if failure_count and "PASSED" in statuses:
                 total_runs = len(statuses)
                 failure_rate = (failure_count / total_runs) * 100
 
-                flaky.append(
-                    {
-                        "test": test_name,
-                        "failure_count": failure_count,
-                        "total_runs": total_runs,
-                        "failure_rate": round(failure_rate, 2),
-                        "statuses": statuses,
-                    }
-                )
+                entry = {
+                    "test": test_name,
+                    "failure_count": failure_count,
+                    "total_runs": total_runs,
+                    "failure_rate": round(failure_rate, 2),
+                }
+                if include_statuses:
+                    entry["statuses"] = statuses
+                flaky.append(entry)
 
         # Sort by failure rate descending
         flaky.sort(key=lambda x: cast(float, x["failure_rate"]), reverse=True)
@@ -27,9 +27,13 @@ class ToolParameterType(str, Enum):
     ARRAY = "array"
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ToolParameter:
-    """MCP tool parameter definition."""
+    """MCP tool parameter definition.
+
+    Frozen with slots: servers allocate dozens of these at registration,
+    and nothing mutates them afterwards, so they stay small and shareable.
+    """
 
     name: str
     type: ToolParameterType
@@ -39,7 +43,7 @@ class ToolParameter:
     enum: list[str] | None = None
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Tool:
     """MCP tool definition."""
 
@@ -47,6 +51,16 @@ class Tool:
     description: str
     parameters: list[ToolParameter] = field(default_factory=list)
     handler: Callable[[dict[str, Any]], Awaitable[dict[str, Any]]] | None = None
+    # Required parameter names, precomputed at construction so each
+    # call validates with one C-level set comparison instead of
+    # iterating the parameter list
+    _required: frozenset[str] = field(init=False, repr=False)
+    _required_names: tuple[str, ...] = field(init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        names = tuple(p.name for p in self.parameters if p.required)
+        object.__setattr__(self, "_required_names", names)
+        object.__setattr__(self, "_required", frozenset(names))
 
     def to_schema(self) -> dict[str, Any]:
         """Convert tool to MCP schema format."""
@@ -120,20 +134,16 @@ class MCPServer:
         self.version = version
         self.tools: dict[str, Tool] = {}
         self.prompts: dict[str, Prompt] = {}
-
-    def register_tool(self, tool: Tool) -> None:
-        """Register a tool with the server."""
-        self.tools[tool.name] = tool
-        logger.debug(f"Registered tool: {tool.name}")
-
-    def register_prompt(self, prompt: Prompt) -> None:
-        """Register a prompt with the server."""
-        self.prompts[prompt.name] = prompt
-        logger.debug(f"Registered prompt: {prompt.name}")
-
-    def get_capabilities(self) -> dict[str, Any]:
-        """Get server capabilities."""
-        return {
+        # tools/list returns the same schemas until registration
+        # changes, so build them once and invalidate on register;
+        # clients that re-poll otherwise pay O(tools) dict-building
+        # per request
+        self._tools_schema_cache: list[dict[str, Any]] | None = None
+
+        # Capabilities are constant for the server's lifetime (name/version
+        # are fixed at init), so build the payload once instead of per
+        # initialize request
+        self._capabilities: dict[str, Any] = {
             "capabilities": {
                 "tools": {
                     "listChanged": False  # We don't dynamically change tools
@@ -147,9 +157,40 @@ class MCPServer:
             "protocolVersion": MCP_VERSION,
         }
 
+    def register_tool(self, tool: Tool) -> None:
+        """Register a tool with the server."""
+        self.tools[tool.name] = tool
+        self._tools_schema_cache = None
+        logger.debug("Registered tool: %s", tool.name)
+
+    def register_tools(self, tools: list[Tool]) -> None:
+        """Register several tools in one batch.
+
+        The whole set lands in one dict update, so the tools become
+        visible to tools/list together rather than one at a time.
+        """
+        self.tools.update((tool.name, tool) for tool in tools)
+        self._tools_schema_cache = None
+        logger.debug("Registered %d tools in batch", len(tools))
+
+    def register_prompt(self, prompt: Prompt) -> None:
+        """Register a prompt with the server."""
+        self.prompts[prompt.name] = prompt
+        logger.debug("Registered prompt: %s", prompt.name)
+
+    def get_capabilities(self) -> dict[str, Any]:
+        """Get server capabilities."""
+        return self._capabilities
+
     def list_tools(self) -> list[dict[str, Any]]:
-        """List all registered tools."""
-        return [tool.to_schema() for tool in self.tools.values()]
+        """List all registered tools.
+
+        The schema list is cached until registration changes; callers
+        must treat it as read-only.
+        """
+        if self._tools_schema_cache is None:
+            self._tools_schema_cache = [tool.to_schema() for tool in self.tools.values()]
+        return self._tools_schema_cache
 
     def list_prompts(self) -> list[dict[str, Any]]:
         """List all registered prompts."""
@@ -182,22 +223,23 @@ class MCPServer:
                 hint="This is a server configuration error",
             )
 
-        # Validate required parameters
-        required_params = [p.name for p in tool.parameters if p.required]
-        missing_params = [p for p in required_params if p not in arguments]
-
-        if missing_params:
-            raise InvalidParamsError(
-                f"Missing required parameters: {', '.join(missing_params)}",
-                hint=f"Tool '{name}' requires: {', '.join(required_params)}",
-            )
+        # Validate required parameters: one set comparison on the fast
+        # path, ordered tuples rebuilt only when raising
+        if not tool._required <= arguments.keys():
+            missing_params = tuple(p for p in tool._required_names if p not in arguments)
+            raise InvalidParamsError.missing(missing_params, name, tool._required_names)
 
         try:
             return await tool.handler(arguments)
         except JankinsError:
             raise  # Re-raise JankinsErrors as-is
         except Exception as e:
-            logger.exception(f"Tool '{name}' handler failed")
+            logger.error(
+                "Tool '%s' handler failed: %s",
+                name,
+                e,
+                exc_info=logger.isEnabledFor(logging.DEBUG),
+            )
             raise JankinsError(
                 f"Tool execution failed: {str(e)}", hint="Check server logs for details"
             )
@@ -232,16 +274,22 @@ class MCPServer:
         try:
             return await prompt.handler(arguments)
         except Exception as e:
-            logger.exception(f"Prompt '{name}' handler failed")
+            logger.error(
+                "Prompt '%s' handler failed: %s",
+                name,
+                e,
+                exc_info=logger.isEnabledFor(logging.DEBUG),
+            )
             raise JankinsError(
                 f"Prompt execution failed: {str(e)}", hint="Check server logs for details"
             )
 
     def handle_jsonrpc(self, request: dict[str, Any]) -> dict[str, Any]:
-        """Handle a JSON-RPC 2.0 request.
+        """Handle a synchronous JSON-RPC 2.0 request.
 
-        This is a synchronous wrapper that routes to async handlers.
-        The actual async execution happens in the transport layer.
+        Covers the sync methods (initialize, tools/list, prompts/list).
+        The async methods (tools/call, prompts/get) are dispatched directly
+        by the transport layer via call_tool/get_prompt.
 
         Args:
             request: JSON-RPC request
@@ -250,12 +298,11 @@ class MCPServer:
             JSON-RPC response or error
         """
         method = request.get("method")
-        params = request.get("params", {})
         request_id = request.get("id")
 
         # Initialize response
         if method == "initialize":
-            return {"jsonrpc": "2.0", "id": request_id, "result": self.get_capabilities()}
+            return {"jsonrpc": "2.0", "id": request_id, "result": self._capabilities}
 
         elif method == "tools/list":
             return {"jsonrpc": "2.0", "id": request_id, "result": {"tools": self.list_tools()}}
@@ -263,11 +310,6 @@ class MCPServer:
         elif method == "prompts/list":
             return {"jsonrpc": "2.0", "id": request_id, "result": {"prompts": self.list_prompts()}}
 
-        # For async methods (tools/call, prompts/get), return a marker
-        # The transport layer will handle the async execution
-        elif method in ["tools/call", "prompts/get"]:
-            return {"_async": True, "method": method, "params": params, "id": request_id}
-
         else:
             return {
                 "jsonrpc": "2.0",
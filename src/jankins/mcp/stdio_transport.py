@@ -8,12 +8,45 @@ import asyncio
 import json
 import logging
 import sys
+from collections.abc import Callable
+from typing import Any
+
+import orjson
 
 from ..errors import JankinsError
 from .protocol import MCPServer
 
 logger = logging.getLogger(__name__)
 
+# Cached binary stdout references, rebound if sys.stdout is replaced
+# (e.g. by test capture). Writing pre-encoded UTF-8 bytes directly to the
+# buffer avoids the extra encode + newline passes that `print` incurs.
+_out_stream: Any = None
+_out_write: Callable[[bytes], Any] | None = None
+_out_flush: Callable[[], Any] | None = None
+
+
+def _bind_stdout() -> bool:
+    """Bind cached write/flush to the current stdout's binary buffer.
+
+    Returns:
+        True if a binary buffer is available, False otherwise
+    """
+    global _out_stream, _out_write, _out_flush
+
+    buffer = getattr(sys.stdout, "buffer", None)
+    if buffer is None:
+        # stdout redirected to a non-binary stream; fall back to text writes
+        _out_stream = None
+        _out_write = None
+        _out_flush = None
+        return False
+
+    _out_stream = sys.stdout
+    _out_write = buffer.write
+    _out_flush = buffer.flush
+    return True
+
 
 async def run_stdio_server(mcp_server: MCPServer) -> None:
     """Run MCP server in stdio mode.
@@ -29,9 +62,9 @@ async def run_stdio_server(mcp_server: MCPServer) -> None:
         extra={"tools": len(mcp_server.tools), "prompts": len(mcp_server.prompts)},
     )
 
-    # Ensure stdout is line-buffered for immediate response delivery
-    if hasattr(sys.stdout, "reconfigure"):
-        sys.stdout.reconfigure(line_buffering=True)  # type: ignore[union-attr]
+    # Bind the binary stdout buffer up front; write_response flushes explicitly
+    # so line buffering is unnecessary
+    _bind_stdout()
 
     try:
         # Read from stdin line by line
@@ -74,7 +107,11 @@ async def run_stdio_server(mcp_server: MCPServer) -> None:
                 logger.info("Received interrupt signal, shutting down")
                 break
             except Exception as e:
-                logger.exception("Error processing stdin request")
+                logger.error(
+                    "Error processing stdin request: %s",
+                    e,
+                    exc_info=logger.isEnabledFor(logging.DEBUG),
+                )
                 # Send error response if we have a request ID
                 error_response = {
                     "jsonrpc": "2.0",
@@ -104,69 +141,52 @@ async def handle_stdio_request(mcp_server: MCPServer, request: dict) -> dict:
     Returns:
         JSON-RPC response dictionary
     """
-    # Handle the request through MCP protocol
-    try:
-        response = mcp_server.handle_jsonrpc(request)
-
-        # If response indicates async method, execute it
-        if response.get("_async"):
-            method = response["method"]
-            params = response["params"]
-            request_id = response["id"]
+    method = request.get("method")
+    request_id = request.get("id")
 
+    # Dispatch async methods directly; handle_jsonrpc covers the sync ones
+    try:
+        if method == "tools/call":
+            params = request.get("params", {})
             try:
-                if method == "tools/call":
-                    result = await mcp_server.call_tool(
-                        params.get("name"), params.get("arguments", {})
-                    )
-                    # Wrap result in MCP content format
-                    # MCP spec requires tool results in content array
-                    result_text = (
-                        json.dumps(result, indent=2) if isinstance(result, dict) else str(result)
-                    )
-                    response = {
-                        "jsonrpc": "2.0",
-                        "id": request_id,
-                        "result": {"content": [{"type": "text", "text": result_text}]},
-                    }
-                elif method == "prompts/get":
-                    messages = await mcp_server.get_prompt(
-                        params.get("name"), params.get("arguments", {})
-                    )
-                    response = {
-                        "jsonrpc": "2.0",
-                        "id": request_id,
-                        "result": {"messages": messages},
-                    }
-                else:
-                    # Unknown async method
-                    response = {
-                        "jsonrpc": "2.0",
-                        "id": request_id,
-                        "error": {"code": -32601, "message": f"Method not found: {method}"},
-                    }
-            except JankinsError as e:
-                response = {"jsonrpc": "2.0", "id": request_id, "error": e.to_dict()}
-            except Exception as e:
-                logger.exception(f"Error executing async method {method}")
-                response = {
+                result = await mcp_server.call_tool(params.get("name"), params.get("arguments", {}))
+                # Wrap result in MCP content format
+                # MCP spec requires tool results in content array
+                result_text = (
+                    orjson.dumps(
+                        result, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+                    ).decode("utf-8")
+                    if isinstance(result, dict)
+                    else str(result)
+                )
+                return {
                     "jsonrpc": "2.0",
                     "id": request_id,
-                    "error": {
-                        "code": -32603,
-                        "message": "Internal error",
-                        "data": {"hint": str(e)},
-                    },
+                    "result": {"content": [{"type": "text", "text": result_text}]},
                 }
+            except JankinsError as e:
+                return {"jsonrpc": "2.0", "id": request_id, "error": e.to_dict()}
+
+        elif method == "prompts/get":
+            params = request.get("params", {})
+            try:
+                messages = await mcp_server.get_prompt(
+                    params.get("name"), params.get("arguments", {})
+                )
+                return {"jsonrpc": "2.0", "id": request_id, "result": {"messages": messages}}
+            except JankinsError as e:
+                return {"jsonrpc": "2.0", "id": request_id, "error": e.to_dict()}
 
-        return response
+        return mcp_server.handle_jsonrpc(request)
 
     except Exception as e:
-        logger.exception("Error handling JSON-RPC request")
+        logger.error(
+            "Error handling JSON-RPC request: %s", e, exc_info=logger.isEnabledFor(logging.DEBUG)
+        )
         return {
             "jsonrpc": "2.0",
             "error": {"code": -32603, "message": "Internal error", "data": {"hint": str(e)}},
-            "id": request.get("id"),
+            "id": request_id,
         }
 
 
@@ -177,12 +197,25 @@ def write_response(response: dict) -> None:
         response: JSON-RPC response dictionary
     """
     try:
-        response_json = json.dumps(response)
+        response_bytes = orjson.dumps(response)
         # Debug: log full response for troubleshooting
         if logger.isEnabledFor(logging.DEBUG):
-            logger.debug(f"Writing to stdout: {response_json}")
-        else:
-            logger.debug(f"Sending response: {response_json[:100]}...")
-        print(response_json, flush=True)
-    except Exception:
-        logger.exception("Error writing response to stdout")
+            logger.debug(f"Writing to stdout: {response_bytes.decode('utf-8')}")
+
+        # Rebind if stdout was swapped out (e.g. by test capture)
+        if sys.stdout is not _out_stream and not _bind_stdout():
+            # Non-binary stream: decode once and write as text
+            sys.stdout.write(response_bytes.decode("utf-8") + "\n")
+            sys.stdout.flush()
+            return
+
+        # Locals narrow the Optional globals; _bind_stdout just bound them
+        write, flush = _out_write, _out_flush
+        assert write is not None and flush is not None
+        write(response_bytes)
+        write(b"\n")
+        flush()
+    except Exception as e:
+        logger.error(
+            "Error writing response to stdout: %s", e, exc_info=logger.isEnabledFor(logging.DEBUG)
+        )
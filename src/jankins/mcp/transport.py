@@ -4,142 +4,249 @@ Provides both HTTP streamable and Server-Sent Events transports
 for MCP protocol communication.
 """
 
-import json
+import asyncio
 import logging
+import time
+from collections.abc import Awaitable, Callable
+from typing import Any
 
-from sse_starlette.sse import EventSourceResponse
+import orjson
+from sse_starlette.sse import EventSourceResponse, ServerSentEvent
 from starlette.applications import Starlette
 from starlette.requests import Request
-from starlette.responses import JSONResponse, Response
+from starlette.responses import Response
 from starlette.routing import Route
 
 from ..config import JankinsConfig
 from ..errors import JankinsError
+from ..metrics import get_metrics_collector
 from .protocol import MCPServer
 
 logger = logging.getLogger(__name__)
 
+# Keepalive settings for SSE connections. The ping is a pre-built
+# comment frame (": ping") — a few bytes on the wire and no JSON
+# re-serialization per heartbeat.
+SSE_PING_INTERVAL_SECONDS = 15
+SSE_SEND_TIMEOUT_SECONDS = 5
+_SSE_PING = ServerSentEvent(comment="ping")
 
-async def handle_mcp_request(request: Request) -> Response:
-    """Handle MCP HTTP request.
 
-    Supports both single requests and streaming.
-    """
-    mcp_server: MCPServer = request.app.state.mcp_server
-    config: JankinsConfig = request.app.state.config
-
-    # Origin validation if enforced
-    if config.origin_enforce:
-        origin = request.headers.get("origin", "")
-        if config.origin_expected and origin != config.origin_expected:
-            return JSONResponse(
-                {
-                    "jsonrpc": "2.0",
-                    "error": {
-                        "code": -32000,
-                        "message": "Origin not allowed",
-                        "data": {"expected": config.origin_expected, "received": origin},
-                    },
-                },
-                status_code=403,
-            )
+def _sse_ping_factory() -> ServerSentEvent:
+    return _SSE_PING
 
-    try:
-        body = await request.json()
-    except json.JSONDecodeError:
-        return JSONResponse(
-            {"jsonrpc": "2.0", "error": {"code": -32700, "message": "Parse error: Invalid JSON"}},
-            status_code=400,
-        )
 
-    # Handle the request
-    try:
-        response = mcp_server.handle_jsonrpc(body)
+def _internal_error_response(request_id: Any = None) -> dict[str, Any]:
+    """Build the generic internal-error JSON-RPC response."""
+    return {
+        "jsonrpc": "2.0",
+        "error": {
+            "code": -32603,
+            "message": "Internal error",
+            "data": {"hint": "Check server logs for details"},
+        },
+        "id": request_id,
+    }
 
-        # If response indicates async method, execute it
-        if response.get("_async"):
-            method = response["method"]
-            params = response["params"]
-            request_id = response["id"]
 
-            try:
-                if method == "tools/call":
-                    result = await mcp_server.call_tool(
-                        params.get("name"), params.get("arguments", {})
-                    )
-                    response = {"jsonrpc": "2.0", "id": request_id, "result": result}
-                elif method == "prompts/get":
-                    messages = await mcp_server.get_prompt(
-                        params.get("name"), params.get("arguments", {})
-                    )
-                    response = {
-                        "jsonrpc": "2.0",
-                        "id": request_id,
-                        "result": {"messages": messages},
-                    }
-            except JankinsError as e:
-                response = {"jsonrpc": "2.0", "id": request_id, "error": e.to_dict()}
-
-        return JSONResponse(response)
-
-    except Exception:
-        logger.exception("Unexpected error handling MCP request")
-        return JSONResponse(
-            {
-                "jsonrpc": "2.0",
-                "error": {
-                    "code": -32603,
-                    "message": "Internal error",
-                    "data": {"hint": "Check server logs for details"},
-                },
-            },
-            status_code=500,
-        )
+class ORJSONResponse(Response):
+    """JSON response rendered with orjson.
+
+    orjson serializes straight to UTF-8 bytes, skipping the stdlib
+    str-then-encode pass that JSONResponse pays on every response.
+    """
+
+    media_type = "application/json"
+
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(content, option=orjson.OPT_NON_STR_KEYS)
 
 
-async def handle_sse(request: Request) -> Response:
-    """Handle MCP SSE request.
+def build_mcp_handler(
+    mcp_server: MCPServer, config: JankinsConfig
+) -> Callable[[Request], Awaitable[Response]]:
+    """Build the /mcp endpoint handler.
 
-    Provides Server-Sent Events endpoint for long-lived connections.
+    The server instance and origin settings are bound as closure locals
+    at route-construction time, so the per-request path skips the
+    app.state and config attribute chains.
     """
-    mcp_server: MCPServer = request.app.state.mcp_server
-    config: JankinsConfig = request.app.state.config
+    origin_enforce = config.origin_enforce
+    origin_expected = config.origin_expected
+    collector = get_metrics_collector()
+
+    async def _handle_single(body: dict) -> dict:
+        """Handle one JSON-RPC request dict.
+
+        Async methods are dispatched directly, sync methods go through
+        handle_jsonrpc.
+        """
+        method = body.get("method")
+        request_id = body.get("id")
+
+        if method == "tools/call":
+            params = body.get("params", {})
+            tool_name = params.get("name")
+
+            # Bracket the call with perf_counter_ns; the shard-based
+            # collector takes no lock on the record path, so the clock
+            # reads never extend any critical section
+            start_ns = time.perf_counter_ns()
+            try:
+                result = await mcp_server.call_tool(tool_name, params.get("arguments", {}))
+            except JankinsError as e:
+                collector.record_request(
+                    tool_name or "unknown",
+                    (time.perf_counter_ns() - start_ns) / 1e6,
+                    success=False,
+                    error_type=type(e).__name__,
+                )
+                return {"jsonrpc": "2.0", "id": request_id, "error": e.to_dict()}
+
+            collector.record_request(
+                tool_name, (time.perf_counter_ns() - start_ns) / 1e6, success=True
+            )
+            return {"jsonrpc": "2.0", "id": request_id, "result": result}
 
-    # Origin validation if enforced
-    if config.origin_enforce:
-        origin = request.headers.get("origin", "")
-        if config.origin_expected and origin != config.origin_expected:
-            return JSONResponse({"error": "Origin not allowed"}, status_code=403)
+        elif method == "prompts/get":
+            params = body.get("params", {})
 
-    async def event_generator():
-        """Generate SSE events."""
-        # Send initial connection event
-        yield {
-            "event": "connected",
-            "data": json.dumps({"server": mcp_server.name, "version": mcp_server.version}),
-        }
+            try:
+                messages = await mcp_server.get_prompt(
+                    params.get("name"), params.get("arguments", {})
+                )
+            except JankinsError as e:
+                return {"jsonrpc": "2.0", "id": request_id, "error": e.to_dict()}
+            return {"jsonrpc": "2.0", "id": request_id, "result": {"messages": messages}}
+
+        return mcp_server.handle_jsonrpc(body)
+
+    async def handle_mcp_request(request: Request) -> Response:
+        """Handle MCP HTTP request.
+
+        Supports both single requests and streaming.
+        """
+        # Origin validation if enforced
+        if origin_enforce:
+            origin = request.headers.get("origin", "")
+            if origin_expected and origin != origin_expected:
+                return ORJSONResponse(
+                    {
+                        "jsonrpc": "2.0",
+                        "error": {
+                            "code": -32000,
+                            "message": "Origin not allowed",
+                            "data": {"expected": origin_expected, "received": origin},
+                        },
+                    },
+                    status_code=403,
+                )
 
-        # In a real implementation, this would handle bidirectional
-        # communication. For now, we keep the connection alive.
-        # Clients can POST to /mcp for requests.
+        try:
+            body = orjson.loads(await request.body())
+        except orjson.JSONDecodeError:
+            return ORJSONResponse(
+                {
+                    "jsonrpc": "2.0",
+                    "error": {"code": -32700, "message": "Parse error: Invalid JSON"},
+                },
+                status_code=400,
+            )
+
+        # JSON-RPC batch: dispatch items concurrently so awaits on
+        # call_tool/get_prompt overlap instead of paying one HTTP round
+        # trip per call
+        if isinstance(body, list):
+            results = await asyncio.gather(
+                *(_handle_single(item) for item in body), return_exceptions=True
+            )
+            responses = []
+            for result in results:
+                if isinstance(result, BaseException):
+                    logger.exception("Unexpected error handling MCP batch item", exc_info=result)
+                    responses.append(_internal_error_response())
+                else:
+                    responses.append(result)
+            return ORJSONResponse(responses)
+
+        try:
+            return ORJSONResponse(await _handle_single(body))
+        except Exception:
+            logger.exception("Unexpected error handling MCP request")
+            return ORJSONResponse(_internal_error_response(), status_code=500)
+
+    return handle_mcp_request
+
+
+def build_sse_handler(
+    mcp_server: MCPServer, config: JankinsConfig
+) -> Callable[[Request], Awaitable[Response]]:
+    """Build the /sse endpoint handler.
+
+    The hello payload and the constant 403 body are serialized once here
+    instead of per connection.
+    """
+    origin_enforce = config.origin_enforce
+    origin_expected = config.origin_expected
+    origin_403_body = orjson.dumps({"error": "Origin not allowed"})
+    connected_data = orjson.dumps(
+        {"server": mcp_server.name, "version": mcp_server.version}
+    ).decode("utf-8")
+
+    async def handle_sse(request: Request) -> Response:
+        """Handle MCP SSE request.
+
+        Provides Server-Sent Events endpoint for long-lived connections.
+        """
+        # Origin validation if enforced
+        if origin_enforce:
+            origin = request.headers.get("origin", "")
+            if origin_expected and origin != origin_expected:
+                return Response(
+                    content=origin_403_body, status_code=403, media_type="application/json"
+                )
+
+        async def event_generator():
+            """Generate SSE events."""
+            # Send initial connection event
+            yield {
+                "event": "connected",
+                "data": connected_data,
+            }
+
+            # In a real implementation, this would handle bidirectional
+            # communication. For now, we hold the connection open (the
+            # response's own ping loop handles keepalives) so clients
+            # don't thrash through reconnects.
+            # Clients can POST to /mcp for requests.
+            while not await request.is_disconnected():
+                await asyncio.sleep(SSE_PING_INTERVAL_SECONDS)
+
+        return EventSourceResponse(
+            event_generator(),
+            ping=SSE_PING_INTERVAL_SECONDS,
+            ping_message_factory=_sse_ping_factory,
+            send_timeout=SSE_SEND_TIMEOUT_SECONDS,
+        )
 
-    return EventSourceResponse(event_generator())
+    return handle_sse
 
 
-async def handle_health(request: Request) -> JSONResponse:
+async def handle_health(request: Request) -> ORJSONResponse:
     """Health check endpoint."""
-    return JSONResponse({"status": "ok"})
+    return ORJSONResponse({"status": "ok"})
 
 
-async def handle_ready(request: Request) -> JSONResponse:
+async def handle_ready(request: Request) -> ORJSONResponse:
     """Readiness check endpoint."""
     # Could check Jenkins connectivity here
-    return JSONResponse({"status": "ready"})
+    return ORJSONResponse({"status": "ready"})
 
 
 async def handle_metrics(request: Request) -> Response:
-    """Metrics endpoint (placeholder for Prometheus)."""
-    return Response(content="# Metrics not yet implemented\n", media_type="text/plain")
+    """Prometheus metrics endpoint."""
+    collector = get_metrics_collector()
+    return Response(content=collector.export_prometheus(), media_type="text/plain; version=0.0.4")
 
 
 def create_transport(
@@ -156,7 +263,7 @@ def create_transport(
         Starlette application
     """
     routes = [
-        Route("/mcp", handle_mcp_request, methods=["POST"]),
+        Route("/mcp", build_mcp_handler(mcp_server, config), methods=["POST"]),
         Route("/_health", handle_health, methods=["GET"]),
         Route("/_ready", handle_ready, methods=["GET"]),
         Route("/_metrics", handle_metrics, methods=["GET"]),
@@ -164,7 +271,7 @@ def create_transport(
 
     # Add SSE endpoint if requested
     if transport_type == "sse":
-        routes.append(Route("/sse", handle_sse, methods=["GET"]))
+        routes.append(Route("/sse", build_sse_handler(mcp_server, config), methods=["GET"]))
 
     app = Starlette(debug=False, routes=routes)
 
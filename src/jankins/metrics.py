@@ -3,16 +3,67 @@
 Tracks request counts, durations, errors, and Jenkins API calls.
 """
 
+import heapq
 import logging
 import time
-from collections import Counter
+from collections import Counter, deque
 from dataclasses import dataclass, field
-from threading import Lock
+from operator import itemgetter
+from threading import Lock, local
 
 logger = logging.getLogger(__name__)
 
-
-@dataclass
+# Tool-call/error records buffered per shard before a batched
+# Counter.update flush
+_PENDING_BATCH_SIZE = 64
+
+# Constant HELP/TYPE header blocks for the Prometheus exposition format,
+# built once at import instead of re-appended line by line on every scrape
+# Escape table for Prometheus label values (spec requires escaping
+# backslash, double quote and newline); str.translate runs the whole
+# value through a single C loop
+_PROM_ESCAPE = str.maketrans({"\\": "\\\\", '"': '\\"', "\n": "\\n"})
+
+_PROM_HEADER_UPTIME = (
+    "# HELP jankins_uptime_seconds Server uptime in seconds\n# TYPE jankins_uptime_seconds gauge"
+)
+_PROM_HEADER_REQUESTS = (
+    "# HELP jankins_requests_total Total number of requests\n# TYPE jankins_requests_total counter"
+)
+_PROM_HEADER_REQUESTS_SUCCESS = (
+    "# HELP jankins_requests_success_total Successful requests\n"
+    "# TYPE jankins_requests_success_total counter"
+)
+_PROM_HEADER_REQUESTS_FAILED = (
+    "# HELP jankins_requests_failed_total Failed requests\n"
+    "# TYPE jankins_requests_failed_total counter"
+)
+_PROM_HEADER_DURATION = (
+    "# HELP jankins_request_duration_ms Request duration in milliseconds\n"
+    "# TYPE jankins_request_duration_ms summary"
+)
+_PROM_HEADER_TOOL_CALLS = (
+    "# HELP jankins_tool_calls_total Tool calls by name\n# TYPE jankins_tool_calls_total counter"
+)
+_PROM_HEADER_TOOL_ERRORS = (
+    "# HELP jankins_tool_errors_total Tool errors by name and type\n"
+    "# TYPE jankins_tool_errors_total counter"
+)
+_PROM_HEADER_JENKINS_CALLS = (
+    "# HELP jankins_jenkins_calls_total Jenkins API calls\n"
+    "# TYPE jankins_jenkins_calls_total counter"
+)
+_PROM_HEADER_JENKINS_ERRORS = (
+    "# HELP jankins_jenkins_errors_total Jenkins API errors\n"
+    "# TYPE jankins_jenkins_errors_total counter"
+)
+_PROM_HEADER_RATE_LIMIT = (
+    "# HELP jankins_rate_limit_hits_total Rate limit violations\n"
+    "# TYPE jankins_rate_limit_hits_total counter"
+)
+
+
+@dataclass(slots=True)
 class MetricsSummary:
     """Summary of server metrics."""
 
@@ -21,7 +72,7 @@ class MetricsSummary:
     successful_requests: int = 0
     failed_requests: int = 0
 
-    # Tool call metrics
+    # Tool call metrics; tool_errors is keyed by (tool, error_type) tuples
     tool_calls: Counter = field(default_factory=Counter)
     tool_errors: Counter = field(default_factory=Counter)
 
@@ -38,13 +89,14 @@ class MetricsSummary:
     # Rate limit metrics
     rate_limit_hits: int = 0
 
-    # Uptime
-    start_time: float = field(default_factory=time.time)
+    # Uptime, measured on the monotonic clock so it never jumps
+    # under NTP adjustments
+    start_time: float = field(default_factory=time.monotonic)
 
     @property
     def uptime_seconds(self) -> float:
         """Calculate uptime in seconds."""
-        return time.time() - self.start_time
+        return time.monotonic() - self.start_time
 
     @property
     def success_rate(self) -> float:
@@ -54,6 +106,54 @@ class MetricsSummary:
         return (self.successful_requests / self.total_requests) * 100
 
 
+class _MetricsShard:
+    """Per-thread metrics accumulator.
+
+    Each worker thread owns one shard and writes to it without taking any
+    lock; readers aggregate all shards under the collector lock at export
+    time. This keeps the request path free of lock contention.
+    """
+
+    __slots__ = (
+        "total_requests",
+        "successful_requests",
+        "failed_requests",
+        "tool_calls",
+        "tool_errors",
+        "total_duration_ms",
+        "min_duration_ms",
+        "max_duration_ms",
+        "jenkins_calls",
+        "jenkins_errors",
+        "rate_limit_hits",
+        "durations",
+        "version",
+        "pending_tools",
+        "pending_errors",
+    )
+
+    def __init__(self):
+        self.total_requests = 0
+        self.successful_requests = 0
+        self.failed_requests = 0
+        self.tool_calls = Counter()
+        self.tool_errors = Counter()
+        self.total_duration_ms = 0.0
+        self.min_duration_ms = float("inf")
+        self.max_duration_ms = 0.0
+        self.jenkins_calls = 0
+        self.jenkins_errors = 0
+        self.rate_limit_hits = 0
+        self.durations: deque[float] = deque(maxlen=1000)
+        # Bumped on every duration write; used to invalidate the
+        # read-side sorted cache
+        self.version = 0
+        # Recent tool names/errors buffered as lists and folded into the
+        # Counters in one C-level Counter.update call per batch
+        self.pending_tools: list[str] = []
+        self.pending_errors: list[tuple[str, str]] = []
+
+
 class MetricsCollector:
     """Collector for Prometheus-style metrics.
 
@@ -66,12 +166,68 @@ class MetricsCollector:
 
     def __init__(self):
         """Initialize metrics collector."""
-        self.summary = MetricsSummary()
-        self._durations: list[float] = []
+        self._start_time = time.monotonic()
+        self._thread_local = local()
+        self._shards: list[_MetricsShard] = []
+        # Guards shard registration and read-side aggregation only;
+        # the record path never takes it
         self._lock = Lock()
+        # Sorted merge of shard durations, reused until the next write
+        self._sorted_durations: list[float] | None = None
+        self._sorted_version = -1
 
         logger.info("Metrics collector initialized")
 
+    def _shard(self) -> _MetricsShard:
+        """Get this thread's shard, registering it on first use."""
+        shard = getattr(self._thread_local, "shard", None)
+        if shard is None:
+            shard = _MetricsShard()
+            with self._lock:
+                self._shards.append(shard)
+            self._thread_local.shard = shard
+        return shard
+
+    @property
+    def summary(self) -> MetricsSummary:
+        """Aggregate all shards into a point-in-time summary."""
+        with self._lock:
+            return self._aggregate()
+
+    @property
+    def _durations(self) -> list[float]:
+        """Merged view of recent durations across all shards."""
+        return [d for shard in self._shards for d in shard.durations]
+
+    def _aggregate(self) -> MetricsSummary:
+        """Fold per-thread shards into a single summary (caller holds lock)."""
+        summary = MetricsSummary(start_time=self._start_time)
+
+        for shard in self._shards:
+            summary.total_requests += shard.total_requests
+            summary.successful_requests += shard.successful_requests
+            summary.failed_requests += shard.failed_requests
+            summary.tool_calls.update(shard.tool_calls)
+            summary.tool_errors.update(shard.tool_errors)
+            # Fold in buffered entries the owner thread hasn't flushed yet
+            if shard.pending_tools:
+                summary.tool_calls.update(shard.pending_tools)
+            if shard.pending_errors:
+                summary.tool_errors.update(shard.pending_errors)
+            summary.total_duration_ms += shard.total_duration_ms
+            if shard.min_duration_ms < summary.min_duration_ms:
+                summary.min_duration_ms = shard.min_duration_ms
+            if shard.max_duration_ms > summary.max_duration_ms:
+                summary.max_duration_ms = shard.max_duration_ms
+            summary.jenkins_calls += shard.jenkins_calls
+            summary.jenkins_errors += shard.jenkins_errors
+            summary.rate_limit_hits += shard.rate_limit_hits
+
+        if summary.total_requests > 0:
+            summary.avg_duration_ms = summary.total_duration_ms / summary.total_requests
+
+        return summary
+
     def record_request(
         self, tool_name: str, duration_ms: float, success: bool, error_type: str = None
     ) -> None:
@@ -83,34 +239,37 @@ class MetricsCollector:
             success: Whether request was successful
             error_type: Type of error if failed
         """
-        with self._lock:
-            self.summary.total_requests += 1
-
-            if success:
-                self.summary.successful_requests += 1
-            else:
-                self.summary.failed_requests += 1
-                if error_type:
-                    self.summary.tool_errors[f"{tool_name}:{error_type}"] += 1
-
-            # Track tool usage
-            self.summary.tool_calls[tool_name] += 1
-
-            # Track duration
-            self.summary.total_duration_ms += duration_ms
-            self.summary.min_duration_ms = min(self.summary.min_duration_ms, duration_ms)
-            self.summary.max_duration_ms = max(self.summary.max_duration_ms, duration_ms)
-
-            # Keep last 1000 durations for percentile calculation
-            self._durations.append(duration_ms)
-            if len(self._durations) > 1000:
-                self._durations.pop(0)
-
-            # Update average
-            if self.summary.total_requests > 0:
-                self.summary.avg_duration_ms = (
-                    self.summary.total_duration_ms / self.summary.total_requests
-                )
+        shard = self._shard()
+        shard.total_requests += 1
+
+        if success:
+            shard.successful_requests += 1
+        else:
+            shard.failed_requests += 1
+            if error_type:
+                # Tuple keys avoid an f-string build per failure and a
+                # split at export time
+                shard.pending_errors.append((tool_name, error_type))
+                if len(shard.pending_errors) >= _PENDING_BATCH_SIZE:
+                    shard.tool_errors.update(shard.pending_errors)
+                    shard.pending_errors.clear()
+
+        # Track tool usage; buffered and folded in batches
+        shard.pending_tools.append(tool_name)
+        if len(shard.pending_tools) >= _PENDING_BATCH_SIZE:
+            shard.tool_calls.update(shard.pending_tools)
+            shard.pending_tools.clear()
+
+        # Track duration
+        shard.total_duration_ms += duration_ms
+        if duration_ms < shard.min_duration_ms:
+            shard.min_duration_ms = duration_ms
+        if duration_ms > shard.max_duration_ms:
+            shard.max_duration_ms = duration_ms
+
+        # Keep last 1000 durations per shard for percentile calculation
+        shard.durations.append(duration_ms)
+        shard.version += 1
 
     def record_jenkins_call(self, success: bool = True) -> None:
         """Record a Jenkins API call.
@@ -118,15 +277,14 @@ class MetricsCollector:
         Args:
             success: Whether the call was successful
         """
-        with self._lock:
-            self.summary.jenkins_calls += 1
-            if not success:
-                self.summary.jenkins_errors += 1
+        shard = self._shard()
+        shard.jenkins_calls += 1
+        if not success:
+            shard.jenkins_errors += 1
 
     def record_rate_limit_hit(self) -> None:
         """Record a rate limit violation."""
-        with self._lock:
-            self.summary.rate_limit_hits += 1
+        self._shard().rate_limit_hits += 1
 
     def get_percentile(self, percentile: float) -> float:
         """Calculate duration percentile.
@@ -138,13 +296,7 @@ class MetricsCollector:
             Duration at percentile in milliseconds
         """
         with self._lock:
-            if not self._durations:
-                return 0.0
-
-            sorted_durations = sorted(self._durations)
-            index = int(len(sorted_durations) * (percentile / 100))
-            index = min(index, len(sorted_durations) - 1)
-            return sorted_durations[index]
+            return self._calculate_percentile(percentile)
 
     def _calculate_percentile(self, percentile: float) -> float:
         """Calculate duration percentile without locking.
@@ -155,13 +307,33 @@ class MetricsCollector:
         Returns:
             Duration at percentile in milliseconds
         """
-        if not self._durations:
-            return 0.0
+        return self._calculate_percentiles((percentile,))[0]
 
-        sorted_durations = sorted(self._durations)
-        index = int(len(sorted_durations) * (percentile / 100))
-        index = min(index, len(sorted_durations) - 1)
-        return sorted_durations[index]
+    def _calculate_percentiles(self, percentiles: tuple[float, ...]) -> list[float]:
+        """Resolve several percentiles against one merged sort.
+
+        The summary and Prometheus paths both need p50/p95/p99; one
+        merge and three index lookups beat three separate passes.
+        Caller holds the lock.
+        """
+        sorted_durations = self._merged_sorted_durations()
+        if not sorted_durations:
+            return [0.0] * len(percentiles)
+
+        last = len(sorted_durations) - 1
+        return [
+            sorted_durations[min(int(len(sorted_durations) * (p / 100)), last)] for p in percentiles
+        ]
+
+    def _merged_sorted_durations(self) -> list[float]:
+        """Merge and sort shard durations, reusing the cached sort when clean."""
+        version = sum(shard.version for shard in self._shards)
+        if self._sorted_durations is None or version != self._sorted_version:
+            merged = [d for shard in self._shards for d in shard.durations]
+            merged.sort()
+            self._sorted_durations = merged
+            self._sorted_version = version
+        return self._sorted_durations
 
     def get_summary(self) -> dict:
         """Get metrics summary.
@@ -170,43 +342,50 @@ class MetricsCollector:
             Dictionary with metrics summary
         """
         with self._lock:
-            p50 = self._calculate_percentile(50)
-            p95 = self._calculate_percentile(95)
-            p99 = self._calculate_percentile(99)
+            summary = self._aggregate()
+            p50, p95, p99 = self._calculate_percentiles((50, 95, 99))
 
             return {
-                "uptime_seconds": round(self.summary.uptime_seconds, 2),
+                "uptime_seconds": round(summary.uptime_seconds, 2),
                 "requests": {
-                    "total": self.summary.total_requests,
-                    "successful": self.summary.successful_requests,
-                    "failed": self.summary.failed_requests,
-                    "success_rate": round(self.summary.success_rate, 2),
+                    "total": summary.total_requests,
+                    "successful": summary.successful_requests,
+                    "failed": summary.failed_requests,
+                    "success_rate": round(summary.success_rate, 2),
                 },
                 "duration_ms": {
-                    "avg": round(self.summary.avg_duration_ms, 2),
-                    "min": round(self.summary.min_duration_ms, 2)
-                    if self.summary.min_duration_ms != float("inf")
+                    "avg": round(summary.avg_duration_ms, 2),
+                    "min": round(summary.min_duration_ms, 2)
+                    if summary.min_duration_ms != float("inf")
                     else 0,
-                    "max": round(self.summary.max_duration_ms, 2),
+                    "max": round(summary.max_duration_ms, 2),
                     "p50": round(p50, 2),
                     "p95": round(p95, 2),
                     "p99": round(p99, 2),
                 },
                 "tools": {
-                    "top_calls": dict(self.summary.tool_calls.most_common(10)),
-                    "top_errors": dict(self.summary.tool_errors.most_common(10)),
+                    # nlargest avoids most_common's full sorted intermediate
+                    "top_calls": dict(
+                        heapq.nlargest(10, summary.tool_calls.items(), key=itemgetter(1))
+                    ),
+                    "top_errors": {
+                        f"{tool}:{error_type}": count
+                        for (tool, error_type), count in heapq.nlargest(
+                            10, summary.tool_errors.items(), key=itemgetter(1)
+                        )
+                    },
                 },
                 "jenkins": {
-                    "calls": self.summary.jenkins_calls,
-                    "errors": self.summary.jenkins_errors,
+                    "calls": summary.jenkins_calls,
+                    "errors": summary.jenkins_errors,
                     "error_rate": round(
-                        (self.summary.jenkins_errors / self.summary.jenkins_calls * 100)
-                        if self.summary.jenkins_calls > 0
+                        (summary.jenkins_errors / summary.jenkins_calls * 100)
+                        if summary.jenkins_calls > 0
                         else 0,
                         2,
                     ),
                 },
-                "rate_limiting": {"hits": self.summary.rate_limit_hits},
+                "rate_limiting": {"hits": summary.rate_limit_hits},
             }
 
     def export_prometheus(self) -> str:
@@ -216,73 +395,48 @@ class MetricsCollector:
             Prometheus-formatted metrics string
         """
         with self._lock:
-            lines = []
-
-            # Uptime
-            lines.append("# HELP jankins_uptime_seconds Server uptime in seconds")
-            lines.append("# TYPE jankins_uptime_seconds gauge")
-            lines.append(f"jankins_uptime_seconds {self.summary.uptime_seconds:.2f}")
-
-            # Total requests
-            lines.append("# HELP jankins_requests_total Total number of requests")
-            lines.append("# TYPE jankins_requests_total counter")
-            lines.append(f"jankins_requests_total {self.summary.total_requests}")
-
-            # Successful requests
-            lines.append("# HELP jankins_requests_success_total Successful requests")
-            lines.append("# TYPE jankins_requests_success_total counter")
-            lines.append(f"jankins_requests_success_total {self.summary.successful_requests}")
-
-            # Failed requests
-            lines.append("# HELP jankins_requests_failed_total Failed requests")
-            lines.append("# TYPE jankins_requests_failed_total counter")
-            lines.append(f"jankins_requests_failed_total {self.summary.failed_requests}")
-
-            # Request duration
-            lines.append("# HELP jankins_request_duration_ms Request duration in milliseconds")
-            lines.append("# TYPE jankins_request_duration_ms summary")
-            lines.append(f"jankins_request_duration_ms_sum {self.summary.total_duration_ms:.2f}")
-            lines.append(f"jankins_request_duration_ms_count {self.summary.total_requests}")
-            lines.append(
-                f'jankins_request_duration_ms{{quantile="0.5"}} {self._calculate_percentile(50):.2f}'
-            )
-            lines.append(
-                f'jankins_request_duration_ms{{quantile="0.95"}} {self._calculate_percentile(95):.2f}'
-            )
-            lines.append(
-                f'jankins_request_duration_ms{{quantile="0.99"}} {self._calculate_percentile(99):.2f}'
-            )
+            summary = self._aggregate()
+            p50, p95, p99 = self._calculate_percentiles((50, 95, 99))
+
+            lines = [
+                _PROM_HEADER_UPTIME,
+                f"jankins_uptime_seconds {summary.uptime_seconds:.2f}",
+                _PROM_HEADER_REQUESTS,
+                f"jankins_requests_total {summary.total_requests}",
+                _PROM_HEADER_REQUESTS_SUCCESS,
+                f"jankins_requests_success_total {summary.successful_requests}",
+                _PROM_HEADER_REQUESTS_FAILED,
+                f"jankins_requests_failed_total {summary.failed_requests}",
+                _PROM_HEADER_DURATION,
+                f"jankins_request_duration_ms_sum {summary.total_duration_ms:.2f}",
+                f"jankins_request_duration_ms_count {summary.total_requests}",
+                f'jankins_request_duration_ms{{quantile="0.5"}} {p50:.2f}',
+                f'jankins_request_duration_ms{{quantile="0.95"}} {p95:.2f}',
+                f'jankins_request_duration_ms{{quantile="0.99"}} {p99:.2f}',
+            ]
 
             # Tool calls by name
-            lines.append("# HELP jankins_tool_calls_total Tool calls by name")
-            lines.append("# TYPE jankins_tool_calls_total counter")
-            for tool_name, count in self.summary.tool_calls.items():
-                lines.append(f'jankins_tool_calls_total{{tool="{tool_name}"}} {count}')
+            lines.append(_PROM_HEADER_TOOL_CALLS)
+            for tool_name, count in summary.tool_calls.items():
+                tn = tool_name.translate(_PROM_ESCAPE)
+                lines.append(f'jankins_tool_calls_total{{tool="{tn}"}} {count}')
 
             # Tool errors
-            lines.append("# HELP jankins_tool_errors_total Tool errors by name and type")
-            lines.append("# TYPE jankins_tool_errors_total counter")
-            for error_key, count in self.summary.tool_errors.items():
-                tool, error_type = (
-                    error_key.split(":", 1) if ":" in error_key else (error_key, "unknown")
-                )
+            lines.append(_PROM_HEADER_TOOL_ERRORS)
+            for (tool, error_type), count in summary.tool_errors.items():
+                tool = tool.translate(_PROM_ESCAPE)
+                error_type = error_type.translate(_PROM_ESCAPE)
                 lines.append(
                     f'jankins_tool_errors_total{{tool="{tool}",error_type="{error_type}"}} {count}'
                 )
 
-            # Jenkins API calls
-            lines.append("# HELP jankins_jenkins_calls_total Jenkins API calls")
-            lines.append("# TYPE jankins_jenkins_calls_total counter")
-            lines.append(f"jankins_jenkins_calls_total {self.summary.jenkins_calls}")
-
-            lines.append("# HELP jankins_jenkins_errors_total Jenkins API errors")
-            lines.append("# TYPE jankins_jenkins_errors_total counter")
-            lines.append(f"jankins_jenkins_errors_total {self.summary.jenkins_errors}")
-
-            # Rate limit hits
-            lines.append("# HELP jankins_rate_limit_hits_total Rate limit violations")
-            lines.append("# TYPE jankins_rate_limit_hits_total counter")
-            lines.append(f"jankins_rate_limit_hits_total {self.summary.rate_limit_hits}")
+            # Jenkins API calls and rate limit hits
+            lines.append(_PROM_HEADER_JENKINS_CALLS)
+            lines.append(f"jankins_jenkins_calls_total {summary.jenkins_calls}")
+            lines.append(_PROM_HEADER_JENKINS_ERRORS)
+            lines.append(f"jankins_jenkins_errors_total {summary.jenkins_errors}")
+            lines.append(_PROM_HEADER_RATE_LIMIT)
+            lines.append(f"jankins_rate_limit_hits_total {summary.rate_limit_hits}")
 
             return "\n".join(lines) + "\n"
 
@@ -1,65 +1,105 @@
 """Rate limiting middleware for MCP requests."""
 
+import base64
 import logging
 import time
-from dataclasses import dataclass, field
+from functools import lru_cache
+from threading import Lock
 from typing import Any
 
+import orjson
+from cachetools import TTLCache
 from starlette.middleware.base import BaseHTTPMiddleware
 from starlette.requests import Request
-from starlette.responses import JSONResponse
+from starlette.responses import Response
 
 logger = logging.getLogger(__name__)
 
+# Number of lock stripes guarding the bucket map; must be a power of two
+_STRIPE_COUNT = 64
+
+# Paths exempt from rate limiting; frozenset gives an O(1) allocation-free
+# membership check on the hot path
+_SKIP_PATHS = frozenset({"/_health", "/_ready", "/_metrics"})
+
+
+@lru_cache(maxsize=1024)
+def _parse_basic_auth(auth_header: str) -> str | None:
+    """Extract the username from a Basic auth header.
+
+    A client sends the identical header on every request, so cache the
+    decode: repeat requests become a dict lookup instead of a base64
+    decode + split.
+
+    Args:
+        auth_header: Raw Authorization header value
+
+    Returns:
+        Username, or None if the header isn't usable Basic auth
+    """
+    if not auth_header.startswith("Basic "):
+        return None
+    try:
+        decoded = base64.b64decode(auth_header[6:]).decode("utf-8")
+        return decoded.split(":", 1)[0] or None
+    except Exception:
+        return None
+
 
-@dataclass
 class RateLimitBucket:
-    """Token bucket for rate limiting."""
+    """Token bucket for rate limiting.
 
-    capacity: int  # Maximum tokens
-    refill_rate: float  # Tokens per second
-    tokens: float = field(init=False)
-    last_refill: float = field(init=False)
+    A plain __slots__ class rather than a dataclass: one bucket exists per
+    client identifier, so dropping the per-instance __dict__ cuts memory
+    roughly 3x and speeds up attribute access on the hot path.
+    """
 
-    def __post_init__(self):
-        self.tokens = float(self.capacity)
-        self.last_refill = time.time()
+    __slots__ = ("capacity", "refill_rate", "tokens", "last_refill")
 
-    def consume(self, tokens: int = 1) -> bool:
+    def __init__(self, capacity: int, refill_rate: float):
+        self.capacity = capacity  # Maximum tokens
+        self.refill_rate = refill_rate  # Tokens per second
+        self.tokens = float(capacity)
+        self.last_refill = time.monotonic()
+
+    def consume(self, tokens: int = 1, now: float | None = None) -> bool:
         """Try to consume tokens from bucket.
 
         Args:
             tokens: Number of tokens to consume
+            now: Monotonic timestamp to refill against; read if not given
 
         Returns:
             True if tokens were consumed, False if insufficient
         """
-        self._refill()
+        self._refill(now)
 
         if self.tokens >= tokens:
             self.tokens -= tokens
             return True
         return False
 
-    def _refill(self) -> None:
+    def _refill(self, now: float | None = None) -> None:
         """Refill tokens based on elapsed time."""
-        now = time.time()
+        if now is None:
+            now = time.monotonic()
         elapsed = now - self.last_refill
         self.last_refill = now
 
         # Add tokens based on elapsed time
         self.tokens = min(self.capacity, self.tokens + (elapsed * self.refill_rate))
 
-    def time_until_available(self, tokens: int = 1) -> float:
+    def time_until_available(self, tokens: int = 1, now: float | None = None) -> float:
         """Calculate seconds until enough tokens available.
 
         Args:
             tokens: Number of tokens needed
+            now: Monotonic timestamp to refill against; read if not given
 
         Returns:
             Seconds until tokens available, 0 if already available
         """
-        self._refill()
+        self._refill(now)
 
         if self.tokens >= tokens:
             return 0.0
@@ -71,8 +111,10 @@ class RateLimitBucket:
 class RateLimiter:
     """Rate limiter using token bucket algorithm.
 
-    Supports per-user and global rate limiting with configurable
-    limits and cleanup of old buckets.
+    Supports per-user and global rate limiting with configurable limits.
+    Idle buckets are evicted lazily by a TTL cache, so no periodic
+    cleanup scan is needed and memory stays bounded even under a flood
+    of unique identifiers.
     """
 
     def __init__(
@@ -86,16 +128,26 @@ class RateLimiter:
         Args:
             requests_per_minute: Sustained requests per minute
             burst: Maximum burst size
-            cleanup_interval: Seconds between bucket cleanup
+            cleanup_interval: Base for bucket TTL (buckets idle for twice
+                this many seconds are evicted)
         """
         self.requests_per_minute = requests_per_minute
         self.burst = burst
         self.refill_rate = requests_per_minute / 60.0  # Convert to per-second
 
-        # User/IP -> RateLimitBucket
-        self.buckets: dict[str, RateLimitBucket] = {}
-        self.last_cleanup = time.time()
+        # User/IP -> RateLimitBucket; TTLCache evicts idle entries lazily
+        # on access (amortized O(1)) instead of a periodic O(N) scan, and
+        # bounds memory under unique-identifier floods
         self.cleanup_interval = cleanup_interval
+        self.buckets: TTLCache[str, RateLimitBucket] = TTLCache(
+            maxsize=100_000, ttl=cleanup_interval * 2
+        )
+        self._buckets_lock = Lock()
+
+        # Striped locks: concurrent requests from the same identifier must
+        # not race on bucket.tokens, but a single global lock would
+        # serialize all clients. Stripe by identifier hash instead.
+        self._stripe_locks = [Lock() for _ in range(_STRIPE_COUNT)]
 
         logger.info(f"Rate limiter initialized: {requests_per_minute} req/min, burst={burst}")
 
@@ -109,48 +161,35 @@ class RateLimiter:
             Tuple of (allowed: bool, retry_after: Optional[float])
             retry_after is seconds to wait if not allowed
         """
-        self._cleanup_old_buckets()
-
-        # Get or create bucket for this identifier
-        if identifier not in self.buckets:
-            self.buckets[identifier] = RateLimitBucket(
-                capacity=self.burst, refill_rate=self.refill_rate
-            )
-
-        bucket = self.buckets[identifier]
-
-        # Try to consume a token
-        if bucket.consume(1):
-            return (True, None)
-        else:
-            retry_after = bucket.time_until_available(1)
-            logger.warning(
-                f"Rate limit exceeded for {identifier}", extra={"retry_after": retry_after}
-            )
-            return (False, retry_after)
-
-    def _cleanup_old_buckets(self) -> None:
-        """Remove inactive buckets to prevent memory leaks."""
-        now = time.time()
-
-        if now - self.last_cleanup < self.cleanup_interval:
-            return
-
-        # Remove buckets that are full and haven't been used recently
-        inactive_threshold = now - (self.cleanup_interval * 2)
-        to_remove = []
-
-        for identifier, bucket in self.buckets.items():
-            if bucket.tokens >= bucket.capacity and bucket.last_refill < inactive_threshold:
-                to_remove.append(identifier)
-
-        for identifier in to_remove:
-            del self.buckets[identifier]
-
-        if to_remove:
-            logger.debug(f"Cleaned up {len(to_remove)} inactive rate limit buckets")
-
-        self.last_cleanup = now
+        # TTLCache internals aren't thread-safe, so map access takes its
+        # own short-lived lock; token math stays on the stripes
+        with self._buckets_lock:
+            bucket = self.buckets.get(identifier)
+            if bucket is None:
+                bucket = self.buckets[identifier] = RateLimitBucket(
+                    capacity=self.burst, refill_rate=self.refill_rate
+                )
+
+        with self._lock_for(identifier):
+            # Read the clock once for both the consume and the retry estimate
+            now = time.monotonic()
+            if bucket.consume(1, now=now):
+                return (True, None)
+            else:
+                retry_after = bucket.time_until_available(1, now=now)
+                logger.warning(
+                    f"Rate limit exceeded for {identifier}", extra={"retry_after": retry_after}
+                )
+                return (False, retry_after)
+
+    def _lock_for(self, identifier: str) -> Lock:
+        """Get the lock stripe guarding this identifier's bucket."""
+        return self._stripe_locks[hash(identifier) & (_STRIPE_COUNT - 1)]
+
+    def get_bucket(self, identifier: str) -> RateLimitBucket | None:
+        """Look up an identifier's bucket without creating one."""
+        with self._buckets_lock:
+            return self.buckets.get(identifier)
 
     def get_stats(self) -> dict[str, Any]:
         """Get rate limiter statistics.
@@ -158,6 +197,9 @@ class RateLimiter:
         Returns:
             Dictionary with stats
         """
+        with self._buckets_lock:
+            top_buckets = list(self.buckets.items())[:10]  # Top 10
+
         return {
             "active_buckets": len(self.buckets),
             "requests_per_minute": self.requests_per_minute,
@@ -168,7 +210,7 @@ class RateLimiter:
                     "capacity": bucket.capacity,
                     "last_refill": bucket.last_refill,
                 }
-                for identifier, bucket in list(self.buckets.items())[:10]  # Top 10
+                for identifier, bucket in top_buckets
             },
         }
 
@@ -188,6 +230,30 @@ class RateLimitMiddleware(BaseHTTPMiddleware):
         self.rate_limiter = rate_limiter
         self.enabled = enabled
 
+        # Static parts of the 429 headers; only Retry-After varies
+        self._429_headers_base = {
+            "X-RateLimit-Limit": str(rate_limiter.requests_per_minute),
+            "X-RateLimit-Remaining": "0",
+        }
+
+        # Pre-serialized 429 body with byte markers for the two dynamic
+        # fields; splicing bytes skips the per-denial dict build + encode
+        self._429_template = orjson.dumps(
+            {
+                "jsonrpc": "2.0",
+                "error": {
+                    "code": -32000,  # Server error
+                    "message": "Rate limit exceeded",
+                    "data": {
+                        "retry_after": "__RA__",
+                        "limit": rate_limiter.requests_per_minute,
+                        "identifier": "__ID__",
+                    },
+                },
+                "id": None,
+            }
+        )
+
     async def dispatch(self, request: Request, call_next):
         """Process request with rate limiting.
 
@@ -202,7 +268,7 @@ class RateLimitMiddleware(BaseHTTPMiddleware):
             return await call_next(request)
 
         # Skip rate limiting for health checks
-        if request.url.path in ["/_health", "/_ready", "/_metrics"]:
+        if request.url.path in _SKIP_PATHS:
             return await call_next(request)
 
         # Get identifier (prefer authenticated user, fallback to IP)
@@ -213,33 +279,23 @@ class RateLimitMiddleware(BaseHTTPMiddleware):
 
         if not allowed:
             retry_seconds = retry_after or 0.0
-            return JSONResponse(
+            headers = self._429_headers_base.copy()
+            headers["Retry-After"] = str(int(retry_seconds) + 1)
+            body = self._429_template.replace(
+                b'"__RA__"', str(round(retry_seconds, 2)).encode()
+            ).replace(b'"__ID__"', orjson.dumps(identifier))
+            return Response(
+                content=body,
                 status_code=429,
-                content={
-                    "jsonrpc": "2.0",
-                    "error": {
-                        "code": -32000,  # Server error
-                        "message": "Rate limit exceeded",
-                        "data": {
-                            "retry_after": round(retry_seconds, 2),
-                            "limit": self.rate_limiter.requests_per_minute,
-                            "identifier": identifier,
-                        },
-                    },
-                    "id": None,
-                },
-                headers={
-                    "Retry-After": str(int(retry_seconds) + 1),
-                    "X-RateLimit-Limit": str(self.rate_limiter.requests_per_minute),
-                    "X-RateLimit-Remaining": "0",
-                },
+                media_type="application/json",
+                headers=headers,
             )
 
         # Process request
         response = await call_next(request)
 
         # Add rate limit headers to response
-        bucket = self.rate_limiter.buckets.get(identifier)
+        bucket = self.rate_limiter.get_bucket(identifier)
         if bucket:
             response.headers["X-RateLimit-Limit"] = str(self.rate_limiter.requests_per_minute)
             response.headers["X-RateLimit-Remaining"] = str(int(bucket.tokens))
@@ -256,17 +312,9 @@ class RateLimitMiddleware(BaseHTTPMiddleware):
             Identifier string (username or IP)
         """
         # Try to get from auth header (Basic auth username)
-        auth_header = request.headers.get("Authorization", "")
-        if auth_header.startswith("Basic "):
-            try:
-                import base64
-
-                decoded = base64.b64decode(auth_header[6:]).decode("utf-8")
-                username = decoded.split(":")[0]
-                if username:
-                    return f"user:{username}"
-            except Exception:
-                pass
+        username = _parse_basic_auth(request.headers.get("Authorization", ""))
+        if username:
+            return f"user:{username}"
 
         # Fallback to client IP
         # Check X-Forwarded-For for proxied requests
@@ -2,34 +2,26 @@
 
 These prompts help users accomplish common CI/CD tasks by combining
 multiple tool calls with helpful context.
+
+Each template is pre-split at module import into the constant text parts
+surrounding its variables, so a handler call only concatenates the parts
+with the argument values instead of re-rendering the full template.
 """
 
+from __future__ import annotations
+
 import logging
+from functools import lru_cache, partial
 from typing import Any
 
 from ..mcp.protocol import Prompt, ToolParameter, ToolParameterType
 
 logger = logging.getLogger(__name__)
 
-
-def register_prompts(mcp_server, jenkins_adapter, config):
-    """Register prompt templates with the MCP server."""
-
-    # investigate_failure
-    async def investigate_failure_handler(args: dict[str, Any]) -> list[dict[str, Any]]:
-        """Prompt for investigating a failing pipeline."""
-        job = args["job"]
-        build = args.get("build", "last")
-
-        messages = [
-            {
-                "role": "user",
-                "content": {
-                    "type": "text",
-                    "text": f"""I need to investigate a failing Jenkins build.
-
-Job: {job}
-Build: #{build}
+_INVESTIGATE_PARTS = (
+    "I need to investigate a failing Jenkins build.\n\nJob: ",
+    "\nBuild: #",
+    """
 
 Please help me:
 1. Get the build status and basic information
@@ -43,41 +35,12 @@ Use the following tools:
 - triage_failure to analyze the failure
 - get_build_changes to see recent commits that may have caused the failure
 """,
-                },
-            }
-        ]
-
-        return messages
-
-    mcp_server.register_prompt(
-        Prompt(
-            name="investigate_failure",
-            description="Investigate a failing pipeline step with root cause analysis",
-            arguments=[
-                ToolParameter("job", ToolParameterType.STRING, "Job name", required=True),
-                ToolParameter(
-                    "build", ToolParameterType.STRING, "Build number or 'last'", required=False
-                ),
-            ],
-            handler=investigate_failure_handler,
-        )
-    )
-
-    # tail_errors
-    async def tail_errors_handler(args: dict[str, Any]) -> list[dict[str, Any]]:
-        """Prompt for tailing only warnings and errors."""
-        job = args["job"]
-        build = args.get("build", "last")
+)
 
-        messages = [
-            {
-                "role": "user",
-                "content": {
-                    "type": "text",
-                    "text": f"""Show me only the warnings and errors from a build.
-
-Job: {job}
-Build: #{build}
+_TAIL_ERRORS_PARTS = (
+    "Show me only the warnings and errors from a build.\n\nJob: ",
+    "\nBuild: #",
+    """
 
 Please use get_build_log with:
 - filter_regex to match lines containing ERROR or WARN
@@ -86,43 +49,13 @@ Please use get_build_log with:
 
 Focus on the most recent errors at the end of the log.
 """,
-                },
-            }
-        ]
-
-        return messages
-
-    mcp_server.register_prompt(
-        Prompt(
-            name="tail_errors",
-            description="Tail only warnings and errors for the last run",
-            arguments=[
-                ToolParameter("job", ToolParameterType.STRING, "Job name", required=True),
-                ToolParameter(
-                    "build", ToolParameterType.STRING, "Build number or 'last'", required=False
-                ),
-            ],
-            handler=tail_errors_handler,
-        )
-    )
-
-    # compare_builds
-    async def compare_builds_handler(args: dict[str, Any]) -> list[dict[str, Any]]:
-        """Prompt for comparing two builds."""
-        job = args["job"]
-        base = args["base"]
-        head = args["head"]
+)
 
-        messages = [
-            {
-                "role": "user",
-                "content": {
-                    "type": "text",
-                    "text": f"""Compare two builds to understand what changed.
-
-Job: {job}
-Base build: #{base}
-Head build: #{head}
+_COMPARE_BUILDS_PARTS = (
+    "Compare two builds to understand what changed.\n\nJob: ",
+    "\nBase build: #",
+    "\nHead build: #",
+    """
 
 Please use:
 - compare_runs to see differences in duration and results
@@ -131,38 +64,11 @@ Please use:
 
 Summarize key differences and potential causes of any new failures.
 """,
-                },
-            }
-        ]
-
-        return messages
-
-    mcp_server.register_prompt(
-        Prompt(
-            name="compare_builds",
-            description="Compare two builds to identify differences",
-            arguments=[
-                ToolParameter("job", ToolParameterType.STRING, "Job name", required=True),
-                ToolParameter("base", ToolParameterType.STRING, "Base build number", required=True),
-                ToolParameter("head", ToolParameterType.STRING, "Head build number", required=True),
-            ],
-            handler=compare_builds_handler,
-        )
-    )
-
-    # check_job_health
-    async def check_job_health_handler(args: dict[str, Any]) -> list[dict[str, Any]]:
-        """Prompt for checking job health."""
-        job = args["job"]
-
-        messages = [
-            {
-                "role": "user",
-                "content": {
-                    "type": "text",
-                    "text": f"""Check the overall health of a Jenkins job.
+)
 
-Job: {job}
+_CHECK_HEALTH_PARTS = (
+    "Check the overall health of a Jenkins job.\n\nJob: ",
+    """
 
 Please:
 1. Get job information including health reports and build history
@@ -175,38 +81,12 @@ Use:
 - get_build for last successful and last failed builds
 - triage_failure if recent builds are failing
 """,
-                },
-            }
-        ]
-
-        return messages
-
-    mcp_server.register_prompt(
-        Prompt(
-            name="check_job_health",
-            description="Check overall health and stability of a job",
-            arguments=[
-                ToolParameter("job", ToolParameterType.STRING, "Job name", required=True),
-            ],
-            handler=check_job_health_handler,
-        )
-    )
+)
 
-    # trigger_with_params
-    async def trigger_with_params_handler(args: dict[str, Any]) -> list[dict[str, Any]]:
-        """Prompt for triggering a parameterized build."""
-        job = args["job"]
-        params_desc = args.get("parameters", "default parameters")
-
-        messages = [
-            {
-                "role": "user",
-                "content": {
-                    "type": "text",
-                    "text": f"""Trigger a new build for a Jenkins job.
-
-Job: {job}
-Parameters: {params_desc}
+_TRIGGER_PARTS = (
+    "Trigger a new build for a Jenkins job.\n\nJob: ",
+    "\nParameters: ",
+    """
 
 Please:
 1. Get job information to understand what parameters are available
@@ -218,73 +98,145 @@ Use:
 - trigger_build with appropriate parameters
 - summarize_queue to check build was queued
 """,
-                },
-            }
-        ]
-
-        return messages
-
-    mcp_server.register_prompt(
-        Prompt(
-            name="trigger_with_params",
-            description="Trigger a parameterized build with guidance",
-            arguments=[
-                ToolParameter("job", ToolParameterType.STRING, "Job name", required=True),
-                ToolParameter(
-                    "parameters",
-                    ToolParameterType.STRING,
-                    "Description of parameters to use",
-                    required=False,
-                ),
-            ],
-            handler=trigger_with_params_handler,
-        )
-    )
+)
 
-    # search_logs
-    async def search_logs_handler(args: dict[str, Any]) -> list[dict[str, Any]]:
-        """Prompt for searching logs for a pattern."""
-        job = args["job"]
-        pattern = args["pattern"]
-        build = args.get("build", "last")
-
-        messages = [
-            {
-                "role": "user",
-                "content": {
-                    "type": "text",
-                    "text": f"""Search build logs for a specific pattern.
-
-Job: {job}
-Build: #{build}
-Pattern: {pattern}
+_SEARCH_LOGS_PARTS = (
+    "Search build logs for a specific pattern.\n\nJob: ",
+    "\nBuild: #",
+    "\nPattern: ",
+    """
 
 Please use search_log to find all occurrences of the pattern with context.
 Show the matching lines and their context to help understand where and why
 the pattern appears in the build log.
 """,
-                },
-            }
-        ]
-
-        return messages
-
-    mcp_server.register_prompt(
-        Prompt(
-            name="search_logs",
-            description="Search build logs for a specific pattern or error",
-            arguments=[
-                ToolParameter("job", ToolParameterType.STRING, "Job name", required=True),
-                ToolParameter(
-                    "pattern",
-                    ToolParameterType.STRING,
-                    "Pattern to search for (regex)",
-                    required=True,
-                ),
-                ToolParameter(
-                    "build", ToolParameterType.STRING, "Build number or 'last'", required=False
-                ),
-            ],
-            handler=search_logs_handler,
-        )
+)
+
+
+def _message(text: str) -> tuple[dict[str, Any], ...]:
+    """Wrap rendered prompt text in the MCP user-message envelope.
+
+    Returns a tuple so the cached renderer hands out one long-lived
+    object that is shared across calls instead of per-call heap garbage.
+    The dicts inside stay plain dicts — both json and orjson reject
+    MappingProxyType — so callers must treat the structure as read-only.
+    """
+    return ({"role": "user", "content": {"type": "text", "text": text}},)
+
+
+@lru_cache(maxsize=256)
+def _render(parts: tuple[str, ...], values: tuple[str, ...]) -> tuple[dict[str, Any], ...]:
+    """Interleave template parts with argument values and cache the result.
+
+    The renderers are pure functions of small string arguments, and chat
+    sessions tend to iterate on the same job/build repeatedly, so a cache
+    hit turns a prompt fetch into a dict lookup.
+    """
+    pieces = [parts[0]]
+    for value, part in zip(values, parts[1:]):
+        pieces.append(value)
+        pieces.append(part)
+    return _message("".join(pieces))
+
+
+async def _prompt_handler(
+    args: dict[str, Any],
+    *,
+    parts: tuple[str, ...],
+    keys: tuple[str, ...],
+    defaults: dict[str, str],
+) -> tuple[dict[str, Any], ...]:
+    """Shared prompt handler; bound to a template row via functools.partial."""
+    values = tuple(
+        str(args.get(key, defaults[key]) if key in defaults else args[key]) for key in keys
     )
+    return _render(parts, values)
+
+
+# Shared argument definitions — the same ToolParameter instances back
+# every prompt that takes them, and the argument tuples below are handed
+# to Prompt as-is, so nothing should mutate them after registration.
+_ARG_JOB = ToolParameter("job", ToolParameterType.STRING, "Job name", required=True)
+_ARG_BUILD = ToolParameter(
+    "build", ToolParameterType.STRING, "Build number or 'last'", required=False
+)
+_ARG_BASE = ToolParameter("base", ToolParameterType.STRING, "Base build number", required=True)
+_ARG_HEAD = ToolParameter("head", ToolParameterType.STRING, "Head build number", required=True)
+_ARG_PARAMETERS = ToolParameter(
+    "parameters", ToolParameterType.STRING, "Description of parameters to use", required=False
+)
+_ARG_PATTERN = ToolParameter(
+    "pattern", ToolParameterType.STRING, "Pattern to search for (regex)", required=True
+)
+
+_BUILD_DEFAULT = {"build": "last"}
+
+# (name, description, arguments, template parts, value keys, defaults).
+# The value keys are ordered to match the template's variable slots, not
+# the argument list.
+_PROMPTS: tuple[
+    tuple[str, str, tuple[ToolParameter, ...], tuple[str, ...], tuple[str, ...], dict[str, str]],
+    ...,
+] = (
+    (
+        "investigate_failure",
+        "Investigate a failing pipeline step with root cause analysis",
+        (_ARG_JOB, _ARG_BUILD),
+        _INVESTIGATE_PARTS,
+        ("job", "build"),
+        _BUILD_DEFAULT,
+    ),
+    (
+        "tail_errors",
+        "Tail only warnings and errors for the last run",
+        (_ARG_JOB, _ARG_BUILD),
+        _TAIL_ERRORS_PARTS,
+        ("job", "build"),
+        _BUILD_DEFAULT,
+    ),
+    (
+        "compare_builds",
+        "Compare two builds to identify differences",
+        (_ARG_JOB, _ARG_BASE, _ARG_HEAD),
+        _COMPARE_BUILDS_PARTS,
+        ("job", "base", "head"),
+        {},
+    ),
+    (
+        "check_job_health",
+        "Check overall health and stability of a job",
+        (_ARG_JOB,),
+        _CHECK_HEALTH_PARTS,
+        ("job",),
+        {},
+    ),
+    (
+        "trigger_with_params",
+        "Trigger a parameterized build with guidance",
+        (_ARG_JOB, _ARG_PARAMETERS),
+        _TRIGGER_PARTS,
+        ("job", "parameters"),
+        {"parameters": "default parameters"},
+    ),
+    (
+        "search_logs",
+        "Search build logs for a specific pattern or error",
+        (_ARG_JOB, _ARG_PATTERN, _ARG_BUILD),
+        _SEARCH_LOGS_PARTS,
+        ("job", "build", "pattern"),
+        _BUILD_DEFAULT,
+    ),
+)
+
+
+def register_prompts(mcp_server, jenkins_adapter, config):
+    """Register prompt templates with the MCP server."""
+    for name, description, arguments, parts, keys, defaults in _PROMPTS:
+        mcp_server.register_prompt(
+            Prompt(
+                name=name,
+                description=description,
+                arguments=arguments,
+                handler=partial(_prompt_handler, parts=parts, keys=keys, defaults=defaults),
+            )
+        )
@@ -1,5 +1,7 @@
 """Main server module that orchestrates MCP server components."""
 
+from __future__ import annotations
+
 import logging
 
 from .config import JankinsConfig
@@ -11,6 +13,10 @@ from .tools import register_all_tools
 
 logger = logging.getLogger(__name__)
 
+# setup_logging reconfigures the root logger — a process-global side
+# effect that only the first server instance should perform.
+_logging_configured = False
+
 
 class JankinsServer:
     """Main jankins MCP server.
@@ -26,9 +32,14 @@ class JankinsServer:
             config: Server configuration
         """
         self.config = config
+        self._app = None
 
-        # Setup logging
-        setup_logging(level=config.log_level, use_json=config.log_json)
+        # Setup logging once per process; repeated server construction
+        # (unit tests, multi-tenant harnesses) must not rebuild handlers
+        global _logging_configured
+        if not _logging_configured:
+            setup_logging(level=config.log_level, use_json=config.log_json)
+            _logging_configured = True
 
         # Create Jenkins adapter
         self.jenkins_adapter = JenkinsAdapter(config)
@@ -54,20 +65,28 @@ class JankinsServer:
     def create_app(self):
         """Create Starlette application.
 
+        The app is built once per server instance; repeat calls (worker
+        reloads, test harnesses) return the same object instead of
+        rebuilding the route tree.
+
         Returns:
             Starlette app
         """
-        app = create_transport(
+        if self._app is not None:
+            return self._app
+
+        self._app = create_transport(
             self.mcp_server, self.config, transport_type=self.config.mcp_transport
         )
 
         logger.info(
-            f"Created {self.config.mcp_transport} transport", extra={"bind": self.config.mcp_bind}
+            "Created %s transport", self.config.mcp_transport, extra={"bind": self.config.mcp_bind}
         )
 
-        return app
+        return self._app
 
     def close(self) -> None:
         """Clean up resources."""
         logger.info("Shutting down jankins server")
+        self._app = None
         self.jenkins_adapter.close()
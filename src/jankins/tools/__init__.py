@@ -1,12 +1,26 @@
-"""MCP tools for Jenkins operations."""
+"""MCP tools for Jenkins operations.
 
-from .advanced import register_advanced_tools
-from .builds import register_build_tools
-from .health import register_health_tools
-from .jobs import register_job_tools
-from .logs import register_log_tools
-from .scm import register_scm_tools
-from .tests import register_test_tools
+The tool submodules are imported lazily: nothing under ``jankins.tools``
+is loaded until ``register_all_tools`` runs or a ``register_*_tools``
+attribute is first touched (PEP 562), so entry points that never serve
+MCP (``--help``, health probes) skip the whole module graph.
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+from importlib import import_module
+
+# Submodule name and its register function, in registration order.
+_TOOL_MODULES = (
+    ("jobs", "register_job_tools"),
+    ("builds", "register_build_tools"),
+    ("logs", "register_log_tools"),
+    ("scm", "register_scm_tools"),
+    ("health", "register_health_tools"),
+    ("advanced", "register_advanced_tools"),
+    ("tests", "register_test_tools"),
+)
+
+_REGISTER_TO_MODULE = {register_name: module_name for module_name, register_name in _TOOL_MODULES}
 
 
 def register_all_tools(mcp_server, jenkins_adapter, config):
@@ -17,13 +31,31 @@ def register_all_tools(mcp_server, jenkins_adapter, config):
         jenkins_adapter: JenkinsAdapter instance
         config: JankinsConfig instance
     """
-    register_job_tools(mcp_server, jenkins_adapter, config)
-    register_build_tools(mcp_server, jenkins_adapter, config)
-    register_log_tools(mcp_server, jenkins_adapter, config)
-    register_scm_tools(mcp_server, jenkins_adapter, config)
-    register_health_tools(mcp_server, jenkins_adapter, config)
-    register_advanced_tools(mcp_server, jenkins_adapter, config)
-    register_test_tools(mcp_server, jenkins_adapter, config)
+    # Import the submodules concurrently — the GIL is released during
+    # file I/O and bytecode loading, so a cold boot pays roughly the
+    # slowest import instead of the sum. Registration itself stays
+    # serial: it mutates mcp_server and the tool order is part of the
+    # listing contract.
+    with ThreadPoolExecutor(max_workers=len(_TOOL_MODULES)) as executor:
+        modules = list(
+            executor.map(
+                import_module,
+                (f"{__name__}.{module_name}" for module_name, _ in _TOOL_MODULES),
+            )
+        )
+
+    for module, (_, register_name) in zip(modules, _TOOL_MODULES):
+        getattr(module, register_name)(mcp_server, jenkins_adapter, config)
+
+
+def __getattr__(name: str):
+    """Import a register function from its submodule on first access."""
+    module_name = _REGISTER_TO_MODULE.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(f".{module_name}", __name__), name)
+    globals()[name] = value  # cache so subsequent lookups skip __getattr__
+    return value
 
 
 __all__ = [
@@ -0,0 +1,125 @@
+"""Shared helpers for tool handlers."""
+
+import logging
+from dataclasses import dataclass
+from typing import Any
+
+from cachetools import TTLCache
+
+from ..errors import InvalidParamsError
+from ..formatters import OutputFormat, parse_output_format
+from ..mcp.protocol import ToolParameter, ToolParameterType
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(slots=True)
+class BuildArgs:
+    """The job/build/format argument trio shared by build-scoped tools."""
+
+    name: str
+    number: str | int
+    format: OutputFormat
+
+
+def parse_build_args(args: dict[str, Any], default_format: str = "summary") -> BuildArgs:
+    """Extract the recurring job/build/format trio in one pass.
+
+    Handlers read the fields back as slot attribute loads instead of
+    repeating the same dict lookups through their bodies; required
+    parameters were already validated by call_tool.
+    """
+    return BuildArgs(
+        name=args["name"],
+        number=args.get("number", "last"),
+        format=parse_output_format(args.get("format", default_format)),
+    )
+
+
+# Parameter singletons for arguments that recur across tool
+# registrations. ToolParameter is frozen, so the modules share one
+# instance per recurring argument instead of re-allocating identical
+# descriptors for every tool each time a registrar runs.
+PARAM_JOB_NAME = ToolParameter("name", ToolParameterType.STRING, "Full job name", required=True)
+PARAM_NUMBER_OR_LAST = ToolParameter(
+    "number",
+    ToolParameterType.STRING,
+    "Build number or 'last'",
+    required=False,
+    default="last",
+)
+PARAM_FORMAT_SUMMARY_FULL = ToolParameter(
+    "format",
+    ToolParameterType.STRING,
+    "Output format",
+    required=False,
+    default="summary",
+    enum=["summary", "full"],
+)
+PARAM_FORMAT_SUMMARY_FULL_IDS = ToolParameter(
+    "format",
+    ToolParameterType.STRING,
+    "Output format",
+    required=False,
+    default="summary",
+    enum=["summary", "full", "ids"],
+)
+PARAM_FORMAT_DIFF = ToolParameter(
+    "format",
+    ToolParameterType.STRING,
+    "Output format",
+    required=False,
+    default="diff",
+    enum=["summary", "full", "diff"],
+)
+
+# Cache of job name -> last build number. Resolving number="last" used
+# to cost a full get_job_info round trip before the get_build_info
+# call; a short TTL keeps the answer fresh enough while collapsing the
+# common case to one request.
+_last_build_cache: TTLCache | None = None
+
+
+def _get_last_build_cache(config) -> TTLCache:
+    global _last_build_cache
+    if _last_build_cache is None:
+        _last_build_cache = TTLCache(maxsize=1024, ttl=config.last_build_ttl_seconds)
+    return _last_build_cache
+
+
+def resolve_build_number(jenkins_adapter, config, job_name: str, number_or_last) -> int:
+    """Resolve a build reference ("last" or a number) to a build number.
+
+    "last" lookups are answered from a short-lived cache; misses ask
+    Jenkins for just ``lastBuild[number]``.
+
+    Raises:
+        InvalidParamsError: If the reference is malformed or the job
+            has no builds
+    """
+    if number_or_last != "last":
+        try:
+            return int(number_or_last)
+        except (TypeError, ValueError):
+            raise InvalidParamsError(
+                f"Invalid build number: {number_or_last}", hint="Provide a number or 'last'"
+            )
+
+    cache = _get_last_build_cache(config)
+    number = cache.get(job_name)
+    if number is None:
+        job_info = jenkins_adapter.get_job_info(job_name, tree="lastBuild[number]")
+        last_build = job_info.get("lastBuild")
+        if not last_build:
+            raise InvalidParamsError(
+                f"Job '{job_name}' has no builds", hint="Trigger a build first"
+            )
+        number = last_build["number"]
+        cache[job_name] = number
+    return number
+
+
+def invalidate_last_build(job_name: str) -> None:
+    """Drop the cached last-build number after triggering a build."""
+    if _last_build_cache is not None:
+        _last_build_cache.pop(job_name, None)
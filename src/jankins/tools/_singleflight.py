@@ -0,0 +1,100 @@
+"""Single-flight request coalescing for tool handlers.
+
+Concurrent tool invocations with identical arguments each used to
+trigger their own Jenkins REST call; here the first caller becomes the
+leader and everyone else awaits its result, so N concurrent identical
+requests cost one round trip.
+"""
+
+import asyncio
+import logging
+from collections.abc import Awaitable, Callable
+from typing import Any
+
+from cachetools import TTLCache
+
+from ..errors import JankinsError
+
+logger = logging.getLogger(__name__)
+
+_pending: dict[tuple, asyncio.Future] = {}
+
+# Failures are remembered briefly so a burst of identical calls does
+# not stampede Jenkins retrying the same error
+_NEGATIVE_TTL_SECONDS = 0.5
+_recent_failures: TTLCache = TTLCache(maxsize=256, ttl=_NEGATIVE_TTL_SECONDS)
+
+
+def _rebuild_failure(e: BaseException) -> BaseException:
+    """Build a fresh exception equivalent to a cached one.
+
+    Re-raising the cached instance itself would mutate its
+    __traceback__ across tasks and stamp the leader's correlation_id
+    onto unrelated callers' responses, so each negative-cache hit gets
+    its own instance.
+    """
+    if isinstance(e, JankinsError):
+        # Preserve the client-visible fields; the fresh instance picks
+        # up the current request's correlation ID
+        return JankinsError(
+            e.message,
+            code=e.code,
+            hint=e.hint,
+            next_actions=list(e.next_actions),
+            docs_url=e.docs_url,
+        )
+    try:
+        return type(e)(*e.args)
+    except Exception:
+        return RuntimeError(str(e) or repr(e))
+
+
+async def run_once(key: tuple, coro_factory: Callable[[], Awaitable[Any]]) -> Any:
+    """Run ``coro_factory`` at most once per key among concurrent callers.
+
+    The first caller for a key runs the coroutine; callers arriving
+    while it is in flight await the same result. A failure is shared
+    with the in-flight followers and re-raised (as a fresh instance)
+    for new callers within a short negative TTL; cancellation is never
+    negative-cached.
+
+    Args:
+        key: Hashable identity of the request (tool name plus args)
+        coro_factory: Zero-argument callable returning the awaitable
+            to run
+
+    Returns:
+        The leader's result
+    """
+    failure = _recent_failures.get(key)
+    if failure is not None:
+        raise _rebuild_failure(failure)
+
+    future = _pending.get(key)
+    if future is not None:
+        return await future
+
+    future = asyncio.get_running_loop().create_future()
+    _pending[key] = future
+    try:
+        result = await coro_factory()
+    except asyncio.CancelledError:
+        # A cancelled leader says nothing about Jenkins: wake the
+        # followers but keep cancellation out of the negative cache
+        if not future.cancelled():
+            future.cancel()
+        raise
+    except BaseException as e:
+        _recent_failures[key] = e
+        if not future.cancelled():
+            future.set_exception(e)
+            # Retrieve the exception so an unawaited future does not
+            # warn when no followers joined
+            future.exception()
+        raise
+    else:
+        if not future.cancelled():
+            future.set_result(result)
+        return result
+    finally:
+        _pending.pop(key, None)
@@ -1,20 +1,55 @@
 """Advanced analysis tools for failure triage and comparison."""
 
+import asyncio
+import hashlib
 import logging
+import re
 import time
-import uuid
 from typing import Any
 
-from ..analyzers import GradleAnalyzer, MavenAnalyzer, NpmAnalyzer, get_analyzer
+from cachetools import TTLCache
+
+from ..analyzers import AnalysisResult, detect_build_tool, get_analyzer
 from ..errors import InvalidParamsError
-from ..formatters import OutputFormat, TokenAwareFormatter
+from ..formatters import OutputFormat, TokenAwareFormatter, parse_output_format
 from ..jenkins.blueocean import BlueOceanClient
 from ..jenkins.progressive import ProgressiveLogClient
-from ..logging_utils import RequestLogger
+from ..logging_utils import RequestLogger, new_correlation_id, now_ms
 from ..mcp.protocol import Tool, ToolParameter, ToolParameterType
+from ._common import (
+    PARAM_FORMAT_DIFF,
+    PARAM_FORMAT_SUMMARY_FULL,
+    PARAM_JOB_NAME,
+    PARAM_NUMBER_OR_LAST,
+)
 
 logger = logging.getLogger(__name__)
 
+# Once a build reaches a terminal result its log and metadata are
+# immutable, so analysis output for it can be reused instead of
+# re-fetching and re-analyzing on every agent query.
+_RESULT_CACHE_MAX_ENTRIES = 512
+_RESULT_CACHE_TTL_SECONDS = 3600
+_TERMINAL_RESULTS = frozenset({"SUCCESS", "FAILURE", "UNSTABLE", "ABORTED"})
+
+# Analyzer output depends only on the log content and the tool, so
+# identical content skips the regex-heavy analyze pass regardless of
+# which job/build/format the request came in under. Keyed on a
+# blake2b digest of the content rather than the content itself to keep
+# the keys small.
+_ANALYSIS_CACHE: "TTLCache[tuple[bytes, str], AnalysisResult]" = TTLCache(
+    maxsize=128, ttl=_RESULT_CACHE_TTL_SECONDS
+)
+
+# Upper bound on how long one retry attempt waits for a triggered
+# build to leave the queue and finish; a stuck queue item (no
+# executors, cancelled item) must not hang the tool call forever
+_RETRY_WAIT_DEADLINE_SECONDS = 600
+
+
+def _log_content_digest(log_content: str) -> bytes:
+    return hashlib.blake2b(log_content.encode("utf-8"), digest_size=16).digest()
+
 
 def register_advanced_tools(mcp_server, jenkins_adapter, config):
     """Register advanced analysis tools."""
@@ -22,21 +57,53 @@ def register_advanced_tools(mcp_server, jenkins_adapter, config):
     log_client = ProgressiveLogClient(jenkins_adapter)
     blue_ocean_client = BlueOceanClient(jenkins_adapter)
 
+    # Tools are collected and registered as one batch at the end
+    tools: list[Tool] = []
+
+    result_cache: TTLCache = TTLCache(
+        maxsize=_RESULT_CACHE_MAX_ENTRIES, ttl=_RESULT_CACHE_TTL_SECONDS
+    )
+    cache_locks: dict[tuple, asyncio.Lock] = {}
+
+    async def cached_result(cache_key: tuple, compute) -> dict[str, Any]:
+        """Return the cached result for a key, computing it at most once.
+
+        ``compute`` is an async callable returning ``(result_data,
+        cacheable)``; only results for terminal builds are cached. A
+        per-key lock keeps concurrent identical requests from all
+        hitting Jenkins at once.
+        """
+        result = result_cache.get(cache_key)
+        if result is not None:
+            return result
+
+        lock = cache_locks.setdefault(cache_key, asyncio.Lock())
+        async with lock:
+            result = result_cache.get(cache_key)
+            if result is None:
+                result, cacheable = await compute()
+                if cacheable:
+                    result_cache[cache_key] = result
+        cache_locks.pop(cache_key, None)
+        return result
+
     # triage_failure
     async def triage_failure_handler(args: dict[str, Any]) -> dict[str, Any]:
-        correlation_id = str(uuid.uuid4())
-        start_time = time.time()
+        correlation_id = new_correlation_id()
+        start_time = now_ms()
 
         with RequestLogger(logger, "triage_failure", correlation_id):
             job_name = args["name"]
             number_or_last = args.get("number", "last")
             max_bytes = args.get("max_bytes", config.log_max_bytes_default)
             format_str = args.get("format", "summary")
-            output_format = OutputFormat(format_str)
+            output_format = parse_output_format(format_str)
 
             # Get build number
             if number_or_last == "last":
-                job_info = jenkins_adapter.get_job_info(job_name)
+                job_info = await asyncio.to_thread(
+                    jenkins_adapter.get_job_info, job_name, tree="lastBuild[number]"
+                )
                 last_build = job_info.get("lastBuild")
                 if not last_build:
                     raise InvalidParamsError(f"Job '{job_name}' has no builds")
@@ -44,96 +111,104 @@ def register_advanced_tools(mcp_server, jenkins_adapter, config):
             else:
                 build_number = int(number_or_last)
 
-            # Get build info and log summary
-            build_info = jenkins_adapter.get_build_info(job_name, build_number)
-            log_summary = log_client.summarize_log(job_name, build_number, max_bytes)
-
-            # Analyze failure
-            result = build_info.get("result")
-            if result != "FAILURE":
-                result_data = {
-                    "build_number": build_number,
-                    "result": result,
-                    "message": f"Build is not a failure (result: {result})",
-                    "hypotheses": [],
-                    "top_errors": [],
-                    "failing_stages": [],
-                    "next_steps": [],
-                }
-            else:
-                # Generate hypotheses based on error patterns
-                hypotheses = _generate_hypotheses(log_summary.last_error_lines)
-
-                # Get suspect changes
-                changes = build_info.get("changeSet", {}).get("items", [])
-                suspect_changes = [
-                    {
-                        "commit": c.get("commitId", "")[:8],
-                        "author": c.get("author", {}).get("fullName", "Unknown"),
-                        "message": c.get("msg", "")[:100],
-                    }
-                    for c in changes[:5]
-                ]
-
-                # Generate next steps
-                next_steps = _generate_next_steps(
-                    log_summary.failing_stages, log_summary.last_error_lines, len(changes) > 0
-                )
+            cache_key = ("triage_failure", job_name, build_number, max_bytes, format_str)
 
-                result_data = {
-                    "build_number": build_number,
-                    "result": result,
-                    "hypotheses": hypotheses,
-                    "top_errors": log_summary.last_error_lines,
-                    "failing_stages": log_summary.failing_stages,
-                    "suspect_changes": suspect_changes,
-                    "next_steps": next_steps,
-                }
-
-                # Format using TokenAwareFormatter
-                result_data = TokenAwareFormatter.format_triage(
-                    hypotheses=hypotheses,
-                    top_errors=log_summary.last_error_lines,
-                    failing_stages=log_summary.failing_stages,
-                    suspect_changes=suspect_changes,
-                    next_steps=next_steps,
-                    format=output_format,
+            async def compute() -> tuple[dict[str, Any], bool]:
+                build_info = await asyncio.to_thread(
+                    jenkins_adapter.get_build_info,
+                    job_name,
+                    build_number,
+                    "number,result,duration,changeSet[items[commitId,author[fullName],msg]]",
                 )
-                result_data["build_number"] = build_number
-                result_data["job_name"] = job_name
 
-            took_ms = int((time.time() - start_time) * 1000)
+                # Analyze failure
+                result = build_info.get("result")
+                if result != "FAILURE":
+                    # Nothing below uses the log, so a non-failure triage
+                    # (the common misuse of this tool) skips the log
+                    # download and parse entirely
+                    result_data = {
+                        "build_number": build_number,
+                        "result": result,
+                        "message": f"Build is not a failure (result: {result})",
+                        "hypotheses": [],
+                        "top_errors": [],
+                        "failing_stages": [],
+                        "next_steps": [],
+                    }
+                else:
+                    log_summary = await asyncio.to_thread(
+                        log_client.summarize_log, job_name, build_number, max_bytes
+                    )
+
+                    # Scan the error lines once; both generators share
+                    # the resulting token set
+                    error_tokens = _scan_error_tokens(log_summary.last_error_lines)
+
+                    # Generate hypotheses based on error patterns
+                    hypotheses = _generate_hypotheses(log_summary.last_error_lines, error_tokens)
+
+                    # Get suspect changes; only the full payload carries
+                    # them, so summary mode skips building the per-commit
+                    # dicts that format_triage would drop anyway
+                    changes = build_info.get("changeSet", {}).get("items", [])
+                    if output_format == OutputFormat.FULL:
+                        suspect_changes = [
+                            {
+                                "commit": c.get("commitId", "")[:8],
+                                "author": c.get("author", {}).get("fullName", "Unknown"),
+                                "message": c.get("msg", "")[:100],
+                            }
+                            for c in changes[:5]
+                        ]
+                    else:
+                        suspect_changes = []
+
+                    # Generate next steps
+                    next_steps = _generate_next_steps(
+                        log_summary.failing_stages,
+                        log_summary.last_error_lines,
+                        len(changes) > 0,
+                        error_tokens,
+                    )
+
+                    # Format using TokenAwareFormatter
+                    result_data = TokenAwareFormatter.format_triage(
+                        hypotheses=hypotheses,
+                        top_errors=log_summary.last_error_lines,
+                        failing_stages=log_summary.failing_stages,
+                        suspect_changes=suspect_changes,
+                        next_steps=next_steps,
+                        format=output_format,
+                    )
+                    result_data["build_number"] = build_number
+                    result_data["job_name"] = job_name
+
+                return result_data, result in _TERMINAL_RESULTS
+
+            result_data = await cached_result(cache_key, compute)
+
+            took_ms = now_ms() - start_time
+            # add_metadata mutates; stamp a copy so cache hits don't
+            # share one dict across concurrent requests
             return TokenAwareFormatter.add_metadata(
-                result_data, correlation_id, took_ms, output_format
+                dict(result_data), correlation_id, took_ms, output_format
             )
 
-    mcp_server.register_tool(
+    tools.append(
         Tool(
             name="triage_failure",
             description="Analyze a failed build and provide root cause hypotheses and next steps",
             parameters=[
-                ToolParameter("name", ToolParameterType.STRING, "Full job name", required=True),
-                ToolParameter(
-                    "number",
-                    ToolParameterType.STRING,
-                    "Build number or 'last'",
-                    required=False,
-                    default="last",
-                ),
+                PARAM_JOB_NAME,
+                PARAM_NUMBER_OR_LAST,
                 ToolParameter(
                     "max_bytes",
                     ToolParameterType.NUMBER,
                     "Maximum log bytes to analyze",
                     required=False,
                 ),
-                ToolParameter(
-                    "format",
-                    ToolParameterType.STRING,
-                    "Output format",
-                    required=False,
-                    default="summary",
-                    enum=["summary", "full"],
-                ),
+                PARAM_FORMAT_SUMMARY_FULL,
             ],
             handler=triage_failure_handler,
         )
@@ -141,66 +216,104 @@ def register_advanced_tools(mcp_server, jenkins_adapter, config):
 
     # compare_runs
     async def compare_runs_handler(args: dict[str, Any]) -> dict[str, Any]:
-        correlation_id = str(uuid.uuid4())
-        start_time = time.time()
+        correlation_id = new_correlation_id()
+        start_time = now_ms()
 
         with RequestLogger(logger, "compare_runs", correlation_id):
             job_name = args["name"]
             base = args["base"]
             head = args["head"]
             format_str = args.get("format", "diff")
-            output_format = OutputFormat(format_str)
-
-            # Get both builds
-            base_build = jenkins_adapter.get_build_info(job_name, int(base))
-            head_build = jenkins_adapter.get_build_info(job_name, int(head))
-
-            # Calculate duration delta
-            duration_delta = head_build.get("duration", 0) - base_build.get("duration", 0)
-
-            # Compare results (for future use in detailed comparison)
-            # result_changed = base_build.get("result") != head_build.get("result")
-
-            # Stage comparison with Blue Ocean API
-            try:
-                comparison = blue_ocean_client.compare_pipeline_runs(job_name, int(base), int(head))
-                stage_diffs = comparison.get("stage_diffs", [])
-            except Exception as e:
-                logger.debug(f"Blue Ocean comparison not available: {e}")
-                stage_diffs = []
-
-            # Format comparison
-            result = TokenAwareFormatter.format_comparison(
-                base_build=base_build,
-                head_build=head_build,
-                duration_delta=duration_delta,
-                stage_diffs=stage_diffs,
-                format=output_format,
-            )
+            output_format = parse_output_format(format_str)
 
-            result["job_name"] = job_name
+            cache_key = ("compare_runs", job_name, int(base), int(head), format_str)
 
-            took_ms = int((time.time() - start_time) * 1000)
-            return TokenAwareFormatter.add_metadata(result, correlation_id, took_ms, output_format)
+            async def compute() -> tuple[dict[str, Any], bool]:
+                def safe_compare() -> list[dict[str, Any]]:
+                    # Stage comparison with Blue Ocean API
+                    try:
+                        comparison = blue_ocean_client.compare_pipeline_runs(
+                            job_name, int(base), int(head)
+                        )
+                        return comparison.get("stage_diffs", [])
+                    except Exception as e:
+                        logger.debug(f"Blue Ocean comparison not available: {e}")
+                        return []
+
+                if int(base) == int(head):
+                    # Comparing a build against itself: one fetch, no stage
+                    # diffs, and no Blue Ocean round trip
+                    base_build = await asyncio.to_thread(
+                        jenkins_adapter.get_build_info,
+                        job_name,
+                        int(base),
+                        "number,result,duration",
+                    )
+                    head_build = base_build
+                    stage_diffs: list[dict[str, Any]] = []
+                else:
+                    # Get both builds and the Blue Ocean comparison; the three
+                    # fetches are independent, so overlap them in the executor
+                    loop = asyncio.get_running_loop()
+                    base_build, head_build, stage_diffs = await asyncio.gather(
+                        loop.run_in_executor(
+                            None,
+                            jenkins_adapter.get_build_info,
+                            job_name,
+                            int(base),
+                            "number,result,duration",
+                        ),
+                        loop.run_in_executor(
+                            None,
+                            jenkins_adapter.get_build_info,
+                            job_name,
+                            int(head),
+                            "number,result,duration",
+                        ),
+                        loop.run_in_executor(None, safe_compare),
+                    )
+
+                # Calculate duration delta
+                duration_delta = head_build.get("duration", 0) - base_build.get("duration", 0)
+
+                # Compare results (for future use in detailed comparison)
+                # result_changed = base_build.get("result") != head_build.get("result")
+
+                # Format comparison
+                result = TokenAwareFormatter.format_comparison(
+                    base_build=base_build,
+                    head_build=head_build,
+                    duration_delta=duration_delta,
+                    stage_diffs=stage_diffs,
+                    format=output_format,
+                )
+
+                result["job_name"] = job_name
+
+                cacheable = (
+                    base_build.get("result") in _TERMINAL_RESULTS
+                    and head_build.get("result") in _TERMINAL_RESULTS
+                )
+                return result, cacheable
+
+            result = await cached_result(cache_key, compute)
+
+            took_ms = now_ms() - start_time
+            return TokenAwareFormatter.add_metadata(
+                dict(result), correlation_id, took_ms, output_format
+            )
 
-    mcp_server.register_tool(
+    tools.append(
         Tool(
             name="compare_runs",
             description="Compare two builds to identify differences in duration, stages, and results",
             parameters=[
-                ToolParameter("name", ToolParameterType.STRING, "Full job name", required=True),
+                PARAM_JOB_NAME,
                 ToolParameter("base", ToolParameterType.STRING, "Base build number", required=True),
                 ToolParameter(
                     "head", ToolParameterType.STRING, "Head build number to compare", required=True
                 ),
-                ToolParameter(
-                    "format",
-                    ToolParameterType.STRING,
-                    "Output format",
-                    required=False,
-                    default="diff",
-                    enum=["summary", "full", "diff"],
-                ),
+                PARAM_FORMAT_DIFF,
             ],
             handler=compare_runs_handler,
         )
@@ -208,18 +321,20 @@ def register_advanced_tools(mcp_server, jenkins_adapter, config):
 
     # get_pipeline_graph
     async def get_pipeline_graph_handler(args: dict[str, Any]) -> dict[str, Any]:
-        correlation_id = str(uuid.uuid4())
-        start_time = time.time()
+        correlation_id = new_correlation_id()
+        start_time = now_ms()
 
         with RequestLogger(logger, "get_pipeline_graph", correlation_id):
             job_name = args["name"]
             number_or_last = args.get("number", "last")
             format_str = args.get("format", "summary")
-            output_format = OutputFormat(format_str)
+            output_format = parse_output_format(format_str)
 
             # Get build number
             if number_or_last == "last":
-                job_info = jenkins_adapter.get_job_info(job_name)
+                job_info = await asyncio.to_thread(
+                    jenkins_adapter.get_job_info, job_name, tree="lastBuild[number]"
+                )
                 last_build = job_info.get("lastBuild")
                 if not last_build:
                     raise InvalidParamsError(f"Job '{job_name}' has no builds")
@@ -227,69 +342,76 @@ def register_advanced_tools(mcp_server, jenkins_adapter, config):
             else:
                 build_number = int(number_or_last)
 
-            # Get pipeline graph from Blue Ocean
-            try:
-                graph = blue_ocean_client.get_pipeline_graph(job_name, build_number)
-                failing_stages = blue_ocean_client.get_failing_stages_detailed(
-                    job_name, build_number
-                )
+            cache_key = ("get_pipeline_graph", job_name, build_number, format_str)
 
-                result = {
-                    "build_number": build_number,
-                    "job_name": job_name,
-                    "stages": graph.get("stages", []),
-                    "parallel_stages": graph.get("parallel_stages", []),
-                    "total_duration_ms": graph.get("total_duration_ms", 0),
-                    "node_count": graph.get("node_count", 0),
-                    "failing_stages": failing_stages,
-                }
-
-                # In summary mode, simplify the output
-                if output_format == OutputFormat.SUMMARY:
-                    result["stages"] = [
-                        {"name": s["name"], "result": s["result"], "duration_ms": s["duration_ms"]}
-                        for s in result["stages"]
-                    ]
-                    if result["parallel_stages"]:
-                        result["parallel_stages"] = [
-                            [{"name": s["name"], "result": s["result"]} for s in group]
-                            for group in result["parallel_stages"]
+            async def compute() -> tuple[dict[str, Any], bool]:
+                # Get pipeline graph from Blue Ocean; the combined call
+                # fetches the node list once for both views
+                try:
+                    graph, failing_stages = await asyncio.to_thread(
+                        blue_ocean_client.get_pipeline_graph_with_failing, job_name, build_number
+                    )
+
+                    result = {
+                        "build_number": build_number,
+                        "job_name": job_name,
+                        "stages": graph.get("stages", []),
+                        "parallel_stages": graph.get("parallel_stages", []),
+                        "total_duration_ms": graph.get("total_duration_ms", 0),
+                        "node_count": graph.get("node_count", 0),
+                        "failing_stages": failing_stages,
+                    }
+
+                    # Only cache once every stage has reached a terminal
+                    # result; an in-progress run's graph is still changing
+                    cacheable = bool(result["stages"]) and all(
+                        s.get("result") in _TERMINAL_RESULTS for s in result["stages"]
+                    )
+
+                    # In summary mode, simplify the output
+                    if output_format == OutputFormat.SUMMARY:
+                        result["stages"] = [
+                            {
+                                "name": s["name"],
+                                "result": s["result"],
+                                "duration_ms": s["duration_ms"],
+                            }
+                            for s in result["stages"]
                         ]
+                        if result["parallel_stages"]:
+                            result["parallel_stages"] = [
+                                [{"name": s["name"], "result": s["result"]} for s in group]
+                                for group in result["parallel_stages"]
+                            ]
 
-            except Exception as e:
-                logger.warning(f"Blue Ocean API not available: {e}")
-                result = {
-                    "build_number": build_number,
-                    "job_name": job_name,
-                    "error": "Blue Ocean API not available for this build",
-                    "stages": [],
-                    "available": False,
-                }
-
-            took_ms = int((time.time() - start_time) * 1000)
-            return TokenAwareFormatter.add_metadata(result, correlation_id, took_ms, output_format)
+                except Exception as e:
+                    logger.warning(f"Blue Ocean API not available: {e}")
+                    result = {
+                        "build_number": build_number,
+                        "job_name": job_name,
+                        "error": "Blue Ocean API not available for this build",
+                        "stages": [],
+                        "available": False,
+                    }
+                    cacheable = False
+
+                return result, cacheable
+
+            result = await cached_result(cache_key, compute)
+
+            took_ms = now_ms() - start_time
+            return TokenAwareFormatter.add_metadata(
+                dict(result), correlation_id, took_ms, output_format
+            )
 
-    mcp_server.register_tool(
+    tools.append(
         Tool(
             name="get_pipeline_graph",
             description="Get pipeline execution graph with stages, parallel branches, and timing (requires Blue Ocean plugin)",
             parameters=[
-                ToolParameter("name", ToolParameterType.STRING, "Full job name", required=True),
-                ToolParameter(
-                    "number",
-                    ToolParameterType.STRING,
-                    "Build number or 'last'",
-                    required=False,
-                    default="last",
-                ),
-                ToolParameter(
-                    "format",
-                    ToolParameterType.STRING,
-                    "Output format",
-                    required=False,
-                    default="summary",
-                    enum=["summary", "full"],
-                ),
+                PARAM_JOB_NAME,
+                PARAM_NUMBER_OR_LAST,
+                PARAM_FORMAT_SUMMARY_FULL,
             ],
             handler=get_pipeline_graph_handler,
         )
@@ -297,8 +419,8 @@ def register_advanced_tools(mcp_server, jenkins_adapter, config):
 
     # analyze_build_log
     async def analyze_build_log_handler(args: dict[str, Any]) -> dict[str, Any]:
-        correlation_id = str(uuid.uuid4())
-        start_time = time.time()
+        correlation_id = new_correlation_id()
+        start_time = now_ms()
 
         with RequestLogger(logger, "analyze_build_log", correlation_id):
             job_name = args["name"]
@@ -306,11 +428,13 @@ def register_advanced_tools(mcp_server, jenkins_adapter, config):
             build_tool = args.get("build_tool")
             max_bytes = args.get("max_bytes", config.log_max_bytes_default)
             format_str = args.get("format", "summary")
-            output_format = OutputFormat(format_str)
+            output_format = parse_output_format(format_str)
 
             # Get build number
             if number_or_last == "last":
-                job_info = jenkins_adapter.get_job_info(job_name)
+                job_info = await asyncio.to_thread(
+                    jenkins_adapter.get_job_info, job_name, tree="lastBuild[number]"
+                )
                 last_build = job_info.get("lastBuild")
                 if not last_build:
                     raise InvalidParamsError(f"Job '{job_name}' has no builds")
@@ -318,82 +442,105 @@ def register_advanced_tools(mcp_server, jenkins_adapter, config):
             else:
                 build_number = int(number_or_last)
 
-            # Get log content
-            log_summary = log_client.summarize_log(job_name, build_number, max_bytes)
-            log_content = "\n".join(log_summary.last_error_lines)
-
-            # Get more context if needed
-            if len(log_content) < 1000:
-                # Get more log content for better analysis
-                try:
-                    full_log = jenkins_adapter.get_build_console_output(job_name, build_number)
-                    # Use last 50KB for analysis
-                    log_content = full_log[-50000:] if len(full_log) > 50000 else full_log
-                except Exception as e:
-                    logger.debug(f"Could not get full log: {e}")
-
-            # Auto-detect build tool if not specified
-            if not build_tool:
-                # Try each analyzer
-                for analyzer_class in [MavenAnalyzer, GradleAnalyzer, NpmAnalyzer]:
-                    analyzer = analyzer_class()  # type: ignore[abstract]
-                    if analyzer.detect(log_content):
-                        build_tool = analyzer.tool_name
-                        break
-
-            # Analyze with appropriate analyzer
-            if build_tool:
-                try:
-                    analyzer = get_analyzer(build_tool)
-                    analysis = analyzer.analyze(log_content)
+            cache_key = (
+                "analyze_build_log",
+                job_name,
+                build_number,
+                build_tool,
+                max_bytes,
+                format_str,
+            )
 
+            async def compute() -> tuple[dict[str, Any], bool]:
+                # A growing log would make a cached analysis stale, so the
+                # build's result gates cacheability
+                build_info = await asyncio.to_thread(
+                    jenkins_adapter.get_build_info, job_name, build_number, tree="result"
+                )
+                cacheable = build_info.get("result") in _TERMINAL_RESULTS
+
+                # Get log content; requesting the tail up front reuses
+                # the bytes the summary fetch already downloaded instead
+                # of falling back to a second full-console fetch
+                log_summary = await asyncio.to_thread(
+                    log_client.summarize_log,
+                    job_name,
+                    build_number,
+                    max_bytes,
+                    want_tail=True,
+                    tail_bytes=50_000,
+                )
+                log_content = log_summary.tail or "\n".join(log_summary.last_error_lines)
+
+                # Auto-detect build tool if not specified; one combined
+                # scan instead of trying each analyzer in turn
+                tool_name = build_tool or detect_build_tool(log_content)
+
+                # Analyze with appropriate analyzer
+                if tool_name:
+                    try:
+                        analyzer = get_analyzer(tool_name)
+
+                        # Reuse the analysis for content we've already
+                        # seen; a finished build's log never changes
+                        analysis_key = (_log_content_digest(log_content), tool_name)
+                        analysis = _ANALYSIS_CACHE.get(analysis_key)
+                        if analysis is None:
+                            analysis = await asyncio.to_thread(analyzer.analyze, log_content)
+                            if cacheable:
+                                _ANALYSIS_CACHE[analysis_key] = analysis
+
+                        result = {
+                            "build_number": build_number,
+                            "job_name": job_name,
+                            "build_tool": analysis.build_tool,
+                            "detected": analysis.detected,
+                            "summary": analysis.summary,
+                            "compilation_errors": analysis.compilation_errors,
+                            "test_failures": analysis.test_failures,
+                            "issues": analysis.issues,
+                            "recommendations": analysis.recommendations,
+                        }
+
+                        # Include detailed errors/warnings in full format
+                        if output_format == OutputFormat.FULL:
+                            result["errors"] = analysis.errors[:10]
+                            result["warnings"] = analysis.warnings[:10]
+                            result["dependencies_failed"] = analysis.dependencies_failed
+                        else:
+                            result["error_count"] = len(analysis.errors)
+                            result["warning_count"] = len(analysis.warnings)
+
+                    except ValueError as e:
+                        result = {
+                            "build_number": build_number,
+                            "job_name": job_name,
+                            "error": str(e),
+                        }
+                else:
                     result = {
                         "build_number": build_number,
                         "job_name": job_name,
-                        "build_tool": analysis.build_tool,
-                        "detected": analysis.detected,
-                        "summary": analysis.summary,
-                        "compilation_errors": analysis.compilation_errors,
-                        "test_failures": analysis.test_failures,
-                        "issues": analysis.issues,
-                        "recommendations": analysis.recommendations,
+                        "error": "Could not detect build tool (maven, gradle, npm)",
+                        "hint": "Specify build_tool parameter explicitly",
                     }
 
-                    # Include detailed errors/warnings in full format
-                    if output_format == OutputFormat.FULL:
-                        result["errors"] = analysis.errors[:10]
-                        result["warnings"] = analysis.warnings[:10]
-                        result["dependencies_failed"] = analysis.dependencies_failed
-                    else:
-                        result["error_count"] = len(analysis.errors)
-                        result["warning_count"] = len(analysis.warnings)
+                return result, cacheable
 
-                except ValueError as e:
-                    result = {"build_number": build_number, "job_name": job_name, "error": str(e)}
-            else:
-                result = {
-                    "build_number": build_number,
-                    "job_name": job_name,
-                    "error": "Could not detect build tool (maven, gradle, npm)",
-                    "hint": "Specify build_tool parameter explicitly",
-                }
-
-            took_ms = int((time.time() - start_time) * 1000)
-            return TokenAwareFormatter.add_metadata(result, correlation_id, took_ms, output_format)
+            result = await cached_result(cache_key, compute)
+
+            took_ms = now_ms() - start_time
+            return TokenAwareFormatter.add_metadata(
+                dict(result), correlation_id, took_ms, output_format
+            )
 
-    mcp_server.register_tool(
+    tools.append(
         Tool(
             name="analyze_build_log",
             description="Analyze build logs with build tool-specific parsers (Maven, Gradle, NPM) for detailed error analysis",
             parameters=[
-                ToolParameter("name", ToolParameterType.STRING, "Full job name", required=True),
-                ToolParameter(
-                    "number",
-                    ToolParameterType.STRING,
-                    "Build number or 'last'",
-                    required=False,
-                    default="last",
-                ),
+                PARAM_JOB_NAME,
+                PARAM_NUMBER_OR_LAST,
                 ToolParameter(
                     "build_tool",
                     ToolParameterType.STRING,
@@ -406,14 +553,7 @@ def register_advanced_tools(mcp_server, jenkins_adapter, config):
                     "Maximum log bytes to analyze",
                     required=False,
                 ),
-                ToolParameter(
-                    "format",
-                    ToolParameterType.STRING,
-                    "Output format",
-                    required=False,
-                    default="summary",
-                    enum=["summary", "full"],
-                ),
+                PARAM_FORMAT_SUMMARY_FULL,
             ],
             handler=analyze_build_log_handler,
         )
@@ -421,8 +561,8 @@ def register_advanced_tools(mcp_server, jenkins_adapter, config):
 
     # retry_flaky_build
     async def retry_flaky_build_handler(args: dict[str, Any]) -> dict[str, Any]:
-        correlation_id = str(uuid.uuid4())
-        start_time = time.time()
+        correlation_id = new_correlation_id()
+        start_time = now_ms()
 
         with RequestLogger(logger, "retry_flaky_build", correlation_id):
             job_name = args["name"]
@@ -430,7 +570,7 @@ def register_advanced_tools(mcp_server, jenkins_adapter, config):
             delay_seconds = args.get("delay_seconds", 5)
             parameters = args.get("parameters", {})
             format_str = args.get("format", "summary")
-            output_format = OutputFormat(format_str)
+            output_format = parse_output_format(format_str)
 
             retries = []
             success = False
@@ -440,34 +580,55 @@ def register_advanced_tools(mcp_server, jenkins_adapter, config):
 
                 # Trigger build
                 try:
-                    queue_id = jenkins_adapter.build_job(job_name, parameters)
-
-                    # Wait a bit for build to start
-                    import asyncio
-
-                    await asyncio.sleep(delay_seconds)
-
-                    # Get latest build info
-                    job_info = jenkins_adapter.get_job_info(job_name)
-                    last_build = job_info.get("lastBuild")
+                    queue_id = await asyncio.to_thread(
+                        jenkins_adapter.build_job, job_name, parameters
+                    )
+
+                    # Poll the queue item until Jenkins assigns a build
+                    # number — unlike reading lastBuild off the full job
+                    # blob, this cannot attach to someone else's build —
+                    # then poll that specific build until it has a result.
+                    # Exponential backoff keeps slow-to-schedule builds
+                    # from burning API calls; the shared deadline keeps a
+                    # stuck queue item or never-finishing build from
+                    # hanging the tool call.
+                    backoff = delay_seconds
+                    deadline = time.monotonic() + _RETRY_WAIT_DEADLINE_SECONDS
+                    item = await asyncio.to_thread(jenkins_adapter.get_queue_item, queue_id)
+                    while not item.get("executable"):
+                        if time.monotonic() >= deadline:
+                            raise TimeoutError("timed out waiting for build")
+                        await asyncio.sleep(backoff)
+                        backoff = min(backoff * 1.5, 30)
+                        item = await asyncio.to_thread(jenkins_adapter.get_queue_item, queue_id)
+
+                    build_number = item["executable"]["number"]
+                    build_info = await asyncio.to_thread(
+                        jenkins_adapter.get_build_info, job_name, build_number, tree="result"
+                    )
+                    while build_info.get("result") is None:
+                        if time.monotonic() >= deadline:
+                            raise TimeoutError("timed out waiting for build")
+                        await asyncio.sleep(backoff)
+                        backoff = min(backoff * 1.5, 30)
+                        build_info = await asyncio.to_thread(
+                            jenkins_adapter.get_build_info, job_name, build_number, tree="result"
+                        )
 
-                    if last_build:
-                        build_number = last_build["number"]
-                        build_info = jenkins_adapter.get_build_info(job_name, build_number)
-                        result_status = build_info.get("result", "UNKNOWN")
+                    result_status = build_info.get("result", "UNKNOWN")
 
-                        retries.append(
-                            {
-                                "attempt": attempt,
-                                "build_number": build_number,
-                                "result": result_status,
-                                "queue_id": queue_id,
-                            }
-                        )
+                    retries.append(
+                        {
+                            "attempt": attempt,
+                            "build_number": build_number,
+                            "result": result_status,
+                            "queue_id": queue_id,
+                        }
+                    )
 
-                        if result_status == "SUCCESS":
-                            success = True
-                            break
+                    if result_status == "SUCCESS":
+                        success = True
+                        break
 
                 except Exception as e:
                     logger.error(f"Retry attempt {attempt} failed: {e}")
@@ -490,15 +651,15 @@ def register_advanced_tools(mcp_server, jenkins_adapter, config):
             else:
                 result["message"] = f"Build failed after {len(retries)} attempt(s)"
 
-            took_ms = int((time.time() - start_time) * 1000)
+            took_ms = now_ms() - start_time
             return TokenAwareFormatter.add_metadata(result, correlation_id, took_ms, output_format)
 
-    mcp_server.register_tool(
+    tools.append(
         Tool(
             name="retry_flaky_build",
             description="Retry a flaky build multiple times until it succeeds or max retries reached",
             parameters=[
-                ToolParameter("name", ToolParameterType.STRING, "Full job name", required=True),
+                PARAM_JOB_NAME,
                 ToolParameter(
                     "max_retries",
                     ToolParameterType.NUMBER,
@@ -516,62 +677,137 @@ def register_advanced_tools(mcp_server, jenkins_adapter, config):
                 ToolParameter(
                     "parameters", ToolParameterType.OBJECT, "Build parameters", required=False
                 ),
-                ToolParameter(
-                    "format",
-                    ToolParameterType.STRING,
-                    "Output format",
-                    required=False,
-                    default="summary",
-                    enum=["summary", "full"],
-                ),
+                PARAM_FORMAT_SUMMARY_FULL,
             ],
             handler=retry_flaky_build_handler,
         )
     )
 
-
-def _generate_hypotheses(error_lines: list[str]) -> list[str]:
-    """Generate failure hypotheses based on error patterns."""
+    mcp_server.register_tools(tools)
+
+
+# Keyword scanning for hypothesis/next-step selection. One precompiled
+# alternation scanned once over the joined error text replaces the
+# previous per-keyword substring checks. Longer tokens are listed before
+# the shorter tokens they contain so the regex prefers them; when one
+# matches, _TOKEN_IMPLIES re-adds the shorter token the match consumed,
+# preserving plain-substring semantics.
+#
+# The inputs here are a handful of error lines (a few KB at most), so
+# the stdlib regex pass is already far from the bottleneck; a SIMD
+# literal matcher such as hyperscan would only pay off on much larger
+# blobs and would add a binary dependency, so re stays the sole
+# implementation.
+_ERROR_TOKEN_RE = re.compile(
+    "|".join(
+        (
+            "timed out",
+            "timeout",
+            "out of memory",
+            "oom",
+            "connection refused",
+            "connection reset",
+            "permission denied",
+            "forbidden",
+            "no such file",
+            "not found",
+            "compilation error",
+            "syntax error",
+            "memory",
+            "error",
+            "fail",
+            "test",
+            "npm",
+            "yarn",
+            "package",
+        )
+    ),
+    re.IGNORECASE,
+)
+
+_TOKEN_IMPLIES = {
+    "compilation error": ("error",),
+    "syntax error": ("error",),
+    "out of memory": ("memory",),
+}
+
+# (tokens that trigger the hypothesis, hypothesis text), in report order.
+# The token groups are frozensets so the per-call check is one C-level
+# set intersection against the scanned tokens.
+_HYPOTHESES = (
+    (frozenset({"timeout", "timed out"}), "Timeout: Operation exceeded time limit"),
+    (frozenset({"out of memory", "oom"}), "Out of Memory: Insufficient heap or memory allocation"),
+    (
+        frozenset({"connection refused", "connection reset"}),
+        "Network Issue: Connection to external service failed",
+    ),
+    (frozenset({"permission denied", "forbidden"}), "Permission Issue: Insufficient access rights"),
+    (
+        frozenset({"no such file", "not found"}),
+        "Missing Resource: Required file or dependency not found",
+    ),
+    (
+        frozenset({"compilation error", "syntax error"}),
+        "Code Error: Compilation or syntax issue in source",
+    ),
+)
+
+_DEPENDENCY_TOKENS = frozenset({"npm", "yarn", "package"})
+
+
+def _scan_error_tokens(error_lines: list[str]) -> set[str]:
+    """Collect the error keywords present in the joined error lines."""
+    text = " ".join(error_lines)
+    tokens = {m.group(0).lower() for m in _ERROR_TOKEN_RE.finditer(text)}
+    for token, implied in _TOKEN_IMPLIES.items():
+        if token in tokens:
+            tokens.update(implied)
+    return tokens
+
+
+def _generate_hypotheses(error_lines: list[str], tokens: set[str] | None = None) -> list[str]:
+    """Generate failure hypotheses based on error patterns.
+
+    ``tokens`` lets callers that already scanned the error lines pass
+    the token set in rather than paying a second scan.
+    """
+    if tokens is None:
+        tokens = _scan_error_tokens(error_lines)
+
+    # Stop as soon as five hypotheses accumulate instead of evaluating
+    # every category and truncating at the end
     hypotheses = []
+    for needles, text in _HYPOTHESES:
+        if not tokens.isdisjoint(needles):
+            hypotheses.append(text)
+            if len(hypotheses) == 5:
+                return hypotheses
 
-    # Join all error lines for pattern matching
-    all_errors = " ".join(error_lines).lower()
-
-    # Common error patterns
-    if "timeout" in all_errors or "timed out" in all_errors:
-        hypotheses.append("Timeout: Operation exceeded time limit")
-
-    if "out of memory" in all_errors or "oom" in all_errors:
-        hypotheses.append("Out of Memory: Insufficient heap or memory allocation")
-
-    if "connection refused" in all_errors or "connection reset" in all_errors:
-        hypotheses.append("Network Issue: Connection to external service failed")
-
-    if "permission denied" in all_errors or "forbidden" in all_errors:
-        hypotheses.append("Permission Issue: Insufficient access rights")
-
-    if "no such file" in all_errors or "not found" in all_errors:
-        hypotheses.append("Missing Resource: Required file or dependency not found")
-
-    if "compilation error" in all_errors or "syntax error" in all_errors:
-        hypotheses.append("Code Error: Compilation or syntax issue in source")
-
-    if "test" in all_errors and ("fail" in all_errors or "error" in all_errors):
+    if "test" in tokens and ("fail" in tokens or "error" in tokens):
         hypotheses.append("Test Failure: One or more tests did not pass")
+        if len(hypotheses) == 5:
+            return hypotheses
 
-    if "npm" in all_errors or "yarn" in all_errors or "package" in all_errors:
+    if not tokens.isdisjoint(_DEPENDENCY_TOKENS):
         hypotheses.append("Dependency Issue: Package installation or resolution failed")
 
     if not hypotheses:
         hypotheses.append("Unknown: Review error logs for specific failure patterns")
 
-    return hypotheses[:5]  # Top 5
+    return hypotheses
 
 
 def _generate_next_steps(
-    failing_stages: list[str], error_lines: list[str], has_changes: bool
+    failing_stages: list[str],
+    error_lines: list[str],
+    has_changes: bool,
+    tokens: set[str] | None = None,
 ) -> list[str]:
-    """Generate recommended next steps for failure investigation."""
+    """Generate recommended next steps for failure investigation.
+
+    ``tokens`` lets callers that already scanned the error lines pass
+    the token set in rather than paying a second scan.
+    """
     steps = []
 
     if failing_stages:
@@ -587,14 +823,15 @@ def _generate_next_steps(
 
     steps.append("Compare with last successful build for environmental differences")
 
-    all_errors = " ".join(error_lines).lower()
-    if "test" in all_errors:
+    if tokens is None:
+        tokens = _scan_error_tokens(error_lines)
+    if "test" in tokens:
         steps.append("Run failing tests locally to debug")
 
-    if "timeout" in all_errors:
+    if "timeout" in tokens:
         steps.append("Increase timeout limits or optimize slow operations")
 
-    if "memory" in all_errors:
+    if "memory" in tokens:
         steps.append("Increase memory allocation or check for memory leaks")
 
     return steps[:7]  # Top 7
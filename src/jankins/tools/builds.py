@@ -1,14 +1,22 @@
 """Build-related MCP tools."""
 
+import asyncio
 import logging
-import time
-import uuid
 from typing import Any
 
 from ..errors import InvalidParamsError
 from ..formatters import OutputFormat, TokenAwareFormatter
-from ..logging_utils import RequestLogger
-from ..mcp.protocol import Tool, ToolParameter, ToolParameterType
+from ..logging_utils import RequestLogger, new_correlation_id, now_ms
+from ..mcp.protocol import Tool
+from ._common import (
+    PARAM_FORMAT_SUMMARY_FULL,
+    PARAM_FORMAT_SUMMARY_FULL_IDS,
+    PARAM_JOB_NAME,
+    PARAM_NUMBER_OR_LAST,
+    parse_build_args,
+    resolve_build_number,
+)
+from ._singleflight import run_once
 
 logger = logging.getLogger(__name__)
 
@@ -18,61 +26,68 @@ def register_build_tools(mcp_server, jenkins_adapter, config):
 
     # get_build
     async def get_build_handler(args: dict[str, Any]) -> dict[str, Any]:
-        correlation_id = str(uuid.uuid4())
-        start_time = time.time()
+        correlation_id = new_correlation_id()
+        start_time = now_ms()
 
         with RequestLogger(logger, "get_build", correlation_id):
-            job_name = args["name"]
-            number_or_last = args.get("number", "last")
-            format_str = args.get("format", "summary")
-            output_format = OutputFormat(format_str)
-
-            # Get build number
-            if number_or_last == "last":
-                job_info = jenkins_adapter.get_job_info(job_name)
-                last_build = job_info.get("lastBuild")
-                if not last_build:
-                    raise InvalidParamsError(
-                        f"Job '{job_name}' has no builds", hint="Trigger a build first"
-                    )
-                build_number = last_build["number"]
+            params = parse_build_args(args)
+
+            # Restrict the response to what format_build reads; FULL
+            # needs the whole blob
+            if params.format == OutputFormat.IDS:
+                tree = "number,url,result"
+            elif params.format == OutputFormat.SUMMARY:
+                tree = (
+                    "number,result,duration,timestamp,building,url,"
+                    "changeSet[items[commitId]],artifacts[fileName]"
+                )
             else:
-                try:
-                    build_number = int(number_or_last)
-                except ValueError:
+                tree = None
+
+            if params.number == "last" and tree is not None:
+                # One tree-scoped job request returns the last build
+                # directly instead of resolving its number first;
+                # identical concurrent calls share the one fetch
+                build_info = await run_once(
+                    ("get_last_build_info", params.name, tree),
+                    lambda: asyncio.to_thread(
+                        jenkins_adapter.get_last_build_info, params.name, tree
+                    ),
+                )
+                if not build_info:
                     raise InvalidParamsError(
-                        f"Invalid build number: {number_or_last}", hint="Provide a number or 'last'"
+                        f"Job '{params.name}' has no builds", hint="Trigger a build first"
                     )
-
-            build_info = jenkins_adapter.get_build_info(job_name, build_number)
+            else:
+                build_number = await asyncio.to_thread(
+                    resolve_build_number, jenkins_adapter, config, params.name, params.number
+                )
+                build_info = await run_once(
+                    ("get_build_info", params.name, build_number, tree),
+                    lambda: asyncio.to_thread(
+                        jenkins_adapter.get_build_info, params.name, build_number, tree=tree
+                    ),
+                )
 
             # Format response
-            result = TokenAwareFormatter.format_build(build_info, format=output_format)
+            result = TokenAwareFormatter.format_build(build_info, format=params.format)
+            if result is build_info:
+                # FULL passes the fetched dict through, and run_once
+                # shares it across concurrent identical calls; copy
+                # before add_metadata stamps _meta in place
+                result = dict(result)
 
-            took_ms = int((time.time() - start_time) * 1000)
-            return TokenAwareFormatter.add_metadata(result, correlation_id, took_ms, output_format)
+            took_ms = now_ms() - start_time
+            return TokenAwareFormatter.add_metadata(result, correlation_id, took_ms, params.format)
 
     mcp_server.register_tool(
         Tool(
             name="get_build",
             description="Get information about a specific build or the last build",
             parameters=[
-                ToolParameter("name", ToolParameterType.STRING, "Full job name", required=True),
-                ToolParameter(
-                    "number",
-                    ToolParameterType.STRING,
-                    "Build number or 'last'",
-                    required=False,
-                    default="last",
-                ),
-                ToolParameter(
-                    "format",
-                    ToolParameterType.STRING,
-                    "Output format",
-                    required=False,
-                    default="summary",
-                    enum=["summary", "full", "ids"],
-                ),
+                PARAM_JOB_NAME,
+                PARAM_NUMBER_OR_LAST,
+                PARAM_FORMAT_SUMMARY_FULL_IDS,
             ],
             handler=get_build_handler,
         )
@@ -80,30 +95,37 @@ def register_build_tools(mcp_server, jenkins_adapter, config):
 
     # get_build_changes
     async def get_changes_handler(args: dict[str, Any]) -> dict[str, Any]:
-        correlation_id = str(uuid.uuid4())
-        start_time = time.time()
+        correlation_id = new_correlation_id()
+        start_time = now_ms()
 
         with RequestLogger(logger, "get_build_changes", correlation_id):
-            job_name = args["name"]
-            number_or_last = args.get("number", "last")
-            format_str = args.get("format", "summary")
-            output_format = OutputFormat(format_str)
-
-            # Get build number
-            if number_or_last == "last":
-                job_info = jenkins_adapter.get_job_info(job_name)
-                last_build = job_info.get("lastBuild")
-                if not last_build:
-                    raise InvalidParamsError(f"Job '{job_name}' has no builds")
-                build_number = last_build["number"]
+            params = parse_build_args(args)
+
+            # Summary mode only reads the commit id, author, and message
+            if params.format == OutputFormat.SUMMARY:
+                tree = "number,changeSet[items[commitId,author[fullName],msg]]"
+            else:
+                tree = None
+
+            if params.number == "last" and tree is not None:
+                build_info = await asyncio.to_thread(
+                    jenkins_adapter.get_last_build_info, params.name, tree
+                )
+                if not build_info:
+                    raise InvalidParamsError(f"Job '{params.name}' has no builds")
+                build_number = build_info["number"]
             else:
-                build_number = int(number_or_last)
+                build_number = await asyncio.to_thread(
+                    resolve_build_number, jenkins_adapter, config, params.name, params.number
+                )
+                build_info = await asyncio.to_thread(
+                    jenkins_adapter.get_build_info, params.name, build_number, tree=tree
+                )
 
-            build_info = jenkins_adapter.get_build_info(job_name, build_number)
             change_set = build_info.get("changeSet", {})
             items = change_set.get("items", [])
 
-            if output_format == OutputFormat.SUMMARY:
+            if params.format == OutputFormat.SUMMARY:
                 result = {
                     "build_number": build_number,
                     "changes_count": len(items),
@@ -123,30 +145,17 @@ def register_build_tools(mcp_server, jenkins_adapter, config):
                     "changes": items,
                 }
 
-            took_ms = int((time.time() - start_time) * 1000)
-            return TokenAwareFormatter.add_metadata(result, correlation_id, took_ms, output_format)
+            took_ms = now_ms() - start_time
+            return TokenAwareFormatter.add_metadata(result, correlation_id, took_ms, params.format)
 
     mcp_server.register_tool(
         Tool(
             name="get_build_changes",
             description="Get SCM changes (commits) for a build",
             parameters=[
-                ToolParameter("name", ToolParameterType.STRING, "Full job name", required=True),
-                ToolParameter(
-                    "number",
-                    ToolParameterType.STRING,
-                    "Build number or 'last'",
-                    required=False,
-                    default="last",
-                ),
-                ToolParameter(
-                    "format",
-                    ToolParameterType.STRING,
-                    "Output format",
-                    required=False,
-                    default="summary",
-                    enum=["summary", "full"],
-                ),
+                PARAM_JOB_NAME,
+                PARAM_NUMBER_OR_LAST,
+                PARAM_FORMAT_SUMMARY_FULL,
             ],
             handler=get_changes_handler,
         )
@@ -154,29 +163,36 @@ def register_build_tools(mcp_server, jenkins_adapter, config):
 
     # get_build_artifacts
     async def get_artifacts_handler(args: dict[str, Any]) -> dict[str, Any]:
-        correlation_id = str(uuid.uuid4())
-        start_time = time.time()
+        correlation_id = new_correlation_id()
+        start_time = now_ms()
 
         with RequestLogger(logger, "get_build_artifacts", correlation_id):
-            job_name = args["name"]
-            number_or_last = args.get("number", "last")
-            format_str = args.get("format", "summary")
-            output_format = OutputFormat(format_str)
-
-            # Get build number
-            if number_or_last == "last":
-                job_info = jenkins_adapter.get_job_info(job_name)
-                last_build = job_info.get("lastBuild")
-                if not last_build:
-                    raise InvalidParamsError(f"Job '{job_name}' has no builds")
-                build_number = last_build["number"]
+            params = parse_build_args(args)
+
+            # Summary mode only reads the artifact name, size, and path
+            if params.format == OutputFormat.SUMMARY:
+                tree = "number,artifacts[fileName,fileSize,relativePath]"
+            else:
+                tree = None
+
+            if params.number == "last" and tree is not None:
+                build_info = await asyncio.to_thread(
+                    jenkins_adapter.get_last_build_info, params.name, tree
+                )
+                if not build_info:
+                    raise InvalidParamsError(f"Job '{params.name}' has no builds")
+                build_number = build_info["number"]
             else:
-                build_number = int(number_or_last)
+                build_number = await asyncio.to_thread(
+                    resolve_build_number, jenkins_adapter, config, params.name, params.number
+                )
+                build_info = await asyncio.to_thread(
+                    jenkins_adapter.get_build_info, params.name, build_number, tree=tree
+                )
 
-            build_info = jenkins_adapter.get_build_info(job_name, build_number)
             artifacts = build_info.get("artifacts", [])
 
-            if output_format == OutputFormat.SUMMARY:
+            if params.format == OutputFormat.SUMMARY:
                 result = {
                     "build_number": build_number,
                     "artifacts_count": len(artifacts),
@@ -197,30 +213,17 @@ def register_build_tools(mcp_server, jenkins_adapter, config):
                     "base_url": build_info.get("url"),
                 }
 
-            took_ms = int((time.time() - start_time) * 1000)
-            return TokenAwareFormatter.add_metadata(result, correlation_id, took_ms, output_format)
+            took_ms = now_ms() - start_time
+            return TokenAwareFormatter.add_metadata(result, correlation_id, took_ms, params.format)
 
     mcp_server.register_tool(
         Tool(
             name="get_build_artifacts",
             description="Get artifacts produced by a build",
             parameters=[
-                ToolParameter("name", ToolParameterType.STRING, "Full job name", required=True),
-                ToolParameter(
-                    "number",
-                    ToolParameterType.STRING,
-                    "Build number or 'last'",
-                    required=False,
-                    default="last",
-                ),
-                ToolParameter(
-                    "format",
-                    ToolParameterType.STRING,
-                    "Output format",
-                    required=False,
-                    default="summary",
-                    enum=["summary", "full"],
-                ),
+                PARAM_JOB_NAME,
+                PARAM_NUMBER_OR_LAST,
+                PARAM_FORMAT_SUMMARY_FULL,
             ],
             handler=get_artifacts_handler,
         )
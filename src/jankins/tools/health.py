@@ -1,12 +1,11 @@
 """Health and auth-related MCP tools."""
 
+import asyncio
 import logging
-import time
-import uuid
 from typing import Any
 
 from ..formatters import OutputFormat, TokenAwareFormatter
-from ..logging_utils import RequestLogger
+from ..logging_utils import RequestLogger, new_correlation_id, now_ms
 from ..mcp.protocol import Tool
 
 logger = logging.getLogger(__name__)
@@ -17,11 +16,11 @@ def register_health_tools(mcp_server, jenkins_adapter, config):
 
     # whoami
     async def whoami_handler(args: dict[str, Any]) -> dict[str, Any]:
-        correlation_id = str(uuid.uuid4())
-        start_time = time.time()
+        correlation_id = new_correlation_id()
+        start_time = now_ms()
 
         with RequestLogger(logger, "whoami", correlation_id):
-            whoami = jenkins_adapter.get_whoami()
+            whoami = await asyncio.to_thread(jenkins_adapter.get_whoami)
 
             result = {
                 "id": whoami.get("id"),
@@ -30,7 +29,7 @@ def register_health_tools(mcp_server, jenkins_adapter, config):
                 "authorities": whoami.get("authorities", []),
             }
 
-            took_ms = int((time.time() - start_time) * 1000)
+            took_ms = now_ms() - start_time
             return TokenAwareFormatter.add_metadata(
                 result, correlation_id, took_ms, OutputFormat.SUMMARY
             )
@@ -46,13 +45,18 @@ def register_health_tools(mcp_server, jenkins_adapter, config):
 
     # get_status
     async def get_status_handler(args: dict[str, Any]) -> dict[str, Any]:
-        correlation_id = str(uuid.uuid4())
-        start_time = time.time()
+        correlation_id = new_correlation_id()
+        start_time = now_ms()
 
         with RequestLogger(logger, "get_status", correlation_id):
-            # Get Jenkins version and queue info
-            version = jenkins_adapter.get_version()
-            queue = jenkins_adapter.get_queue_info()
+            # Get Jenkins version and queue info; the two calls are
+            # independent, so overlap them instead of paying for both
+            # round trips back to back. Only the queue length is
+            # reported, so fetch just the item ids.
+            version, queue = await asyncio.gather(
+                asyncio.to_thread(jenkins_adapter.get_version),
+                asyncio.to_thread(jenkins_adapter.get_queue_info, "items[id]"),
+            )
 
             result = {
                 "jenkins_version": version,
@@ -64,7 +68,7 @@ def register_health_tools(mcp_server, jenkins_adapter, config):
                 },
             }
 
-            took_ms = int((time.time() - start_time) * 1000)
+            took_ms = now_ms() - start_time
             return TokenAwareFormatter.add_metadata(
                 result, correlation_id, took_ms, OutputFormat.SUMMARY
             )
@@ -80,35 +84,48 @@ def register_health_tools(mcp_server, jenkins_adapter, config):
 
     # summarize_queue
     async def summarize_queue_handler(args: dict[str, Any]) -> dict[str, Any]:
-        correlation_id = str(uuid.uuid4())
-        start_time = time.time()
+        correlation_id = new_correlation_id()
+        start_time = now_ms()
 
         with RequestLogger(logger, "summarize_queue", correlation_id):
-            queue = jenkins_adapter.get_queue_info()
+            # The summary reads five fields per item; asking Jenkins
+            # for just those cuts the response roughly tenfold
+            queue = await asyncio.to_thread(
+                jenkins_adapter.get_queue_info, "items[id,why,blocked,stuck,task[name]]"
+            )
 
-            # Compact summary
+            # Compact summary: one pass collects the top-20 items and
+            # the blocked/stuck counts instead of walking the queue
+            # three times
             queue_items = []
-            for item in queue[:20]:  # Top 20
-                task = item.get("task", {})
-                queue_items.append(
-                    {
-                        "id": item.get("id"),
-                        "job": task.get("name"),
-                        "why": item.get("why", "")[:100],  # Truncate reason
-                        "blocked": item.get("blocked", False),
-                        "stuck": item.get("stuck", False),
-                    }
-                )
+            blocked_count = 0
+            stuck_count = 0
+            for i, item in enumerate(queue):
+                blocked = bool(item.get("blocked"))
+                stuck = bool(item.get("stuck"))
+                blocked_count += blocked
+                stuck_count += stuck
+                if i < 20:  # Top 20
+                    task = item.get("task") or {}
+                    queue_items.append(
+                        {
+                            "id": item.get("id"),
+                            "job": task.get("name"),
+                            "why": item.get("why", "")[:100],  # Truncate reason
+                            "blocked": blocked,
+                            "stuck": stuck,
+                        }
+                    )
 
             result = {
                 "total_queued": len(queue),
                 "shown": min(20, len(queue)),
-                "blocked_count": sum(1 for i in queue if i.get("blocked")),
-                "stuck_count": sum(1 for i in queue if i.get("stuck")),
+                "blocked_count": blocked_count,
+                "stuck_count": stuck_count,
                 "items": queue_items,
             }
 
-            took_ms = int((time.time() - start_time) * 1000)
+            took_ms = now_ms() - start_time
             return TokenAwareFormatter.add_metadata(
                 result, correlation_id, took_ms, OutputFormat.SUMMARY
             )
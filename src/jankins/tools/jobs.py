@@ -1,13 +1,16 @@
 """Job-related MCP tools."""
 
+import asyncio
 import logging
-import time
-import uuid
+from bisect import bisect_left
+from itertools import islice
 from typing import Any
 
-from ..formatters import OutputFormat, TokenAwareFormatter
-from ..logging_utils import RequestLogger
+from ..formatters import OutputFormat, TokenAwareFormatter, parse_output_format
+from ..logging_utils import RequestLogger, new_correlation_id, now_ms
 from ..mcp.protocol import Tool, ToolParameter, ToolParameterType
+from ._common import PARAM_FORMAT_SUMMARY_FULL_IDS, PARAM_JOB_NAME, invalidate_last_build
+from ._singleflight import run_once
 
 logger = logging.getLogger(__name__)
 
@@ -15,29 +18,46 @@ logger = logging.getLogger(__name__)
 def register_job_tools(mcp_server, jenkins_adapter, config):
     """Register job-related tools."""
 
+    def fetch_sorted_jobs() -> tuple[list[str], list[dict[str, Any]]]:
+        """Fetch all jobs and index them sorted by fullname.
+
+        The sorted name index lets prefix filtering bisect to its
+        range instead of scanning every job per page.
+        """
+        jobs = jenkins_adapter.get_all_jobs_with_state(folder_depth=10)
+        jobs.sort(key=lambda j: j["fullname"])
+        return [j["fullname"] for j in jobs], jobs
+
     # list_jobs
     async def list_jobs_handler(args: dict[str, Any]) -> dict[str, Any]:
-        correlation_id = str(uuid.uuid4())
-        start_time = time.time()
+        correlation_id = new_correlation_id()
+        start_time = now_ms()
 
         with RequestLogger(logger, "list_jobs", correlation_id):
             prefix = args.get("prefix", "")
             page = args.get("page", 1)
             page_size = args.get("page_size", 50)
-            format_str = args.get("format", "summary")
-            output_format = OutputFormat(format_str)
+            output_format = parse_output_format(args.get("format", "summary"))
 
-            # Get all jobs
-            all_jobs = jenkins_adapter.get_all_jobs(folder_depth=10)
+            # Get all jobs in one tree-scoped request; the formatter
+            # only reads name, color, and url
+            names, all_jobs = await run_once(
+                ("list_jobs",),
+                lambda: asyncio.to_thread(fetch_sorted_jobs),
+            )
 
-            # Filter by prefix if provided
+            # Prefix filter as a bisected range over the sorted names:
+            # "\uffff" sorts after any continuation of the prefix, so
+            # [lo, hi) covers exactly the jobs that start with it
             if prefix:
-                all_jobs = [j for j in all_jobs if j["fullname"].startswith(prefix)]
+                lo = bisect_left(names, prefix)
+                hi = bisect_left(names, prefix + "\uffff", lo)
+            else:
+                lo, hi = 0, len(all_jobs)
 
-            # Pagination
-            start_idx = (page - 1) * page_size
-            end_idx = start_idx + page_size
-            page_jobs = all_jobs[start_idx:end_idx]
+            # Pagination indexes directly into the matched range
+            start_idx = lo + (page - 1) * page_size
+            page_jobs = all_jobs[start_idx : min(start_idx + page_size, hi)]
 
             # Format response
             result = TokenAwareFormatter.format_job_list(
@@ -46,9 +66,9 @@ def register_job_tools(mcp_server, jenkins_adapter, config):
 
             result["page"] = page
             result["page_size"] = page_size
-            result["total_pages"] = (len(all_jobs) + page_size - 1) // page_size
+            result["total_pages"] = (hi - lo + page_size - 1) // page_size
 
-            took_ms = int((time.time() - start_time) * 1000)
+            took_ms = now_ms() - start_time
             return TokenAwareFormatter.add_metadata(result, correlation_id, took_ms, output_format)
 
     mcp_server.register_tool(
@@ -73,14 +93,7 @@ def register_job_tools(mcp_server, jenkins_adapter, config):
                     required=False,
                     default=50,
                 ),
-                ToolParameter(
-                    "format",
-                    ToolParameterType.STRING,
-                    "Output format",
-                    required=False,
-                    default="summary",
-                    enum=["summary", "full", "ids"],
-                ),
+                PARAM_FORMAT_SUMMARY_FULL_IDS,
             ],
             handler=list_jobs_handler,
         )
@@ -88,15 +101,30 @@ def register_job_tools(mcp_server, jenkins_adapter, config):
 
     # get_job
     async def get_job_handler(args: dict[str, Any]) -> dict[str, Any]:
-        correlation_id = str(uuid.uuid4())
-        start_time = time.time()
+        correlation_id = new_correlation_id()
+        start_time = now_ms()
 
         with RequestLogger(logger, "get_job", correlation_id):
             job_name = args["name"]
-            format_str = args.get("format", "summary")
-            output_format = OutputFormat(format_str)
+            output_format = parse_output_format(args.get("format", "summary"))
 
-            job_info = jenkins_adapter.get_job_info(job_name)
+            # Fetch only the fields each format serializes; FULL keeps
+            # the unscoped blob
+            if output_format == OutputFormat.IDS:
+                tree = "name,fullName,url"
+            elif output_format == OutputFormat.SUMMARY:
+                tree = (
+                    "name,fullName,url,buildable,color,"
+                    "lastBuild[number],lastSuccessfulBuild[number],lastFailedBuild[number],"
+                    "healthReport[description,score]"
+                )
+            else:
+                tree = None
+
+            job_info = await run_once(
+                ("get_job", job_name, tree),
+                lambda: asyncio.to_thread(jenkins_adapter.get_job_info, job_name, tree=tree),
+            )
 
             # Format based on output format
             if output_format == OutputFormat.IDS:
@@ -106,30 +134,33 @@ def register_job_tools(mcp_server, jenkins_adapter, config):
                     "url": job_info["url"],
                 }
             elif output_format == OutputFormat.SUMMARY:
+                # Bind each build reference once instead of repeating
+                # the get-chains with throwaway {} fallbacks
+                last_build = job_info.get("lastBuild")
+                last_successful = job_info.get("lastSuccessfulBuild")
+                last_failed = job_info.get("lastFailedBuild")
                 result = {
                     "name": job_info["name"],
                     "fullname": job_info["fullName"],
                     "url": job_info["url"],
                     "buildable": job_info.get("buildable", False),
                     "color": job_info.get("color", "unknown"),
-                    "last_build": job_info.get("lastBuild", {}).get("number")
-                    if job_info.get("lastBuild")
-                    else None,
-                    "last_successful_build": job_info.get("lastSuccessfulBuild", {}).get("number")
-                    if job_info.get("lastSuccessfulBuild")
-                    else None,
-                    "last_failed_build": job_info.get("lastFailedBuild", {}).get("number")
-                    if job_info.get("lastFailedBuild")
-                    else None,
+                    "last_build": last_build["number"] if last_build else None,
+                    "last_successful_build": last_successful["number"] if last_successful else None,
+                    "last_failed_build": last_failed["number"] if last_failed else None,
+                    # Top 3 health reports, bounded without building
+                    # the full list first
                     "health_report": [
                         {"description": h.get("description"), "score": h.get("score")}
-                        for h in job_info.get("healthReport", [])
-                    ][:3],  # Top 3 health reports
+                        for h in islice(job_info.get("healthReport", ()), 3)
+                    ],
                 }
             else:  # FULL
-                result = job_info
+                # run_once shares job_info across concurrent identical
+                # calls; copy before add_metadata stamps _meta in place
+                result = dict(job_info)
 
-            took_ms = int((time.time() - start_time) * 1000)
+            took_ms = now_ms() - start_time
             return TokenAwareFormatter.add_metadata(result, correlation_id, took_ms, output_format)
 
     mcp_server.register_tool(
@@ -143,14 +174,7 @@ def register_job_tools(mcp_server, jenkins_adapter, config):
                     "Full job name (e.g., 'folder/subfolder/job')",
                     required=True,
                 ),
-                ToolParameter(
-                    "format",
-                    ToolParameterType.STRING,
-                    "Output format",
-                    required=False,
-                    default="summary",
-                    enum=["summary", "full", "ids"],
-                ),
+                PARAM_FORMAT_SUMMARY_FULL_IDS,
             ],
             handler=get_job_handler,
         )
@@ -158,14 +182,20 @@ def register_job_tools(mcp_server, jenkins_adapter, config):
 
     # trigger_build
     async def trigger_build_handler(args: dict[str, Any]) -> dict[str, Any]:
-        correlation_id = str(uuid.uuid4())
-        start_time = time.time()
+        correlation_id = new_correlation_id()
+        start_time = now_ms()
 
         with RequestLogger(logger, "trigger_build", correlation_id):
             job_name = args["name"]
             parameters = args.get("parameters", {})
 
-            queue_id = jenkins_adapter.build_job(job_name, parameters=parameters)
+            queue_id = await asyncio.to_thread(
+                jenkins_adapter.build_job, job_name, parameters=parameters
+            )
+
+            # The job's last build is about to change; drop the cached
+            # number so "last" lookups don't serve the previous build
+            invalidate_last_build(job_name)
 
             result = {
                 "queue_id": queue_id,
@@ -175,7 +205,7 @@ def register_job_tools(mcp_server, jenkins_adapter, config):
                 "message": f"Build queued for {job_name}",
             }
 
-            took_ms = int((time.time() - start_time) * 1000)
+            took_ms = now_ms() - start_time
             return TokenAwareFormatter.add_metadata(
                 result, correlation_id, took_ms, OutputFormat.SUMMARY
             )
@@ -185,7 +215,7 @@ def register_job_tools(mcp_server, jenkins_adapter, config):
             name="trigger_build",
             description="Trigger a new build for a Jenkins job with optional parameters",
             parameters=[
-                ToolParameter("name", ToolParameterType.STRING, "Full job name", required=True),
+                PARAM_JOB_NAME,
                 ToolParameter(
                     "parameters",
                     ToolParameterType.OBJECT,
@@ -200,12 +230,12 @@ def register_job_tools(mcp_server, jenkins_adapter, config):
 
     # enable_job
     async def enable_job_handler(args: dict[str, Any]) -> dict[str, Any]:
-        correlation_id = str(uuid.uuid4())
-        start_time = time.time()
+        correlation_id = new_correlation_id()
+        start_time = now_ms()
 
         with RequestLogger(logger, "enable_job", correlation_id):
             job_name = args["name"]
-            jenkins_adapter.enable_job(job_name)
+            await asyncio.to_thread(jenkins_adapter.enable_job, job_name)
 
             result = {
                 "job_name": job_name,
@@ -213,7 +243,7 @@ def register_job_tools(mcp_server, jenkins_adapter, config):
                 "message": f"Job {job_name} has been enabled",
             }
 
-            took_ms = int((time.time() - start_time) * 1000)
+            took_ms = now_ms() - start_time
             return TokenAwareFormatter.add_metadata(
                 result, correlation_id, took_ms, OutputFormat.SUMMARY
             )
@@ -223,7 +253,7 @@ def register_job_tools(mcp_server, jenkins_adapter, config):
             name="enable_job",
             description="Enable a Jenkins job to allow builds",
             parameters=[
-                ToolParameter("name", ToolParameterType.STRING, "Full job name", required=True),
+                PARAM_JOB_NAME,
             ],
             handler=enable_job_handler,
         )
@@ -231,12 +261,12 @@ def register_job_tools(mcp_server, jenkins_adapter, config):
 
     # disable_job
     async def disable_job_handler(args: dict[str, Any]) -> dict[str, Any]:
-        correlation_id = str(uuid.uuid4())
-        start_time = time.time()
+        correlation_id = new_correlation_id()
+        start_time = now_ms()
 
         with RequestLogger(logger, "disable_job", correlation_id):
             job_name = args["name"]
-            jenkins_adapter.disable_job(job_name)
+            await asyncio.to_thread(jenkins_adapter.disable_job, job_name)
 
             result = {
                 "job_name": job_name,
@@ -244,7 +274,7 @@ def register_job_tools(mcp_server, jenkins_adapter, config):
                 "message": f"Job {job_name} has been disabled",
             }
 
-            took_ms = int((time.time() - start_time) * 1000)
+            took_ms = now_ms() - start_time
             return TokenAwareFormatter.add_metadata(
                 result, correlation_id, took_ms, OutputFormat.SUMMARY
             )
@@ -254,7 +284,7 @@ def register_job_tools(mcp_server, jenkins_adapter, config):
             name="disable_job",
             description="Disable a Jenkins job to prevent builds",
             parameters=[
-                ToolParameter("name", ToolParameterType.STRING, "Full job name", required=True),
+                PARAM_JOB_NAME,
             ],
             handler=disable_job_handler,
         )
@@ -1,15 +1,21 @@
 """Log-related MCP tools with smart truncation and filtering."""
 
+import asyncio
 import logging
-import time
-import uuid
 from typing import Any
 
-from ..errors import InvalidParamsError
-from ..formatters import OutputFormat, TokenAwareFormatter
+from cachetools import LRUCache
+
+from ..formatters import OutputFormat, TokenAwareFormatter, parse_output_format
 from ..jenkins.progressive import ProgressiveLogClient
-from ..logging_utils import RequestLogger
+from ..logging_utils import RequestLogger, new_correlation_id, now_ms
 from ..mcp.protocol import Tool, ToolParameter, ToolParameterType
+from ._common import (
+    PARAM_FORMAT_SUMMARY_FULL,
+    PARAM_JOB_NAME,
+    PARAM_NUMBER_OR_LAST,
+    resolve_build_number,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -21,8 +27,8 @@ def register_log_tools(mcp_server, jenkins_adapter, config):
 
     # get_build_log
     async def get_log_handler(args: dict[str, Any]) -> dict[str, Any]:
-        correlation_id = str(uuid.uuid4())
-        start_time = time.time()
+        correlation_id = new_correlation_id()
+        start_time = now_ms()
 
         with RequestLogger(logger, "get_build_log", correlation_id):
             job_name = args["name"]
@@ -31,28 +37,37 @@ def register_log_tools(mcp_server, jenkins_adapter, config):
             max_bytes = args.get("max_bytes", config.log_max_bytes_default)
             filter_regex = args.get("filter_regex")
             redact = args.get("redact", True)
-            format_str = args.get("format", "summary")
-            output_format = OutputFormat(format_str)
-
-            # Get build number
-            if number_or_last == "last":
-                job_info = jenkins_adapter.get_job_info(job_name)
-                last_build = job_info.get("lastBuild")
-                if not last_build:
-                    raise InvalidParamsError(f"Job '{job_name}' has no builds")
-                build_number = last_build["number"]
-            else:
-                build_number = int(number_or_last)
+            output_format = parse_output_format(args.get("format", "summary"))
+
+            build_number = await asyncio.to_thread(
+                resolve_build_number, jenkins_adapter, config, job_name, number_or_last
+            )
 
             # Get log summary
-            summary = log_client.summarize_log(job_name, build_number, max_bytes)
+            summary = await asyncio.to_thread(
+                log_client.summarize_log, job_name, build_number, max_bytes
+            )
 
             # Get log chunk if full format requested
             chunks = None
             if output_format == OutputFormat.FULL:
-                chunk = log_client.get_log_chunk(
-                    job_name, build_number, start=start_byte, max_bytes=max_bytes
-                )
+                if max_bytes >= 2 * log_client.PARALLEL_PAGE_BYTES:
+                    # Big windows arrive faster as overlapped
+                    # page-sized range reads
+                    chunk = await log_client.get_log_chunk_parallel(
+                        job_name,
+                        build_number,
+                        start=start_byte,
+                        max_bytes=max_bytes,
+                    )
+                else:
+                    chunk = await asyncio.to_thread(
+                        log_client.get_log_chunk,
+                        job_name,
+                        build_number,
+                        start=start_byte,
+                        max_bytes=max_bytes,
+                    )
 
                 # Apply filters
                 text = chunk.text
@@ -76,7 +91,7 @@ def register_log_tools(mcp_server, jenkins_adapter, config):
             result["build_number"] = build_number
             result["job_name"] = job_name
 
-            took_ms = int((time.time() - start_time) * 1000)
+            took_ms = now_ms() - start_time
             return TokenAwareFormatter.add_metadata(result, correlation_id, took_ms, output_format)
 
     mcp_server.register_tool(
@@ -84,14 +99,8 @@ def register_log_tools(mcp_server, jenkins_adapter, config):
             name="get_build_log",
             description="Get build log with smart truncation and filtering. Returns summary by default, full text on request.",
             parameters=[
-                ToolParameter("name", ToolParameterType.STRING, "Full job name", required=True),
-                ToolParameter(
-                    "number",
-                    ToolParameterType.STRING,
-                    "Build number or 'last'",
-                    required=False,
-                    default="last",
-                ),
+                PARAM_JOB_NAME,
+                PARAM_NUMBER_OR_LAST,
                 ToolParameter(
                     "start",
                     ToolParameterType.NUMBER,
@@ -118,14 +127,7 @@ def register_log_tools(mcp_server, jenkins_adapter, config):
                     required=False,
                     default=True,
                 ),
-                ToolParameter(
-                    "format",
-                    ToolParameterType.STRING,
-                    "Output format",
-                    required=False,
-                    default="summary",
-                    enum=["summary", "full"],
-                ),
+                PARAM_FORMAT_SUMMARY_FULL,
             ],
             handler=get_log_handler,
         )
@@ -133,8 +135,8 @@ def register_log_tools(mcp_server, jenkins_adapter, config):
 
     # search_log
     async def search_log_handler(args: dict[str, Any]) -> dict[str, Any]:
-        correlation_id = str(uuid.uuid4())
-        start_time = time.time()
+        correlation_id = new_correlation_id()
+        start_time = now_ms()
 
         with RequestLogger(logger, "search_log", correlation_id):
             job_name = args["name"]
@@ -143,19 +145,13 @@ def register_log_tools(mcp_server, jenkins_adapter, config):
             window_lines = args.get("window_lines", 5)
             max_bytes = args.get("max_bytes", config.log_max_bytes_default)
 
-            # Get build number
-            if number_or_last == "last":
-                job_info = jenkins_adapter.get_job_info(job_name)
-                last_build = job_info.get("lastBuild")
-                if not last_build:
-                    raise InvalidParamsError(f"Job '{job_name}' has no builds")
-                build_number = last_build["number"]
-            else:
-                build_number = int(number_or_last)
+            build_number = await asyncio.to_thread(
+                resolve_build_number, jenkins_adapter, config, job_name, number_or_last
+            )
 
             # Search log
-            matches = log_client.search_log(
-                job_name, build_number, pattern, window_lines, max_bytes
+            matches = await asyncio.to_thread(
+                log_client.search_log, job_name, build_number, pattern, window_lines, max_bytes
             )
 
             result = {
@@ -172,7 +168,7 @@ def register_log_tools(mcp_server, jenkins_adapter, config):
                 ],
             }
 
-            took_ms = int((time.time() - start_time) * 1000)
+            took_ms = now_ms() - start_time
             return TokenAwareFormatter.add_metadata(
                 result, correlation_id, took_ms, OutputFormat.SUMMARY
             )
@@ -182,14 +178,8 @@ def register_log_tools(mcp_server, jenkins_adapter, config):
             name="search_log",
             description="Search build log for pattern and return matching lines with context",
             parameters=[
-                ToolParameter("name", ToolParameterType.STRING, "Full job name", required=True),
-                ToolParameter(
-                    "number",
-                    ToolParameterType.STRING,
-                    "Build number or 'last'",
-                    required=False,
-                    default="last",
-                ),
+                PARAM_JOB_NAME,
+                PARAM_NUMBER_OR_LAST,
                 ToolParameter(
                     "pattern",
                     ToolParameterType.STRING,
@@ -211,10 +201,26 @@ def register_log_tools(mcp_server, jenkins_adapter, config):
         )
     )
 
+    # Live-tail prefetch: after serving a chunk, the window behind it
+    # is fetched in the background so a client polling a fast-moving
+    # build gets its next chunk from memory instead of paying another
+    # Jenkins round trip
+    prefetch_buffer: LRUCache = LRUCache(maxsize=32)  # (job, build) -> LogChunk
+    prefetch_tasks: set[asyncio.Task] = set()
+
+    async def prefetch_chunk(job_name: str, build_number: int, start: int, max_bytes: int) -> None:
+        try:
+            chunk = await asyncio.to_thread(
+                log_client.get_log_chunk, job_name, build_number, start, max_bytes
+            )
+            prefetch_buffer[(job_name, build_number)] = chunk
+        except Exception as e:
+            logger.debug("Prefetch for %s #%d failed: %s", job_name, build_number, e)
+
     # tail_log_live (polling-based live tail)
     async def tail_log_live_handler(args: dict[str, Any]) -> dict[str, Any]:
-        correlation_id = str(uuid.uuid4())
-        start_time = time.time()
+        correlation_id = new_correlation_id()
+        start_time = now_ms()
 
         with RequestLogger(logger, "tail_log_live", correlation_id):
             job_name = args["name"]
@@ -222,20 +228,34 @@ def register_log_tools(mcp_server, jenkins_adapter, config):
             start_byte = args.get("start_byte", 0)
             max_bytes = args.get("max_bytes", config.log_max_bytes_default)
 
-            # Get log chunk starting from start_byte
-            chunk = log_client.get_log_chunk(job_name, build_number, start_byte, max_bytes)
+            # Serve from the prefetch buffer when it holds exactly the
+            # requested window; anything else falls through to Jenkins
+            chunk = prefetch_buffer.pop((job_name, build_number), None)
+            if chunk is None or chunk.start != start_byte:
+                chunk = await asyncio.to_thread(
+                    log_client.get_log_chunk, job_name, build_number, start_byte, max_bytes
+                )
+
+            if chunk.has_more:
+                task = asyncio.create_task(
+                    prefetch_chunk(job_name, build_number, chunk.end, max_bytes)
+                )
+                prefetch_tasks.add(task)
+                task.add_done_callback(prefetch_tasks.discard)
 
             result = {
                 "build_number": build_number,
                 "job_name": job_name,
                 "start_byte": start_byte,
-                "next_byte": chunk.next_byte,
+                "next_byte": chunk.end,
                 "has_more": chunk.has_more,
                 "log_content": chunk.text,
-                "line_count": len(chunk.text.split("\n")) if chunk.text else 0,
+                # count instead of split: no throwaway list just to
+                # learn how many lines the chunk holds
+                "line_count": chunk.text.count("\n") + 1 if chunk.text else 0,
             }
 
-            took_ms = int((time.time() - start_time) * 1000)
+            took_ms = now_ms() - start_time
             return TokenAwareFormatter.add_metadata(
                 result, correlation_id, took_ms, OutputFormat.FULL
             )
@@ -245,7 +265,7 @@ def register_log_tools(mcp_server, jenkins_adapter, config):
             name="tail_log_live",
             description="Get log chunk for live tailing (poll repeatedly with next_byte for streaming effect)",
             parameters=[
-                ToolParameter("name", ToolParameterType.STRING, "Full job name", required=True),
+                PARAM_JOB_NAME,
                 ToolParameter(
                     "build_number", ToolParameterType.NUMBER, "Build number", required=True
                 ),
@@ -1,47 +1,57 @@
 """SCM and pipeline-related MCP tools."""
 
+import asyncio
 import logging
-import time
-import uuid
 from typing import Any
 
-from ..errors import InvalidParamsError
-from ..formatters import OutputFormat, TokenAwareFormatter
-from ..logging_utils import RequestLogger
-from ..mcp.protocol import Tool, ToolParameter, ToolParameterType
+from ..formatters import OutputFormat, TokenAwareFormatter, parse_output_format
+from ..logging_utils import RequestLogger, new_correlation_id, now_ms
+from ..mcp.protocol import Tool
+from ._common import (
+    PARAM_FORMAT_SUMMARY_FULL,
+    PARAM_JOB_NAME,
+    PARAM_NUMBER_OR_LAST,
+    resolve_build_number,
+)
 
 logger = logging.getLogger(__name__)
 
+# Build actions whose _class marks them as SCM data; endswith takes
+# the tuple in one C-level call
+_SCM_SUFFIXES = ("GitSCM", "SubversionSCM")
+
+# The only action fields the response needs; full SCM actions carry
+# per-branch build data that can dwarf the rest of the payload
+_SCM_FIELDS = ("_class", "lastBuiltRevision", "remoteUrls", "mercurialRevisionNumber")
+
 
 def register_scm_tools(mcp_server, jenkins_adapter, config):
     """Register SCM and pipeline tools."""
 
     # get_job_scm
     async def get_job_scm_handler(args: dict[str, Any]) -> dict[str, Any]:
-        correlation_id = str(uuid.uuid4())
-        start_time = time.time()
+        correlation_id = new_correlation_id()
+        start_time = now_ms()
 
         with RequestLogger(logger, "get_job_scm", correlation_id):
             job_name = args["name"]
-            format_str = args.get("format", "summary")
-            output_format = OutputFormat(format_str)
+            output_format = parse_output_format(args.get("format", "summary"))
 
-            job_info = jenkins_adapter.get_job_info(job_name)
+            job_info = await asyncio.to_thread(jenkins_adapter.get_job_info, job_name)
             scm = job_info.get("scm", {})
 
             if output_format == OutputFormat.SUMMARY:
+                remote_configs = scm.get("userRemoteConfigs")
                 result = {
                     "job_name": job_name,
                     "scm_class": scm.get("_class", "unknown"),
-                    "url": scm.get("userRemoteConfigs", [{}])[0].get("url")
-                    if scm.get("userRemoteConfigs")
-                    else None,
-                    "branches": [b.get("name") for b in scm.get("branches", [])],
+                    "url": remote_configs[0].get("url") if remote_configs else None,
+                    "branches": [b.get("name") for b in scm.get("branches") or ()],
                 }
             else:  # FULL
                 result = {"job_name": job_name, "scm": scm}
 
-            took_ms = int((time.time() - start_time) * 1000)
+            took_ms = now_ms() - start_time
             return TokenAwareFormatter.add_metadata(result, correlation_id, took_ms, output_format)
 
     mcp_server.register_tool(
@@ -49,15 +59,8 @@ def register_scm_tools(mcp_server, jenkins_adapter, config):
             name="get_job_scm",
             description="Get SCM configuration for a job",
             parameters=[
-                ToolParameter("name", ToolParameterType.STRING, "Full job name", required=True),
-                ToolParameter(
-                    "format",
-                    ToolParameterType.STRING,
-                    "Output format",
-                    required=False,
-                    default="summary",
-                    enum=["summary", "full"],
-                ),
+                PARAM_JOB_NAME,
+                PARAM_FORMAT_SUMMARY_FULL,
             ],
             handler=get_job_scm_handler,
         )
@@ -65,37 +68,33 @@ def register_scm_tools(mcp_server, jenkins_adapter, config):
 
     # get_build_scm
     async def get_build_scm_handler(args: dict[str, Any]) -> dict[str, Any]:
-        correlation_id = str(uuid.uuid4())
-        start_time = time.time()
+        correlation_id = new_correlation_id()
+        start_time = now_ms()
 
         with RequestLogger(logger, "get_build_scm", correlation_id):
             job_name = args["name"]
             number_or_last = args.get("number", "last")
 
-            # Get build number
-            if number_or_last == "last":
-                job_info = jenkins_adapter.get_job_info(job_name)
-                last_build = job_info.get("lastBuild")
-                if not last_build:
-                    raise InvalidParamsError(f"Job '{job_name}' has no builds")
-                build_number = last_build["number"]
-            else:
-                build_number = int(number_or_last)
+            # Resolve the build number through the shared cached helper
+            # so chained tool calls on one job share a single lookup
+            build_number = await asyncio.to_thread(
+                resolve_build_number, jenkins_adapter, config, job_name, number_or_last
+            )
 
-            build_info = jenkins_adapter.get_build_info(job_name, build_number)
+            build_info = await asyncio.to_thread(
+                jenkins_adapter.get_build_info, job_name, build_number
+            )
 
-            # Extract SCM actions
+            # Extract SCM actions, projected down to the fields we emit
             scm_actions = [
-                action
-                for action in build_info.get("actions", [])
-                if action.get("_class", "").endswith("GitSCM")
-                or action.get("_class", "").endswith("SubversionSCM")
-                or "lastBuiltRevision" in action
+                {k: action[k] for k in _SCM_FIELDS if k in action}
+                for action in build_info.get("actions", ())
+                if action.get("_class", "").endswith(_SCM_SUFFIXES) or "lastBuiltRevision" in action
             ]
 
             result = {"build_number": build_number, "job_name": job_name, "scm_info": scm_actions}
 
-            took_ms = int((time.time() - start_time) * 1000)
+            took_ms = now_ms() - start_time
             return TokenAwareFormatter.add_metadata(
                 result, correlation_id, took_ms, OutputFormat.SUMMARY
             )
@@ -105,14 +104,8 @@ def register_scm_tools(mcp_server, jenkins_adapter, config):
             name="get_build_scm",
             description="Get SCM information (git commit, branch, etc.) for a build",
             parameters=[
-                ToolParameter("name", ToolParameterType.STRING, "Full job name", required=True),
-                ToolParameter(
-                    "number",
-                    ToolParameterType.STRING,
-                    "Build number or 'last'",
-                    required=False,
-                    default="last",
-                ),
+                PARAM_JOB_NAME,
+                PARAM_NUMBER_OR_LAST,
             ],
             handler=get_build_scm_handler,
         )
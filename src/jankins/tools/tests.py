@@ -1,18 +1,29 @@
 """Test result analysis tools."""
 
+import asyncio
 import logging
-import time
-import uuid
+from itertools import islice
 from typing import Any
 
-from ..errors import InvalidParamsError
-from ..formatters import OutputFormat, TokenAwareFormatter
+from ..formatters import OutputFormat, TokenAwareFormatter, parse_output_format
 from ..jenkins.testresults import TestResultParser
-from ..logging_utils import RequestLogger
+from ..logging_utils import RequestLogger, new_correlation_id, now_ms
 from ..mcp.protocol import Tool, ToolParameter, ToolParameterType
+from ._common import (
+    PARAM_FORMAT_DIFF,
+    PARAM_FORMAT_SUMMARY_FULL,
+    PARAM_JOB_NAME,
+    PARAM_NUMBER_OR_LAST,
+    parse_build_args,
+    resolve_build_number,
+)
 
 logger = logging.getLogger(__name__)
 
+# Cap on per-suite detail in one response; CTS-style reports can hold
+# thousands of suites
+_MAX_SUITES = 500
+
 
 def register_test_tools(mcp_server, jenkins_adapter, config):
     """Register test result analysis tools."""
@@ -21,31 +32,30 @@ def register_test_tools(mcp_server, jenkins_adapter, config):
 
     # get_test_report
     async def get_test_report_handler(args: dict[str, Any]) -> dict[str, Any]:
-        correlation_id = str(uuid.uuid4())
-        start_time = time.time()
+        correlation_id = new_correlation_id()
+        start_time = now_ms()
 
         with RequestLogger(logger, "get_test_report", correlation_id):
-            job_name = args["name"]
-            number_or_last = args.get("number", "last")
+            params = parse_build_args(args)
+            job_name = params.name
+            output_format = params.format
             detailed = args.get("detailed", False)
-            format_str = args.get("format", "summary")
-            output_format = OutputFormat(format_str)
-
-            # Get build number
-            if number_or_last == "last":
-                job_info = jenkins_adapter.get_job_info(job_name)
-                last_build = job_info.get("lastBuild")
-                if not last_build:
-                    raise InvalidParamsError(f"Job '{job_name}' has no builds")
-                build_number = last_build["number"]
-            else:
-                build_number = int(number_or_last)
+
+            # Resolve the build number through the shared cached helper
+            # so chained tool calls on one job share a single lookup
+            build_number = await asyncio.to_thread(
+                resolve_build_number, jenkins_adapter, config, job_name, params.number
+            )
 
             # Get test report
             if detailed:
-                report = test_parser.get_detailed_test_report(job_name, build_number)
+                report = await asyncio.to_thread(
+                    test_parser.get_detailed_test_report, job_name, build_number
+                )
             else:
-                report = test_parser.get_test_report(job_name, build_number)
+                report = await asyncio.to_thread(
+                    test_parser.get_test_report, job_name, build_number
+                )
 
             if not report:
                 result = {
@@ -68,7 +78,10 @@ def register_test_tools(mcp_server, jenkins_adapter, config):
                     "duration": round(report.duration, 2),
                 }
 
-                # Include detailed suites only in full format
+                # Include detailed suites only in full format, bounded
+                # so a massive report can't balloon the response; the
+                # MCP framing is a single JSON document, so the bound
+                # stands in for streaming
                 if output_format == OutputFormat.FULL and detailed and report.suites:
                     result["suites"] = [
                         {
@@ -79,10 +92,13 @@ def register_test_tools(mcp_server, jenkins_adapter, config):
                             "skipped": suite.skipped,
                             "duration": round(suite.duration, 2),
                         }
-                        for suite in report.suites
+                        for suite in islice(report.suites, _MAX_SUITES)
                     ]
+                    result["suites_count"] = len(report.suites)
+                    if len(report.suites) > _MAX_SUITES:
+                        result["suites_truncated"] = True
 
-            took_ms = int((time.time() - start_time) * 1000)
+            took_ms = now_ms() - start_time
             return TokenAwareFormatter.add_metadata(result, correlation_id, took_ms, output_format)
 
     mcp_server.register_tool(
@@ -90,14 +106,8 @@ def register_test_tools(mcp_server, jenkins_adapter, config):
             name="get_test_report",
             description="Get test results summary from a build (JUnit, pytest, etc.)",
             parameters=[
-                ToolParameter("name", ToolParameterType.STRING, "Full job name", required=True),
-                ToolParameter(
-                    "number",
-                    ToolParameterType.STRING,
-                    "Build number or 'last'",
-                    required=False,
-                    default="last",
-                ),
+                PARAM_JOB_NAME,
+                PARAM_NUMBER_OR_LAST,
                 ToolParameter(
                     "detailed",
                     ToolParameterType.BOOLEAN,
@@ -105,14 +115,7 @@ def register_test_tools(mcp_server, jenkins_adapter, config):
                     required=False,
                     default=False,
                 ),
-                ToolParameter(
-                    "format",
-                    ToolParameterType.STRING,
-                    "Output format",
-                    required=False,
-                    default="summary",
-                    enum=["summary", "full"],
-                ),
+                PARAM_FORMAT_SUMMARY_FULL,
             ],
             handler=get_test_report_handler,
         )
@@ -120,58 +123,39 @@ def register_test_tools(mcp_server, jenkins_adapter, config):
 
     # get_failed_tests
     async def get_failed_tests_handler(args: dict[str, Any]) -> dict[str, Any]:
-        correlation_id = str(uuid.uuid4())
-        start_time = time.time()
+        correlation_id = new_correlation_id()
+        start_time = now_ms()
 
         with RequestLogger(logger, "get_failed_tests", correlation_id):
-            job_name = args["name"]
-            number_or_last = args.get("number", "last")
+            params = parse_build_args(args)
+            job_name = params.name
+            output_format = params.format
             limit = args.get("limit", 10)
-            format_str = args.get("format", "summary")
-            output_format = OutputFormat(format_str)
-
-            # Get build number
-            if number_or_last == "last":
-                job_info = jenkins_adapter.get_job_info(job_name)
-                last_build = job_info.get("lastBuild")
-                if not last_build:
-                    raise InvalidParamsError(f"Job '{job_name}' has no builds")
-                build_number = last_build["number"]
-            else:
-                build_number = int(number_or_last)
 
-            # Get failed tests
-            failed_tests = test_parser.get_failed_tests(job_name, build_number, limit)
+            # Resolve the build number through the shared cached helper
+            # so chained tool calls on one job share a single lookup
+            build_number = await asyncio.to_thread(
+                resolve_build_number, jenkins_adapter, config, job_name, params.number
+            )
+
+            # Get failed tests, projected to response dicts in the parser
+            # so the handler doesn't re-walk the list
+            failed_tests = await asyncio.to_thread(
+                test_parser.get_failed_tests_projected,
+                job_name,
+                build_number,
+                limit,
+                output_format == OutputFormat.FULL,
+            )
 
             result = {
                 "build_number": build_number,
                 "job_name": job_name,
                 "failed_count": len(failed_tests),
-                "failed_tests": [],
+                "failed_tests": failed_tests,
             }
 
-            for test in failed_tests:
-                test_info = {
-                    "name": test.name,
-                    "class": test.class_name,
-                    "duration": round(test.duration, 2),
-                    "status": test.status,
-                }
-
-                # Include error details in full format
-                if output_format == OutputFormat.FULL:
-                    if test.error_message:
-                        test_info["error_message"] = test.error_message
-                    if test.error_stacktrace and len(test.error_stacktrace) < 2000:
-                        test_info["stacktrace"] = test.error_stacktrace
-                else:
-                    # In summary mode, include truncated error message
-                    if test.error_message:
-                        test_info["error"] = test.error_message[:200]
-
-                result["failed_tests"].append(test_info)
-
-            took_ms = int((time.time() - start_time) * 1000)
+            took_ms = now_ms() - start_time
             return TokenAwareFormatter.add_metadata(result, correlation_id, took_ms, output_format)
 
     mcp_server.register_tool(
@@ -179,14 +163,8 @@ def register_test_tools(mcp_server, jenkins_adapter, config):
             name="get_failed_tests",
             description="Get list of failed tests from a build with error details",
             parameters=[
-                ToolParameter("name", ToolParameterType.STRING, "Full job name", required=True),
-                ToolParameter(
-                    "number",
-                    ToolParameterType.STRING,
-                    "Build number or 'last'",
-                    required=False,
-                    default="last",
-                ),
+                PARAM_JOB_NAME,
+                PARAM_NUMBER_OR_LAST,
                 ToolParameter(
                     "limit",
                     ToolParameterType.NUMBER,
@@ -194,14 +172,7 @@ def register_test_tools(mcp_server, jenkins_adapter, config):
                     required=False,
                     default=10,
                 ),
-                ToolParameter(
-                    "format",
-                    ToolParameterType.STRING,
-                    "Output format",
-                    required=False,
-                    default="summary",
-                    enum=["summary", "full"],
-                ),
+                PARAM_FORMAT_SUMMARY_FULL,
             ],
             handler=get_failed_tests_handler,
         )
@@ -209,21 +180,20 @@ def register_test_tools(mcp_server, jenkins_adapter, config):
 
     # compare_test_results
     async def compare_test_results_handler(args: dict[str, Any]) -> dict[str, Any]:
-        correlation_id = str(uuid.uuid4())
-        start_time = time.time()
+        correlation_id = new_correlation_id()
+        start_time = now_ms()
 
         with RequestLogger(logger, "compare_test_results", correlation_id):
             job_name = args["name"]
             base = int(args["base"])
             head = int(args["head"])
-            format_str = args.get("format", "diff")
-            output_format = OutputFormat(format_str)
+            output_format = parse_output_format(args.get("format", "diff"))
 
-            # Compare test results
-            comparison = test_parser.compare_test_results(job_name, base, head)
+            # Compare test results; the two report fetches overlap
+            comparison = await test_parser.compare_test_results_async(job_name, base, head)
             comparison["job_name"] = job_name
 
-            took_ms = int((time.time() - start_time) * 1000)
+            took_ms = now_ms() - start_time
             return TokenAwareFormatter.add_metadata(
                 comparison, correlation_id, took_ms, output_format
             )
@@ -233,19 +203,12 @@ def register_test_tools(mcp_server, jenkins_adapter, config):
             name="compare_test_results",
             description="Compare test results between two builds to identify new failures and regressions",
             parameters=[
-                ToolParameter("name", ToolParameterType.STRING, "Full job name", required=True),
+                PARAM_JOB_NAME,
                 ToolParameter("base", ToolParameterType.STRING, "Base build number", required=True),
                 ToolParameter(
                     "head", ToolParameterType.STRING, "Head build number to compare", required=True
                 ),
-                ToolParameter(
-                    "format",
-                    ToolParameterType.STRING,
-                    "Output format",
-                    required=False,
-                    default="diff",
-                    enum=["summary", "full", "diff"],
-                ),
+                PARAM_FORMAT_DIFF,
             ],
             handler=compare_test_results_handler,
         )
@@ -253,25 +216,30 @@ def register_test_tools(mcp_server, jenkins_adapter, config):
 
     # detect_flaky_tests
     async def detect_flaky_tests_handler(args: dict[str, Any]) -> dict[str, Any]:
-        correlation_id = str(uuid.uuid4())
-        start_time = time.time()
+        correlation_id = new_correlation_id()
+        start_time = now_ms()
 
         with RequestLogger(logger, "detect_flaky_tests", correlation_id):
             job_name = args["name"]
             build_count = args.get("build_count", 10)
-            format_str = args.get("format", "summary")
-            output_format = OutputFormat(format_str)
+            output_format = parse_output_format(args.get("format", "summary"))
 
-            # Get last N builds
-            job_info = jenkins_adapter.get_job_info(job_name)
-            builds = job_info.get("builds", [])[:build_count]
-            build_numbers = [b["number"] for b in builds]
+            # Get last N builds; islice projects the numbers in one
+            # pass without materializing an intermediate slice
+            job_info = await asyncio.to_thread(jenkins_adapter.get_job_info, job_name)
+            build_numbers = [b["number"] for b in islice(job_info.get("builds") or (), build_count)]
 
             if not build_numbers:
                 result = {"job_name": job_name, "builds_analyzed": 0, "flaky_tests": []}
             else:
-                # Detect flaky tests
-                flaky_tests = test_parser.get_flaky_tests(job_name, build_numbers)
+                # Detect flaky tests; per-build report fetches run
+                # concurrently under the parser's bound. Per-build
+                # statuses are only emitted in full format
+                flaky_tests = await test_parser.get_flaky_tests_async(
+                    job_name,
+                    build_numbers,
+                    include_statuses=output_format == OutputFormat.FULL,
+                )
 
                 result = {
                     "job_name": job_name,
@@ -281,12 +249,7 @@ def register_test_tools(mcp_server, jenkins_adapter, config):
                     "flaky_tests": flaky_tests[:20],  # Top 20
                 }
 
-                # In summary mode, exclude detailed statuses
-                if output_format == OutputFormat.SUMMARY:
-                    for test in result["flaky_tests"]:
-                        test.pop("statuses", None)
-
-            took_ms = int((time.time() - start_time) * 1000)
+            took_ms = now_ms() - start_time
             return TokenAwareFormatter.add_metadata(result, correlation_id, took_ms, output_format)
 
     mcp_server.register_tool(
@@ -294,7 +257,7 @@ def register_test_tools(mcp_server, jenkins_adapter, config):
             name="detect_flaky_tests",
             description="Identify flaky tests (inconsistent pass/fail) across recent builds",
             parameters=[
-                ToolParameter("name", ToolParameterType.STRING, "Full job name", required=True),
+                PARAM_JOB_NAME,
                 ToolParameter(
                     "build_count",
                     ToolParameterType.NUMBER,
@@ -302,14 +265,7 @@ def register_test_tools(mcp_server, jenkins_adapter, config):
                     required=False,
                     default=10,
                 ),
-                ToolParameter(
-                    "format",
-                    ToolParameterType.STRING,
-                    "Output format",
-                    required=False,
-                    default="summary",
-                    enum=["summary", "full"],
-                ),
+                PARAM_FORMAT_SUMMARY_FULL,
             ],
             handler=detect_flaky_tests_handler,
         )
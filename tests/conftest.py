@@ -1,7 +1,7 @@
 """Pytest fixtures for jankins tests."""
 
 from typing import Any
-from unittest.mock import AsyncMock, MagicMock, Mock
+from unittest.mock import Mock
 
 import pytest
 
@@ -12,6 +12,69 @@ from jankins.mcp import MCPServer
 from jankins.metrics import MetricsCollector
 
 
+class FakeJenkinsClient:
+    """Hand-rolled Jenkins client stub with canned responses.
+
+    Plain method calls are much cheaper than MagicMock's instrumented
+    __call__, so per-test fixture setup stays fast. ``get_json`` remains
+    a Mock because tests configure its return value per-case.
+    """
+
+    def __init__(self):
+        self.get_json = Mock()
+
+    def get_job_info(self, name: str) -> dict[str, Any]:
+        return {
+            "name": "test-job",
+            "url": "http://localhost:8080/job/test-job/",
+            "buildable": True,
+            "lastBuild": {"number": 42},
+            "lastSuccessfulBuild": {"number": 41},
+            "lastFailedBuild": {"number": 40},
+        }
+
+    def get_build_info(self, name: str, number: int) -> dict[str, Any]:
+        return {
+            "number": 42,
+            "result": "SUCCESS",
+            "duration": 120000,
+            "timestamp": 1704067200000,
+            "url": "http://localhost:8080/job/test-job/42/",
+        }
+
+    def get_build_console_output(self, name: str, number: int) -> str:
+        return "Build log output\nSUCCESS"
+
+    def get_whoami(self) -> dict[str, Any]:
+        return {
+            "name": "test_user",
+            "fullName": "Test User",
+        }
+
+
+class FakeHttpxResponse:
+    """Minimal stand-in for an httpx.Response."""
+
+    status_code = 200
+    text = "OK"
+
+    def json(self) -> dict[str, Any]:
+        return {"status": "ok"}
+
+
+class FakeHttpxAsyncClient:
+    """Minimal stand-in for an httpx.AsyncClient."""
+
+    def __init__(self):
+        self.response = FakeHttpxResponse()
+
+    async def get(self, *args: Any, **kwargs: Any) -> FakeHttpxResponse:
+        return self.response
+
+    async def post(self, *args: Any, **kwargs: Any) -> FakeHttpxResponse:
+        return self.response
+
+
 @pytest.fixture
 def test_config():
     """Create test configuration."""
@@ -53,38 +116,8 @@ def mcp_server():
 
 @pytest.fixture
 def mock_jenkins_client():
-    """Create mock Jenkins client with common responses."""
-    client = MagicMock()
-
-    # Mock job info
-    client.get_job_info.return_value = {
-        "name": "test-job",
-        "url": "http://localhost:8080/job/test-job/",
-        "buildable": True,
-        "lastBuild": {"number": 42},
-        "lastSuccessfulBuild": {"number": 41},
-        "lastFailedBuild": {"number": 40},
-    }
-
-    # Mock build info
-    client.get_build_info.return_value = {
-        "number": 42,
-        "result": "SUCCESS",
-        "duration": 120000,
-        "timestamp": 1704067200000,
-        "url": "http://localhost:8080/job/test-job/42/",
-    }
-
-    # Mock log
-    client.get_build_console_output.return_value = "Build log output\nSUCCESS"
-
-    # Mock whoami
-    client.get_whoami.return_value = {
-        "name": "test_user",
-        "fullName": "Test User",
-    }
-
-    return client
+    """Create stub Jenkins client with common responses."""
+    return FakeJenkinsClient()
 
 
 @pytest.fixture
@@ -175,15 +208,8 @@ def metrics_collector():
 
 @pytest.fixture
 def mock_httpx_client():
-    """Create mock httpx client."""
-    client = AsyncMock()
-    response = AsyncMock()
-    response.status_code = 200
-    response.json.return_value = {"status": "ok"}
-    response.text = "OK"
-    client.get.return_value = response
-    client.post.return_value = response
-    return client
+    """Create stub httpx client."""
+    return FakeHttpxAsyncClient()
 
 
 @pytest.fixture
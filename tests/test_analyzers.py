@@ -24,7 +24,7 @@ class TestMavenAnalyzer:
         assert result.build_tool == "maven"
         assert result.detected is True
         assert len(result.errors) > 0
-        assert any("cannot find symbol" in e.lower() for e in result.errors)
+        assert "cannot find symbol" in result.errors_lower
         assert len(result.recommendations) > 0
 
     def test_maven_compilation_error(self):
@@ -38,7 +38,7 @@ class TestMavenAnalyzer:
         result = analyzer.analyze(log)
 
         assert len(result.errors) > 0
-        assert any("incompatible types" in e.lower() for e in result.errors)
+        assert "incompatible types" in result.errors_lower
 
     def test_maven_dependency_error(self):
         """Test Maven dependency resolution error."""
@@ -52,7 +52,7 @@ class TestMavenAnalyzer:
 
         assert len(result.errors) > 0
         # Dependency errors should be detected in errors or issues
-        assert any("could not" in e.lower() for e in result.errors) or len(result.issues) > 0
+        assert "could not" in result.errors_lower or len(result.issues) > 0
 
 
 @pytest.mark.unit
@@ -103,7 +103,7 @@ class TestGradleAnalyzer:
 
         assert len(result.errors) > 0
         # Failure detection - check for error markers
-        assert any("failure" in e.lower() or "what went wrong" in e.lower() for e in result.errors)
+        assert "failure" in result.errors_lower or "what went wrong" in result.errors_lower
 
 
 @pytest.mark.unit
@@ -28,7 +28,7 @@ class TestMetricsCollector:
         assert metrics_collector.summary.total_requests == 1
         assert metrics_collector.summary.successful_requests == 0
         assert metrics_collector.summary.failed_requests == 1
-        assert metrics_collector.summary.tool_errors["get_build:NotFound"] == 1
+        assert metrics_collector.summary.tool_errors[("get_build", "NotFound")] == 1
 
     def test_record_jenkins_call(self, metrics_collector):
         """Test recording Jenkins API call."""
@@ -1,99 +1,172 @@
 """Tests for test result parsing."""
 
+import random
+from dataclasses import replace
+
 import pytest
 
-from jankins.jenkins.testresults import TestCase as _TestCase
-from jankins.jenkins.testresults import TestReport as _TestReport
-from jankins.jenkins.testresults import TestSuite as _TestSuite
+# One import statement; the underscore aliases stay because pytest
+# would otherwise try to collect the Test*-named classes as test
+# classes during collection
+from jankins.jenkins.testresults import (
+    TestCase as _TestCase,
+    TestReport as _TestReport,
+    TestResultParser as _TestResultParser,
+    TestSuite as _TestSuite,
+)
 
+pytestmark = pytest.mark.unit
 
-@pytest.mark.unit
-class TestTestResultParser:
-    """Test test result data classes."""
+# Reports are frozen dataclasses, so one instance per module is safe to
+# share across tests instead of rebuilding identical ones per test
 
-    def test_test_report_creation(self):
-        """Test creating test report."""
-        report = _TestReport(
-            total_tests=100, passed=98, failed=2, skipped=0, errors=0, duration=15.5, suites=[]
-        )
+# Canonical passed case built once; tests derive variants with
+# dataclasses.replace instead of re-spelling every field
+_PASSED_PROTO = _TestCase(
+    name="test_success",
+    class_name="test.TestClass",
+    status="PASSED",
+    duration=0.1,
+)
 
-        assert report.total_tests == 100
-        assert report.passed == 98
-        assert report.failed == 2
-        assert report.skipped == 0
 
-    def test_test_suite_creation(self):
-        """Test creating test suite."""
-        suite = _TestSuite(
-            name="TestSuite1",
-            tests=2,
-            failures=1,
-            errors=0,
-            skipped=0,
-            duration=0.3,
-            test_cases=[],
-        )
+@pytest.fixture(scope="module")
+def base_report():
+    return _TestReport(
+        total_tests=100, passed=98, failed=2, skipped=0, errors=0, duration=15.5, suites=[]
+    )
 
-        assert suite.name == "TestSuite1"
-        assert suite.tests == 2
-        assert suite.failures == 1
-
-    def test_test_case_creation(self):
-        """Test creating test cases."""
-        passed_test = _TestCase(
-            name="test_success",
-            class_name="test.TestClass",
-            status="PASSED",
-            duration=0.1,
-        )
 
-        assert passed_test.name == "test_success"
-        assert passed_test.status == "PASSED"
-        assert passed_test.duration == 0.1
+@pytest.fixture(scope="module")
+def perfect_report():
+    return _TestReport(
+        total_tests=100, passed=100, failed=0, skipped=0, errors=0, duration=15.5, suites=[]
+    )
 
-        failed_test = _TestCase(
-            name="test_failure",
-            class_name="test.TestClass",
-            status="FAILED",
-            duration=0.2,
-            error_message="AssertionError: Expected 1, got 2",
-        )
 
-        assert failed_test.name == "test_failure"
-        assert failed_test.status == "FAILED"
-        assert failed_test.error_message == "AssertionError: Expected 1, got 2"
+@pytest.fixture(scope="module")
+def empty_report():
+    return _TestReport(
+        total_tests=0, passed=0, failed=0, skipped=0, errors=0, duration=0, suites=[]
+    )
+
+
+class TestTestResultParser:
+    """Test test result data classes."""
 
-    def test_pass_rate_calculation(self):
+    @pytest.mark.parametrize(
+        "cls,kwargs,checks",
+        [
+            (
+                _TestReport,
+                dict(
+                    total_tests=100,
+                    passed=98,
+                    failed=2,
+                    skipped=0,
+                    errors=0,
+                    duration=15.5,
+                    suites=[],
+                ),
+                [("total_tests", 100), ("passed", 98), ("failed", 2), ("skipped", 0)],
+            ),
+            (
+                _TestSuite,
+                dict(
+                    name="TestSuite1",
+                    tests=2,
+                    failures=1,
+                    errors=0,
+                    skipped=0,
+                    duration=0.3,
+                    test_cases=[],
+                ),
+                [("name", "TestSuite1"), ("tests", 2), ("failures", 1)],
+            ),
+            (
+                _TestCase,
+                dict(
+                    name="test_success", class_name="test.TestClass", status="PASSED", duration=0.1
+                ),
+                [("name", "test_success"), ("status", "PASSED"), ("duration", 0.1)],
+            ),
+            (
+                _TestCase,
+                dict(
+                    name="test_failure",
+                    class_name="test.TestClass",
+                    status="FAILED",
+                    duration=0.2,
+                    error_message="AssertionError: Expected 1, got 2",
+                ),
+                [
+                    ("name", "test_failure"),
+                    ("status", "FAILED"),
+                    ("error_message", "AssertionError: Expected 1, got 2"),
+                ],
+            ),
+        ],
+        ids=["report", "suite", "case", "failed_case"],
+    )
+    def test_dataclass_construction(self, cls, kwargs, checks):
+        """Test constructing the result dataclasses."""
+        obj = cls(**kwargs)
+        for attr, expected in checks:
+            assert getattr(obj, attr) == expected
+
+    def test_test_case_is_slotted(self):
+        """Test that TestCase stays slotted.
+
+        Reports carry thousands of cases, so the compact slotted layout
+        is load-bearing; this pins it against a regression to __dict__.
+        """
+        assert not hasattr(_PASSED_PROTO, "__dict__")
+
+    def test_pass_rate_calculation(self, base_report):
         """Test pass rate calculation."""
-        report = _TestReport(
-            total_tests=100, passed=98, failed=2, skipped=0, errors=0, duration=15.5, suites=[]
-        )
+        assert base_report.pass_rate == 98.0
+
+    def test_pass_rate_over_many_reports(self):
+        """Test pass rate aggregation over a large batch of reports.
+
+        Production workloads compute pass rates across thousands of
+        historical runs; this pins the aggregate against an
+        independently computed expectation at that scale.
+        """
+        rng = random.Random(42)
+        passed_counts = [rng.randint(0, 100) for _ in range(10_000)]
+        reports = [
+            _TestReport(
+                total_tests=100,
+                passed=p,
+                failed=100 - p,
+                skipped=0,
+                errors=0,
+                duration=0.0,
+                suites=[],
+            )
+            for p in passed_counts
+        ]
 
-        assert report.pass_rate == 98.0
+        # With total_tests fixed at 100, each pass_rate equals its
+        # passed count, so the aggregate reduces to a plain sum
+        assert sum(r.pass_rate for r in reports) == pytest.approx(sum(passed_counts))
 
-    def test_empty_test_report(self):
+    def test_empty_test_report(self, empty_report):
         """Test empty test report."""
-        empty_report = _TestReport(
-            total_tests=0, passed=0, failed=0, skipped=0, errors=0, duration=0, suites=[]
-        )
         assert empty_report.total_tests == 0
         assert empty_report.pass_rate == 0.0
 
     def test_get_failed_tests(self):
         """Test extracting failed tests."""
-        failed_case = _TestCase(
+        passed_case = _PASSED_PROTO
+        failed_case = replace(
+            _PASSED_PROTO,
             name="test_failure",
-            class_name="test.TestClass",
             status="FAILED",
             duration=0.2,
             error_message="AssertionError",
         )
-        passed_case = _TestCase(
-            name="test_success",
-            class_name="test.TestClass",
-            status="PASSED",
-            duration=0.1,
-        )
 
         suite = _TestSuite(
             name="TestSuite1",
@@ -109,29 +182,54 @@ class TestTestResultParser:
             total_tests=2, passed=1, failed=1, skipped=0, errors=0, duration=0.3, suites=[suite]
         )
 
-        failed_tests = [
-            case for suite in report.suites for case in suite.test_cases if case.status == "FAILED"
-        ]
-
-        assert len(failed_tests) == 1
-        assert failed_tests[0].name == "test_failure"
+        # Lazy scan: stops after proving there is exactly one failure
+        # instead of materializing the full list
+        cases = (c for s in report.suites for c in s.test_cases if c.status == "FAILED")
+        first = next(cases)
+        assert first.name == "test_failure"
+        assert next(cases, None) is None
 
-    def test_compare_test_reports(self):
+    def test_compare_test_reports(self, base_report, perfect_report):
         """Test comparing two test reports."""
-        report1 = _TestReport(
-            total_tests=100, passed=98, failed=2, skipped=0, errors=0, duration=15.5, suites=[]
-        )
-
-        report2 = _TestReport(
-            total_tests=100, passed=100, failed=0, skipped=0, errors=0, duration=15.5, suites=[]
-        )
-
-        # Compare
-        assert report1.failed > report2.failed
-        assert report2.pass_rate > report1.pass_rate
+        assert base_report.failed > perfect_report.failed
+        assert perfect_report.pass_rate > base_report.pass_rate
 
     def test_flaky_test_detection(self):
-        """Test flaky test detection placeholder."""
-        # This would test the detect_flaky_tests logic
-        # For now, basic structure test - placeholder for future implementation
-        pass
+        """Test flaky test detection across a pass-fail-pass history."""
+
+        def build_report(flaky_status: str) -> _TestReport:
+            suite = _TestSuite(
+                name="TestSuite1",
+                tests=2,
+                failures=1 if flaky_status == "FAILED" else 0,
+                errors=0,
+                skipped=0,
+                duration=0.3,
+                test_cases=[
+                    replace(_PASSED_PROTO, name="test_flaky", status=flaky_status),
+                    replace(_PASSED_PROTO, name="test_stable"),
+                ],
+            )
+            return _TestReport(
+                total_tests=2,
+                passed=suite.tests - suite.failures,
+                failed=suite.failures,
+                skipped=0,
+                errors=0,
+                duration=0.3,
+                suites=[suite],
+            )
+
+        reports = [build_report(s) for s in ("PASSED", "FAILED", "PASSED", "FAILED")]
+        flaky = _TestResultParser._find_flaky(reports)
+
+        # Only the flipping test is reported; the stable one stays out
+        assert len(flaky) == 1
+        assert flaky[0]["test"] == "test.TestClass.test_flaky"
+        assert flaky[0]["failure_count"] == 2
+        assert flaky[0]["total_runs"] == 4
+        assert flaky[0]["failure_rate"] == 50.0
+        # Status lists are only carried when explicitly requested
+        assert "statuses" not in flaky[0]
+        with_statuses = _TestResultParser._find_flaky(reports, include_statuses=True)
+        assert with_statuses[0]["statuses"] == ["PASSED", "FAILED", "PASSED", "FAILED"]